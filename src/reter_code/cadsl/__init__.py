@@ -65,6 +65,9 @@ from .compiler import (
     # Classes
     ExpressionCompiler,
     ConditionCompiler,
+    ArrowConditionCompiler,
+    ArrowExpressionCompiler,
+    ArrowObjectExprCompiler,
     ObjectExprCompiler,
     # Functions
     compile_expression,
@@ -157,6 +160,9 @@ __all__ = [
     # Compiler
     "ExpressionCompiler",
     "ConditionCompiler",
+    "ArrowConditionCompiler",
+    "ArrowExpressionCompiler",
+    "ArrowObjectExprCompiler",
     "ObjectExprCompiler",
     "compile_expression",
     "compile_condition",
@@ -15,6 +15,10 @@ from lark import Tree, Token
 from .utils import unquote, extract_value, token_to_value  # noqa: F401 - re-exported
 
 
+# {name} placeholders in string values and templates
+_PLACEHOLDER_PATTERN = re.compile(r'\{(\w+)\}')
+
+
 # ============================================================
 # BUILT-IN FUNCTIONS
 # ============================================================
@@ -140,8 +144,7 @@ class ExpressionCompiler:
         value = unquote(str(node.children[0]))
         # Check if string contains parameter placeholders like {param}
         if '{' in value and '}' in value:
-            import re
-            placeholders = re.findall(r'\{(\w+)\}', value)
+            placeholders = _PLACEHOLDER_PATTERN.findall(value)
             if placeholders:
                 def substitute(r, ctx=None, v=value, phs=placeholders):
                     result = v
@@ -189,20 +192,15 @@ class ExpressionCompiler:
     def _compile_field_ref(self, node: Tree) -> Callable:
         """Compile a field reference.
 
-        Handles REQL ?-prefixed column names: if 'name' not found, try '?name'.
+        REQL ?-prefixed column names are normalized by REQLSource, so a
+        single lookup by plain name is enough.
         """
         field = str(node.children[0])
 
         def get_field(r, ctx=None, f=field):
             if not isinstance(r, dict):
                 return None
-            # Try exact field name first
-            if f in r:
-                return r[f]
-            # Try ?-prefixed version (REQL output)
-            if not f.startswith("?") and f"?{f}" in r:
-                return r[f"?{f}"]
-            return None
+            return r.get(f)
 
         return get_field
 
@@ -591,6 +589,485 @@ class ConditionCompiler:
         return extract_value(node)
 
 
+# ============================================================
+# ARROW CONDITION COMPILER
+# ============================================================
+
+class _NotVectorizable(Exception):
+    """Raised when a condition has no Arrow compute equivalent."""
+
+
+class ArrowConditionCompiler:
+    """
+    Compiles CADSL filter conditions to Arrow compute expressions.
+
+    The result is evaluated by Arrow's C++ kernels over whole columns
+    (``table.filter(expr)``) instead of calling the predicate closure on
+    every row. Only conditions with exactly the same semantics as
+    ConditionCompiler are compiled; anything else (function calls on
+    fields, arithmetic, mismatched types) yields None and the caller
+    keeps the row-by-row predicate.
+
+    Sub-conditions that reference no fields (e.g. ``{target} == ""`` or
+    ``is_empty({classes})``) are folded to constants using the params
+    bound at pipeline build time.
+
+    ::: This is-in-layer Domain-Specific-Language-Layer.
+    ::: This is a compiler.
+    """
+
+    _COMPARATORS = {
+        "op_gt": operator.gt,
+        "op_lt": operator.lt,
+        "op_gte": operator.ge,
+        "op_lte": operator.le,
+        "op_eq": operator.eq,
+        "op_ne": operator.ne,
+    }
+    _MIRRORED = {
+        "op_gt": "op_lt",
+        "op_lt": "op_gt",
+        "op_gte": "op_lte",
+        "op_lte": "op_gte",
+        "op_eq": "op_eq",
+        "op_ne": "op_ne",
+    }
+
+    def __init__(self, schema, ctx: Optional[Any] = None):
+        """
+        Args:
+            schema: pyarrow.Schema of the table the expression will filter
+            ctx: Pipeline context used to fold parameter references
+        """
+        self.schema = schema
+        self.ctx = ctx
+        self.condition_compiler = ConditionCompiler()
+
+    def compile(self, node: Tree):
+        """
+        Compile a condition node to a pyarrow.compute.Expression.
+
+        Returns:
+            Expression, or None if the condition cannot be vectorized
+        """
+        try:
+            return self._compile(node)
+        except _NotVectorizable:
+            return None
+
+    def _compile(self, node: Tree):
+        import pyarrow.compute as pc
+
+        if not isinstance(node, Tree):
+            raise _NotVectorizable()
+
+        if not self._references_fields(node):
+            value = self.condition_compiler.compile(node)({}, self.ctx)
+            return pc.scalar(bool(value))
+
+        method = getattr(self, f"_compile_{node.data}", None)
+        if method is None:
+            raise _NotVectorizable()
+        return method(node)
+
+    @staticmethod
+    def _references_fields(node: Tree) -> bool:
+        return any(t.data == "field_ref" for t in node.iter_subtrees())
+
+    # --------------------------------------------------------
+    # Logical Operators
+    # --------------------------------------------------------
+
+    def _compile_or_expr(self, node: Tree):
+        import pyarrow.compute as pc
+
+        exprs = []
+        # field -> [(child, regex)] for contains/starts_with/ends_with tests
+        literal_tests: Dict[str, List[Tuple[Tree, str]]] = {}
+        for child in node.children:
+            if not isinstance(child, Tree):
+                continue
+            test = self._literal_test(child)
+            if test is None:
+                exprs.append(self._compile(child))
+            else:
+                literal_tests.setdefault(test[0], []).append((child, test[1]))
+
+        # Several literal tests on one column become a single regex
+        # alternation, so the column is scanned once by one RE2 automaton
+        # instead of once per literal.
+        for field, tests in literal_tests.items():
+            if len(tests) == 1:
+                exprs.append(self._compile(tests[0][0]))
+            else:
+                pattern = "|".join(regex for _, regex in tests)
+                exprs.append(pc.coalesce(
+                    pc.match_substring_regex(pc.field(field), pattern=pattern),
+                    pc.scalar(False),
+                ))
+
+        result = exprs[0]
+        for expr in exprs[1:]:
+            result = result | expr
+        return result
+
+    _LITERAL_TESTS = {
+        "contains_str": "{}",
+        "starts_with": "^{}",
+        "ends_with": "{}$",
+    }
+
+    def _literal_test(self, node: Tree) -> Optional[Tuple[str, str]]:
+        """Return (field, regex) for a literal string test on a string column."""
+        import pyarrow as pa
+
+        # Unwrap single-operand precedence levels (and_expr, not_cond, ...)
+        while node.data in ("and_expr", "not_cond", "paren_cond") and len(node.children) == 1:
+            node = node.children[0]
+            if not isinstance(node, Tree):
+                return None
+
+        template = self._LITERAL_TESTS.get(node.data)
+        field = self._field_name(node.children[0]) if template else None
+        if field is None or field not in self.schema.names:
+            return None
+        if not pa.types.is_string(self.schema.field(field).type):
+            return None
+        return field, template.format(re.escape(unquote(str(node.children[1]))))
+
+    def _compile_and_expr(self, node: Tree):
+        exprs = [self._compile(c) for c in node.children if isinstance(c, Tree)]
+        result = exprs[0]
+        for expr in exprs[1:]:
+            result = result & expr
+        return result
+
+    def _compile_not_expr(self, node: Tree):
+        return ~self._compile(node.children[0])
+
+    def _compile_not_cond(self, node: Tree):
+        return self._compile(node.children[0])
+
+    def _compile_paren_cond(self, node: Tree):
+        return self._compile(node.children[0])
+
+    def _compile_expr_cond(self, node: Tree):
+        return self._compile(node.children[0])
+
+    def _compile_paren_expr(self, node: Tree):
+        return self._compile(node.children[0])
+
+    # --------------------------------------------------------
+    # Comparisons
+    # --------------------------------------------------------
+
+    def _compile_comparison(self, node: Tree):
+        import pyarrow.compute as pc
+
+        left, op_node, right = node.children
+        op_name = op_node.data if isinstance(op_node, Tree) else str(op_node)
+        if op_name not in self._COMPARATORS:
+            raise _NotVectorizable()
+
+        if self._field_name(left) is None:
+            # Normalize to: field op constant
+            left, right = right, left
+            op_name = self._MIRRORED[op_name]
+
+        field = self._column(left)
+        value = self._constant(right)
+        if value is None:
+            raise _NotVectorizable()
+        self._check_type(field, value)
+
+        expr = self._COMPARATORS[op_name](pc.field(field), value)
+        # Null fields: == and ordering are False, != is True (as in Python)
+        return pc.coalesce(expr, pc.scalar(op_name == "op_ne"))
+
+    # --------------------------------------------------------
+    # String Operators
+    # --------------------------------------------------------
+
+    def _compile_starts_with(self, node: Tree):
+        import pyarrow.compute as pc
+        return self._string_match(node, pc.starts_with)
+
+    def _compile_ends_with(self, node: Tree):
+        import pyarrow.compute as pc
+        return self._string_match(node, pc.ends_with)
+
+    def _compile_contains_str(self, node: Tree):
+        import pyarrow.compute as pc
+        return self._string_match(node, pc.match_substring)
+
+    def _compile_regex_match(self, node: Tree):
+        import pyarrow.compute as pc
+        return self._string_match(node, pc.match_substring_regex)
+
+    def _string_match(self, node: Tree, fn):
+        import pyarrow as pa
+        import pyarrow.compute as pc
+
+        field = self._column(node.children[0])
+        if not pa.types.is_string(self.schema.field(field).type):
+            raise _NotVectorizable()
+        pattern = unquote(str(node.children[1]))
+        return pc.coalesce(fn(pc.field(field), pattern=pattern), pc.scalar(False))
+
+    # --------------------------------------------------------
+    # Membership and Null Checks
+    # --------------------------------------------------------
+
+    def _compile_in_list(self, node: Tree):
+        values = []
+        for child in node.children[1:]:
+            if isinstance(child, Tree) and child.data == "value_list":
+                values.extend(extract_value(item) for item in child.children)
+        return self._membership(node.children[0], values)
+
+    def _compile_in_param(self, node: Tree):
+        param_name = str(node.children[1].children[0])
+        params = getattr(self.ctx, "params", None) or {}
+        values = params.get(param_name, [])
+        if not isinstance(values, (list, tuple, set)):
+            return self._compile_constant(False)
+        return self._membership(node.children[0], list(values))
+
+    def _membership(self, left, values: list):
+        import pyarrow as pa
+        import pyarrow.compute as pc
+
+        field = self._column(left)
+        if not values:
+            return self._compile_constant(False)
+        if any(v is None for v in values):
+            raise _NotVectorizable()
+        for value in values:
+            self._check_type(field, value)
+        value_set = pa.array(values).cast(self.schema.field(field).type)
+        return pc.coalesce(pc.field(field).isin(value_set), pc.scalar(False))
+
+    def _compile_is_null(self, node: Tree):
+        import pyarrow.compute as pc
+        return pc.field(self._column(node.children[0])).is_null()
+
+    def _compile_is_not_null(self, node: Tree):
+        import pyarrow.compute as pc
+        return pc.field(self._column(node.children[0])).is_valid()
+
+    # --------------------------------------------------------
+    # Helpers
+    # --------------------------------------------------------
+
+    @staticmethod
+    def _compile_constant(value: bool):
+        import pyarrow.compute as pc
+        return pc.scalar(value)
+
+    @staticmethod
+    def _field_name(node) -> Optional[str]:
+        if isinstance(node, Tree) and node.data == "field_ref":
+            return str(node.children[0])
+        return None
+
+    def _column(self, node) -> str:
+        field = self._field_name(node)
+        if field is None or field not in self.schema.names:
+            raise _NotVectorizable()
+        return field
+
+    def _constant(self, node) -> Any:
+        if not isinstance(node, Tree) or self._references_fields(node):
+            raise _NotVectorizable()
+        return ExpressionCompiler().compile(node)({}, self.ctx)
+
+    def _check_type(self, field: str, value: Any) -> None:
+        """Only compare values Python and Arrow would treat the same way."""
+        import pyarrow as pa
+
+        column_type = self.schema.field(field).type
+        if isinstance(value, bool):
+            ok = pa.types.is_boolean(column_type)
+        elif isinstance(value, (int, float)):
+            ok = pa.types.is_integer(column_type) or pa.types.is_floating(column_type)
+        elif isinstance(value, str):
+            ok = pa.types.is_string(column_type)
+        else:
+            ok = False
+        if not ok:
+            raise _NotVectorizable()
+
+
+class ArrowExpressionCompiler:
+    """
+    Compiles CADSL value expressions (as used by compute) to column kernels.
+
+    The result is a function ``table -> pyarrow.Array`` that evaluates the
+    expression with Arrow compute over whole columns instead of calling the
+    expression closure once per row. Supported: field references, numeric
+    arithmetic (+, -, *, /), negation, ``field ?? constant`` and field-free
+    subexpressions, which are folded to constants. Arithmetic keeps ExpressionCompiler semantics:
+    null/zero operands read as 0 (1 for divisors) and ``/`` is true division.
+    Anything else, including ``%`` and non-numeric operands, yields None.
+
+    ::: This is-in-layer Domain-Specific-Language-Layer.
+    ::: This is a compiler.
+    """
+
+    _ARITHMETIC = {
+        "op_add": "add_checked",
+        "op_sub": "subtract_checked",
+        "op_mul": "multiply_checked",
+        "op_div": "divide",
+    }
+
+    def __init__(self, schema, ctx: Optional[Any] = None):
+        """
+        Args:
+            schema: pyarrow.Schema of the table the expression will run on
+            ctx: Pipeline context used to fold parameter references
+        """
+        self.schema = schema
+        self.ctx = ctx
+
+    def compile(self, node: Union[Tree, Token]) -> Optional[Callable]:
+        """
+        Compile an expression node to a column kernel.
+
+        Returns:
+            Callable taking a pyarrow.Table and returning an Array,
+            or None if the expression cannot be vectorized
+        """
+        import pyarrow as pa
+
+        if not isinstance(node, Tree):
+            return None
+        try:
+            if not self._references_fields(node):
+                value = self._constant(node)
+                if value is not None and not isinstance(value, (bool, int, float, str)):
+                    return None
+                return lambda table, v=value: pa.array([v] * table.num_rows)
+
+            field = self._field_name(node)
+            if field is not None:
+                column = self._column(node)
+                return lambda table, c=column: table.column(c)
+
+            if node.data == "coalesce":
+                return self._coalesce(node)
+
+            return self._numeric(node)
+        except _NotVectorizable:
+            return None
+
+    # --------------------------------------------------------
+    # Numeric Expressions
+    # --------------------------------------------------------
+
+    def _numeric(self, node):
+        """Compile a numeric operand (the ``x or 0`` of ExpressionCompiler)."""
+        import pyarrow.compute as pc
+
+        if not isinstance(node, Tree):
+            raise _NotVectorizable()
+
+        if not self._references_fields(node):
+            value = self._constant(node)
+            if isinstance(value, bool) or not isinstance(value, (int, float, type(None))):
+                raise _NotVectorizable()
+            return lambda table, v=value or 0: v
+
+        if node.data == "field_ref":
+            column = self._column(node)
+            self._check_numeric(column)
+            return lambda table, c=column: pc.fill_null(table.column(c), 0)
+
+        if node.data in ("paren_expr", "pos_expr"):
+            return self._numeric(node.children[0])
+
+        if node.data == "neg_expr":
+            inner = self._numeric(node.children[0])
+            return lambda table, i=inner: pc.negate_checked(i(table))
+
+        if node.data in ("add_expr", "mul_expr"):
+            result = self._numeric(node.children[0])
+            for i in range(1, len(node.children), 2):
+                op_node = node.children[i]
+                op_name = op_node.data if isinstance(op_node, Tree) else None
+                if op_name not in self._ARITHMETIC:
+                    raise _NotVectorizable()
+                result = self._binary(op_name, result, self._numeric(node.children[i + 1]))
+            return result
+
+        raise _NotVectorizable()
+
+    def _coalesce(self, node: Tree) -> Callable:
+        """Compile ``field ?? constant`` to a null fill."""
+        import pyarrow as pa
+        import pyarrow.compute as pc
+
+        column = self._column(node.children[0])
+        if self._references_fields(node.children[1]):
+            raise _NotVectorizable()
+        default = self._constant(node.children[1])
+        column_type = self.schema.field(column).type
+        if isinstance(default, bool):
+            ok = pa.types.is_boolean(column_type)
+        elif isinstance(default, (int, float)):
+            ok = pa.types.is_integer(column_type) or pa.types.is_floating(column_type)
+            ok = ok and not (pa.types.is_integer(column_type) and isinstance(default, float))
+        elif isinstance(default, str):
+            ok = pa.types.is_string(column_type)
+        else:
+            ok = False
+        if not ok:
+            raise _NotVectorizable()
+        return lambda table, c=column, d=default: pc.fill_null(table.column(c), d)
+
+    def _binary(self, op_name: str, left: Callable, right: Callable) -> Callable:
+        import pyarrow as pa
+        import pyarrow.compute as pc
+
+        fn = getattr(pc, self._ARITHMETIC[op_name])
+        if op_name != "op_div":
+            return lambda table: fn(left(table), right(table))
+
+        def as_float(value):
+            if isinstance(value, (pa.Array, pa.ChunkedArray)):
+                return pc.cast(value, pa.float64())
+            return pa.scalar(float(value), pa.float64())
+
+        def divide(table):
+            divisor = right(table)
+            # Zero divisors read as 1, and int / int is true division
+            if isinstance(divisor, (pa.Array, pa.ChunkedArray)):
+                divisor = pc.if_else(pc.equal(divisor, 0), 1, divisor)
+            else:
+                divisor = divisor or 1
+            return fn(as_float(left(table)), as_float(divisor))
+
+        return divide
+
+    # --------------------------------------------------------
+    # Helpers
+    # --------------------------------------------------------
+
+    _references_fields = staticmethod(ArrowConditionCompiler._references_fields)
+    _field_name = staticmethod(ArrowConditionCompiler._field_name)
+    _column = ArrowConditionCompiler._column
+
+    def _constant(self, node) -> Any:
+        return ExpressionCompiler().compile(node)({}, self.ctx)
+
+    def _check_numeric(self, column: str) -> None:
+        import pyarrow as pa
+
+        column_type = self.schema.field(column).type
+        if not (pa.types.is_integer(column_type) or pa.types.is_floating(column_type)):
+            raise _NotVectorizable()
+
+
 # ============================================================
 # OBJECT EXPRESSION COMPILER
 # ============================================================
@@ -611,12 +1088,15 @@ class ObjectExprCompiler:
     def __init__(self):
         self.expr_compiler = ExpressionCompiler()
 
-    def compile(self, node: Tree) -> Callable[[Dict, Optional[Any]], Dict]:
+    def compile(self, node: Tree, in_place: bool = False) -> Callable[[Dict, Optional[Any]], Dict]:
         """
         Compile an object expression to a transform function.
 
         Args:
             node: Lark tree node for object_expr
+            in_place: For ``{...row, ...}`` expressions, add the fields to the
+                input row instead of copying it. Only for rows the caller
+                owns (e.g. fresh rows built by a preceding select).
 
         Returns:
             Callable that takes (row, ctx) and returns a dict
@@ -627,9 +1107,7 @@ class ObjectExprCompiler:
             if isinstance(child, Tree):
                 if child.data == "obj_field":
                     # name: expr
-                    name = str(child.children[0])
-                    expr = self.expr_compiler.compile(child.children[1])
-                    fields.append(("field", name, expr))
+                    fields.append(self._compile_field(child))
 
                 elif child.data == "spread_row":
                     # ...row
@@ -657,14 +1135,210 @@ class ObjectExprCompiler:
                     if isinstance(value, str) and '{' in value:
                         value = self._interpolate(value, r, ctx)
                     result[name] = value
+                elif kind == "text":
+                    result[name] = expr(r, ctx)
             return result
 
+        if in_place and fields and fields[0][0] == "spread_row" and all(
+            kind in ("field", "text") for kind, _, _ in fields[1:]
+        ):
+            named = fields[1:]
+
+            def update(r, ctx=None, f=named):
+                if not isinstance(r, dict):
+                    return transform(r, ctx)
+                # Evaluate against the unchanged row first, as the copying
+                # form does, then write the fields into it
+                values = []
+                for kind, name, expr in f:
+                    value = expr(r, ctx)
+                    if kind == "field" and isinstance(value, str) and '{' in value:
+                        value = self._interpolate(value, r, ctx)
+                    values.append((name, value))
+                r.update(values)
+                return r
+
+            return update
+
         return transform
 
+    def compile_batch(self, node: Tree, in_place: bool = True) -> Optional[Callable[[List, Optional[Any]], List]]:
+        """
+        Compile a ``{...row, name: expr, ...}`` or ``{name: expr, ...}``
+        expression to a whole-list function.
+
+        Constant fields (literals without placeholders) are evaluated once
+        per call instead of once per row, and "text {field}" templates get
+        their params substituted once per call, leaving a format_map over
+        the row. The rest are evaluated against the unchanged row, as in
+        compile(). The ``...row`` form extends the rows in place, so it has
+        the same ownership rule as ``in_place``: only for rows the caller
+        owns. The named-fields form builds fresh rows and suits any input.
+
+        Args:
+            node: Lark tree node for object_expr
+            in_place: Whether the caller owns the rows; if not, the
+                ``...row`` form has no batch function
+
+        Returns:
+            Callable taking (rows, ctx) and returning the mapped rows,
+            or None for other object expressions
+        """
+        children = [child for child in node.children if isinstance(child, Tree)]
+        spread = bool(children) and children[0].data == "spread_row"
+        named = children[1:] if spread else children
+        if not children or spread and not in_place or any(
+            child.data != "obj_field" for child in named
+        ):
+            return None
+
+        update = self.compile(node, in_place=spread)
+        fields = [
+            (
+                self._compile_field(child),
+                self._is_constant(child.children[1]),
+                self._string_literal(child.children[1]),
+            )
+            for child in named
+        ]
+
+        def batch(rows, ctx=None, f=fields):
+            if not rows:
+                return rows
+            if not all(isinstance(r, dict) for r in rows):
+                return [update(r, ctx) for r in rows]
+            params = ctx.params if ctx and hasattr(ctx, 'params') else {}
+            # Specialize the fields for this call: constants become
+            # ("const", name, value), templates ("format", name, (fmt, render))
+            plan = []
+            for (kind, name, expr), constant, template in f:
+                if constant:
+                    plan.append(("const", name, expr(rows[0], ctx)))
+                    continue
+                fmt = self._bind_template(template, params) if kind == "text" else None
+                if fmt is not None:
+                    plan.append(("format", name, (fmt, expr)))
+                else:
+                    plan.append((kind, name, expr))
+            interpolate = self._interpolate
+            mapped = rows if spread else []
+            for r in rows:
+                values = []
+                for kind, name, expr in plan:
+                    if kind == "const":
+                        value = expr
+                    elif kind == "format":
+                        fmt, render = expr
+                        try:
+                            value = fmt(r)
+                        except KeyError:
+                            value = render(r, ctx)  # Keeps unknown placeholders
+                    else:
+                        value = expr(r, ctx)
+                        if kind == "field" and isinstance(value, str) and '{' in value:
+                            value = interpolate(value, r, ctx)
+                    values.append((name, value))
+                if spread:
+                    r.update(values)
+                else:
+                    mapped.append(dict(values))
+            return mapped
+
+        return batch
+
+    def _compile_field(self, node: Tree) -> Tuple[str, str, Callable]:
+        """Compile an obj_field node to a (kind, name, expr) entry."""
+        name = str(node.children[0])
+        expr = self.expr_compiler.compile(node.children[1])
+        template = self._string_literal(node.children[1])
+        render = self._compile_template(template, expr) if template else None
+        if render is not None:
+            # "text {field}": rendered fully, no second pass
+            return ("text", name, render)
+        return ("field", name, expr)
+
+    @staticmethod
+    def _is_constant(node: Any) -> bool:
+        """True for a literal whose value does not depend on the row or params."""
+        if isinstance(node, Tree) and node.data == "literal" and len(node.children) == 1:
+            node = node.children[0]
+        if not isinstance(node, Tree):
+            return False
+        if node.data == "val_string":
+            return '{' not in unquote(str(node.children[0]))
+        return node.data in ("val_int", "val_float", "val_true", "val_false", "val_null")
+
+    @staticmethod
+    def _string_literal(node: Any) -> Optional[str]:
+        """Return the text of a plain string literal node, else None."""
+        if isinstance(node, Tree) and node.data == "literal" and len(node.children) == 1:
+            node = node.children[0]
+        if isinstance(node, Tree) and node.data == "val_string":
+            return unquote(str(node.children[0]))
+        return None
+
+    def _compile_template(self, template: str, expr: Callable) -> Optional[Callable]:
+        """
+        Compile a "text {field}" literal to a (row, ctx) -> str function.
+
+        The template is split at its placeholders once, so each row only
+        joins the parts. Gives the same text as the literal's param
+        substitution followed by _interpolate: params win, then row fields,
+        unknown placeholders are kept. A param value that itself contains
+        braces goes through that two-pass path to stay identical.
+
+        Returns None when there is nothing to precompute (no placeholders,
+        or stray braces that a substitution could turn into new ones).
+        """
+        parts = _PLACEHOLDER_PATTERN.split(template)
+        if len(parts) == 1 or any('{' in t or '}' in t for t in parts[::2]):
+            return None
+
+        def render(r, ctx=None, parts=parts):
+            params = ctx.params if ctx and hasattr(ctx, 'params') else {}
+            row = r if isinstance(r, dict) else {}
+            out = parts[:]
+            for i in range(1, len(parts), 2):
+                name = parts[i]
+                if name in params:
+                    value = str(params[name])
+                    if '{' in value or '}' in value:
+                        return self._interpolate(expr(r, ctx), r, ctx)
+                    out[i] = value
+                elif name in row:
+                    out[i] = str(row[name])
+                else:
+                    out[i] = '{' + name + '}'
+            return "".join(out)
+
+        return render
+
+    @staticmethod
+    def _bind_template(template: str, params: Dict) -> Optional[Callable[[Dict], str]]:
+        """
+        Substitute params into a "text {field}" template and return the
+        ``format_map`` of what is left, so a row only fills its fields.
+
+        Only for templates _compile_template accepted. Returns None when a
+        param value contains braces or a placeholder is not an identifier
+        (``{0}`` means something else to str.format).
+        """
+        parts = _PLACEHOLDER_PATTERN.split(template)
+        for i in range(1, len(parts), 2):
+            name = parts[i]
+            if name in params:
+                value = str(params[name])
+                if '{' in value or '}' in value:
+                    return None
+                parts[i] = value
+            elif name.isidentifier():
+                parts[i] = '{' + name + '}'
+            else:
+                return None
+        return "".join(parts).format_map
+
     def _interpolate(self, template: str, row: Dict, ctx: Optional[Any]) -> str:
         """Interpolate {field} placeholders in a string."""
-        pattern = re.compile(r'\{(\w+)\}')
-
         def replacer(m):
             field = m.group(1)
             if isinstance(row, dict) and field in row:
@@ -673,7 +1347,152 @@ class ObjectExprCompiler:
                 return str(ctx.params[field])
             return m.group(0)
 
-        return pattern.sub(replacer, template)
+        return _PLACEHOLDER_PATTERN.sub(replacer, template)
+
+
+class ArrowObjectExprCompiler:
+    """
+    Compiles CADSL object expressions (as used by map) to table kernels.
+
+    The result is a function ``table -> pyarrow.Table`` that builds every
+    output field as a whole column instead of a fresh dict per row:
+    ``...row`` keeps the input columns, values go through
+    ArrowExpressionCompiler and "text {field}" templates are joined
+    column-wise. Interpolation follows ObjectExprCompiler (``str()`` of the
+    value, params as fallback, unknown placeholders kept): string and
+    integer columns are cast by Arrow, other columns (floats, booleans,
+    ...) are formatted with ``str()`` one column at a time, since Arrow's
+    text differs there. ``...var`` and anything else yields None.
+
+    ::: This is-in-layer Domain-Specific-Language-Layer.
+    ::: This is a compiler.
+    """
+
+    def __init__(self, schema, ctx: Optional[Any] = None):
+        """
+        Args:
+            schema: pyarrow.Schema of the table the map will run on
+            ctx: Pipeline context used for parameter references
+        """
+        self.schema = schema
+        self.ctx = ctx
+        self.expr_compiler = ArrowExpressionCompiler(schema, ctx)
+
+    def compile(self, node: Tree) -> Optional[Callable]:
+        """
+        Compile an object_expr node to a table kernel.
+
+        Returns:
+            Callable taking a pyarrow.Table and returning a Table,
+            or None if the object cannot be vectorized
+        """
+        spread = False
+        fields = []
+        try:
+            for child in node.children:
+                if not isinstance(child, Tree):
+                    continue
+                if child.data == "spread_row":
+                    if fields:
+                        raise _NotVectorizable()  # Later spread would overwrite fields
+                    spread = True
+                elif child.data == "obj_field":
+                    name = str(child.children[0])
+                    fields.append((name, self._value(child.children[1])))
+                else:
+                    raise _NotVectorizable()
+        except _NotVectorizable:
+            return None
+
+        def kernel(table, spread=spread, fields=fields):
+            import pyarrow as pa
+
+            # Evaluate against the input table, as the row path reads the input row
+            columns = [(name, value(table)) for name, value in fields]
+            if any(column is None for _, column in columns):
+                return None
+            if not spread:
+                return pa.table(dict(columns))
+            result = table
+            for name, column in columns:
+                if name in result.column_names:
+                    index = result.column_names.index(name)
+                    result = result.set_column(index, name, column)
+                else:
+                    result = result.append_column(name, column)
+            return result
+
+        return kernel
+
+    def _value(self, node) -> Callable:
+        """Compile one field value to ``table -> Array`` (None = fall back)."""
+        import pyarrow as pa
+        import pyarrow.compute as pc
+
+        if isinstance(node, Tree) and not ArrowConditionCompiler._references_fields(node):
+            value = ExpressionCompiler().compile(node)({}, self.ctx)
+            if isinstance(value, str) and '{' in value:
+                return self._template(value)
+
+        column = self.expr_compiler.compile(node)
+        if column is None:
+            raise _NotVectorizable()
+
+        def value(table):
+            result = column(table)
+            # The row path interpolates any string value containing '{'
+            if pa.types.is_string(result.type) and pc.any(
+                    pc.match_substring(result, "{")).as_py():
+                return None
+            return result
+
+        return value
+
+    def _template(self, template: str) -> Callable:
+        """Compile "text {field}" to a column-wise string join."""
+        import pyarrow as pa
+        import pyarrow.compute as pc
+
+        params = getattr(self.ctx, "params", None) or {}
+        parts = []  # Literal strings and (column,) references
+        position = 0
+        for match in _PLACEHOLDER_PATTERN.finditer(template):
+            parts.append(template[position:match.start()])
+            field = match.group(1)
+            if field in self.schema.names:
+                column_type = self.schema.field(field).type
+                parts.append((field, pa.types.is_string(column_type)
+                              or pa.types.is_integer(column_type)))
+            elif field in params:
+                parts.append(str(params[field]))
+            else:
+                parts.append(match.group(0))
+            position = match.end()
+        parts.append(template[position:])
+
+        if not any(isinstance(part, tuple) for part in parts):
+            text = "".join(parts)
+            return lambda table: pa.array([text] * table.num_rows, pa.string())
+
+        def join(table):
+            values = []
+            for part in parts:
+                if isinstance(part, tuple):
+                    field, castable = part
+                    if castable:
+                        text = pc.cast(table.column(field), pa.string())
+                    else:
+                        text = pa.array(
+                            [None if v is None else str(v)
+                             for v in table.column(field).to_pylist()],
+                            pa.string(),
+                        )
+                    values.append(pc.fill_null(text, "None"))
+                else:
+                    values.append(pa.scalar(part, pa.string()))
+            return pc.binary_join_element_wise(*values, "")
+
+        return join
 
 
 # ============================================================
@@ -190,6 +190,14 @@ def _resolve_rag_params(params: Dict[str, Any], ctx: "Context") -> Dict[str, Any
 # PIPELINE FACTORY BUILDER
 # ============================================================
 
+# Steps whose output rows are new dicts (or an Arrow table) that no other
+# step holds on to (map only when it is an object expression)
+_FRESH_ROW_STEPS = frozenset({"select", "map", "compute", "rag_enrich"})
+
+# Steps that hand on the rows they were given without keeping them
+_ROW_PASSING_STEPS = frozenset({"filter", "order_by", "limit", "offset"})
+
+
 def build_pipeline_factory(spec: CADSLToolSpec,
                            security_context: Optional[SecurityContext] = None
                            ) -> Callable:
@@ -215,12 +223,41 @@ def build_pipeline_factory(spec: CADSLToolSpec,
         TapStep, RenderStep, Context,
     )
 
+    from .compiler import ObjectExprCompiler
+
     security_context = security_context or SecurityContext()
 
+    # Step parts that do not depend on the call's context are compiled once
+    # here and shared by every pipeline the factory builds. Steps that build
+    # fresh rows hand them over to the next step, and filter/order/limit
+    # pass those same rows on, so a {...row, ...} map on them extends the
+    # rows instead of copying each one again, in one call for the whole list.
+    # A {name: expr, ...} map builds fresh rows, so it always gets the
+    # whole-list form. The REQL source only holds the query text, so one
+    # instance (with its query split into a template) serves every call
+    reql_source = REQLSource(spec.source_content) if spec.source_type == "reql" else None
+    in_place_maps: Dict[int, Callable] = {}
+    batch_maps: Dict[int, Callable] = {}
+    owned = False
+    for index, step_spec in enumerate(spec.steps):
+        step_type = step_spec.get("type")
+        object_node = step_spec.get("_object_node")
+        if step_type == "map" and object_node is not None:
+            compiler = ObjectExprCompiler()
+            if owned:
+                in_place_maps[index] = compiler.compile(object_node, in_place=True)
+            batch = compiler.compile_batch(object_node, in_place=owned)
+            if batch is not None:
+                batch_maps[index] = batch
+        if step_type in _FRESH_ROW_STEPS:
+            owned = step_type != "map" or object_node is not None
+        elif step_type not in _ROW_PASSING_STEPS:
+            owned = False
+
     def factory(ctx: Context) -> Pipeline:
         # Create source
         if spec.source_type == "reql":
-            source = REQLSource(spec.source_content)
+            source = reql_source
         elif spec.source_type == "rag_search":
             params = _resolve_rag_params(spec.rag_params, ctx)
             source = RAGSearchSource(
@@ -291,20 +328,46 @@ def build_pipeline_factory(spec: CADSLToolSpec,
 
         # Process each step
         emit_key = None
-        for step_spec in spec.steps:
+        for index, step_spec in enumerate(spec.steps):
             step_type = step_spec.get("type")
 
             if step_type == "filter":
                 predicate = step_spec.get("predicate", lambda r, ctx=None: True)
-                pipeline = pipeline.filter(wrap_with_ctx(predicate))
+                condition_node = step_spec.get("_condition_node")
+                arrow_predicate = None
+                if condition_node is not None:
+                    from .compiler import ArrowConditionCompiler
+
+                    def arrow_predicate(table, node=condition_node):
+                        return ArrowConditionCompiler(table.schema, ctx).compile(node)
+                pipeline = pipeline.filter(
+                    wrap_with_ctx(predicate), arrow_predicate=arrow_predicate
+                )
 
             elif step_type == "select":
                 fields = step_spec.get("fields", {})
                 pipeline = pipeline >> SelectStep(fields)
 
             elif step_type == "map":
-                transform = step_spec.get("transform", lambda r, ctx=None: r)
-                pipeline = pipeline.map(wrap_with_ctx(transform))
+                transform = in_place_maps.get(index) or step_spec.get(
+                    "transform", lambda r, ctx=None: r
+                )
+                object_node = step_spec.get("_object_node")
+                arrow_transform = None
+                if object_node is not None:
+                    from .compiler import ArrowObjectExprCompiler
+
+                    def arrow_transform(table, node=object_node):
+                        kernel = ArrowObjectExprCompiler(table.schema, ctx).compile(node)
+                        return kernel(table) if kernel is not None else None
+                batch_transform = None
+                if index in batch_maps:
+                    def batch_transform(rows, batch=batch_maps[index]):
+                        return batch(rows, ctx)
+                pipeline = pipeline.map(
+                    wrap_with_ctx(transform), arrow_transform=arrow_transform,
+                    batch_transform=batch_transform,
+                )
 
             elif step_type == "flat_map":
                 transform = step_spec.get("transform", lambda r, ctx=None: [r])
@@ -312,11 +375,11 @@ def build_pipeline_factory(spec: CADSLToolSpec,
 
             elif step_type == "order_by":
                 orders = step_spec.get("orders", [])
-                for field_name, desc in orders:
-                    if desc:
-                        pipeline = pipeline.order_by("-" + field_name.lstrip("-"))
-                    else:
-                        pipeline = pipeline.order_by(field_name)
+                if orders:
+                    pipeline = pipeline.order_by(*(
+                        "-" + field_name.lstrip("-") if desc else field_name
+                        for field_name, desc in orders
+                    ))
 
             elif step_type == "limit":
                 if "param" in step_spec:
@@ -447,7 +510,10 @@ def build_pipeline_factory(spec: CADSLToolSpec,
             elif step_type == "compute":
                 # Add computed fields
                 from .transformer import ComputeStep
-                pipeline = pipeline >> ComputeStep(step_spec.get("fields", {}))
+                pipeline = pipeline >> ComputeStep(
+                    step_spec.get("computations", {}),
+                    step_spec.get("_expression_nodes"),
+                )
 
             elif step_type == "render_chart":
                 # Render data as chart (bar, line, pie)
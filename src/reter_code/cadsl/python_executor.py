@@ -775,7 +775,7 @@ class SecurePythonStep:
             PipelineResult with result or error
         """
         # Import here to avoid circular imports
-        from reter_code.dsl.core import pipeline_ok, pipeline_err
+        from reter_code.dsl.core import pipeline_ok, pipeline_err, to_list
 
         if not self.is_valid:
             return pipeline_err(
@@ -783,9 +783,9 @@ class SecurePythonStep:
                 f"Security validation failed: {'; '.join(self.validation_errors)}"
             )
 
-        # Prepare namespace
+        # Prepare namespace (columnar sources reach the code as rows)
         namespace = {
-            "rows": data,
+            "rows": to_list(data),
             "ctx": ctx,
         }
 
@@ -15,9 +15,13 @@ class CollectStep:
     Aggregate rows by key, collecting fields into sets/lists.
 
     Syntax: collect { by: field, name: op(field) }
+            collect { by: [field1, field2], name: op(field) }
 
     Operations: set, list, first, last, count, sum, avg, min, max
 
+    Arrow input is grouped with Arrow's hash aggregation when every
+    operation has an Arrow equivalent; otherwise rows are grouped in Python.
+
     ::: This is-in-layer Domain-Specific-Language-Layer.
     ::: This is a step.
     ::: This is a pipeline-step.
@@ -25,8 +29,21 @@ class CollectStep:
     ::: This is stateless.
     """
 
-    def __init__(self, by: str, fields: dict):
+    # CADSL operation -> Arrow hash aggregate function
+    ARROW_AGGREGATES = {
+        'set': 'distinct',
+        'first': 'first',
+        'last': 'last',
+        'count': 'count',
+        'sum': 'sum',
+        'avg': 'mean',
+        'min': 'min',
+        'max': 'max',
+    }
+
+    def __init__(self, by, fields: dict):
         self.by = by
+        self.keys = list(by) if isinstance(by, (list, tuple)) else [by]
         self.fields = fields  # {output_name: (source_field, operation)}
 
     def execute(self, data, ctx=None):
@@ -34,20 +51,22 @@ class CollectStep:
         from reter_code.dsl.core import pipeline_ok, pipeline_err
 
         try:
+            if hasattr(data, 'group_by'):
+                result = self._collect_arrow(data)
+                if result is not None:
+                    return pipeline_ok(result)
+
             # Convert to list if Arrow table
             if hasattr(data, 'to_pylist'):
                 data = data.to_pylist()
 
             groups = {}
             for row in data:
-                key = row.get(self.by)
+                key = tuple(row.get(k) for k in self.keys)
                 if key not in groups:
-                    groups[key] = {self.by: key}
-                    for name, (source, op) in self.fields.items():
-                        if op in ('set', 'list'):
-                            groups[key][f"_{name}_values"] = []
-                        else:
-                            groups[key][f"_{name}_values"] = []
+                    groups[key] = {
+                        f"_{name}_values": [] for name in self.fields
+                    }
 
                 for name, (source, op) in self.fields.items():
                     value = row.get(source)
@@ -57,7 +76,7 @@ class CollectStep:
             # Apply aggregation operations
             result = []
             for key, group in groups.items():
-                out = {self.by: key}
+                out = dict(zip(self.keys, key))
                 for name, (source, op) in self.fields.items():
                     values = group.get(f"_{name}_values", [])
                     if op == 'set':
@@ -87,6 +106,54 @@ class CollectStep:
         except Exception as e:
             return pipeline_err("collect", f"Collect failed: {e}", e)
 
+    def _collect_arrow(self, table):
+        """
+        Group an Arrow table with hash aggregation.
+
+        Returns None when an operation, column or type is not supported,
+        in which case the caller falls back to the row-by-row path.
+        """
+        import pyarrow as pa
+        import pyarrow.compute as pc
+
+        columns = set(table.column_names)
+        if not all(k in columns for k in self.keys):
+            return None
+
+        aggregations = []
+        renames = []
+        for name, (source, op) in self.fields.items():
+            fn = self.ARROW_AGGREGATES.get(op)
+            if fn is None or source not in columns:
+                return None
+            column_type = table.schema.field(source).type
+            if op in ('sum', 'avg') and not (
+                pa.types.is_integer(column_type) or pa.types.is_floating(column_type)
+            ):
+                return None
+            if op == 'set':
+                aggregations.append((source, fn, pc.CountOptions(mode="only_valid")))
+            else:
+                aggregations.append((source, fn))
+            agg_name = f"{source}_{fn}"
+            if any(agg_name == existing for existing, _, _ in renames):
+                return None
+            renames.append((agg_name, name, op))
+
+        try:
+            grouped = table.group_by(self.keys, use_threads=False).aggregate(aggregations)
+        except (pa.ArrowNotImplementedError, pa.ArrowInvalid, pa.ArrowTypeError):
+            return None
+
+        arrays = [grouped.column(k) for k in self.keys]
+        for agg_name, name, op in renames:
+            column = grouped.column(agg_name)
+            if op in ('sum', 'avg'):
+                # Empty groups aggregate to 0, matching the row-by-row path
+                column = pc.fill_null(column, 0)
+            arrays.append(column)
+        return pa.table(arrays, names=self.keys + [name for _, name, _ in renames])
+
 
 class NestStep:
     """
@@ -7,9 +7,31 @@ and graph traversal.
 Extracted from transformer.py to reduce file size.
 """
 
-from collections import defaultdict, deque
+from collections import OrderedDict, defaultdict, deque
+import hashlib
+from itertools import islice
 import logging
-from typing import Any, Callable, Optional
+import threading
+from typing import Any, Callable, Iterator, Optional, Tuple
+
+
+def iter_edges(data, from_field, to_field) -> Iterator[Tuple[Any, Any]]:
+    """
+    Yield (from, to) pairs with both endpoints set.
+
+    Arrow tables are read column-wise, so only the two edge columns are
+    converted to Python instead of materializing a dict per row.
+    """
+    if hasattr(data, 'column_names'):
+        if from_field not in data.column_names or to_field not in data.column_names:
+            return
+        pairs = zip(data.column(from_field).to_pylist(), data.column(to_field).to_pylist())
+    else:
+        pairs = ((row.get(from_field), row.get(to_field)) for row in data)
+
+    for from_val, to_val in pairs:
+        if from_val and to_val:
+            yield from_val, to_val
 
 
 class GraphCyclesStep:
@@ -36,17 +58,10 @@ class GraphCyclesStep:
         from reter_code.dsl.core import pipeline_ok, pipeline_err
 
         try:
-            # Convert to list if Arrow table
-            if hasattr(data, 'to_pylist'):
-                data = data.to_pylist()
-
             # Build adjacency list
             graph = defaultdict(list)
-            for row in data:
-                from_val = row.get(self.from_field)
-                to_val = row.get(self.to_field)
-                if from_val and to_val:
-                    graph[from_val].append(to_val)
+            for from_val, to_val in iter_edges(data, self.from_field, self.to_field):
+                graph[from_val].append(to_val)
 
             # DFS for cycle detection
             cycles = []
@@ -95,6 +110,10 @@ class GraphClosureStep:
 
     Returns all reachable nodes from each source node.
 
+    The closure is a BFS from every node, so results are memoized by a
+    digest of the edge list: tools that close over the same relation (e.g.
+    inheritance or calls) reuse it until the underlying edges change.
+
     ::: This is-in-layer Domain-Specific-Language-Layer.
     ::: This is a step.
     ::: This is a pipeline-step.
@@ -102,6 +121,12 @@ class GraphClosureStep:
     ::: This is stateless.
     """
 
+    # (max_depth, edge digest) -> closure rows, shared by all instances
+    # and by the threads of concurrent tool runs
+    _cache: "OrderedDict[tuple, list]" = OrderedDict()
+    _cache_lock = threading.Lock()
+    CACHE_SIZE = 32
+
     def __init__(self, from_field, to_field, max_depth=10):
         self.from_field = from_field
         self.to_field = to_field
@@ -112,50 +137,64 @@ class GraphClosureStep:
         from reter_code.dsl.core import pipeline_ok, pipeline_err
 
         try:
-            # Convert to list if Arrow table
-            if hasattr(data, 'to_pylist'):
-                data = data.to_pylist()
+            edges = tuple(iter_edges(data, self.from_field, self.to_field))
+            key = (self.max_depth, hashlib.blake2b(repr(edges).encode()).digest())
+            with self._cache_lock:
+                result = self._cache.get(key)
+                if result is not None:
+                    self._cache.move_to_end(key)
+            if result is None:
+                result = self._closure(edges)
+                with self._cache_lock:
+                    self._cache[key] = result
+                    if len(self._cache) > self.CACHE_SIZE:
+                        self._cache.popitem(last=False)
+
+            # Copy so downstream steps cannot mutate the memoized rows
+            return pipeline_ok([
+                {**row, "reachable": list(row["reachable"]), "path": list(row["path"])}
+                for row in result
+            ])
+        except Exception as e:
+            return pipeline_err("graph_closure", f"Transitive closure failed: {e}", e)
 
-            # Build adjacency list
-            graph = defaultdict(set)
-            for row in data:
-                from_val = row.get(self.from_field)
-                to_val = row.get(self.to_field)
-                if from_val and to_val:
-                    graph[from_val].add(to_val)
+    def _closure(self, edges) -> list:
+        """Compute closure rows for an edge list."""
+        # Build adjacency list
+        graph = defaultdict(set)
+        for from_val, to_val in edges:
+            graph[from_val].add(to_val)
 
-            # Compute closure using BFS
-            result = []
-            for start in graph:
-                visited = set()
-                queue = deque([(start, 0)])
-                path = []
+        # Compute closure using BFS
+        result = []
+        for start in graph:
+            visited = set()
+            queue = deque([(start, 0)])
+            path = []
 
-                while queue:
-                    node, depth = queue.popleft()
-                    if depth > self.max_depth:
-                        continue
-                    if node in visited:
-                        continue
+            while queue:
+                node, depth = queue.popleft()
+                if depth > self.max_depth:
+                    continue
+                if node in visited:
+                    continue
 
-                    visited.add(node)
-                    if node != start:
-                        path.append(node)
+                visited.add(node)
+                if node != start:
+                    path.append(node)
 
-                    for neighbor in graph.get(node, []):
-                        if neighbor not in visited:
-                            queue.append((neighbor, depth + 1))
+                for neighbor in graph.get(node, []):
+                    if neighbor not in visited:
+                        queue.append((neighbor, depth + 1))
 
-                result.append({
-                    "source": start,
-                    "reachable": list(visited - {start}),
-                    "count": len(visited) - 1,
-                    "path": path[:self.max_depth],
-                })
+            result.append({
+                "source": start,
+                "reachable": list(visited - {start}),
+                "count": len(visited) - 1,
+                "path": path[:self.max_depth],
+            })
 
-            return pipeline_ok(result)
-        except Exception as e:
-            return pipeline_err("graph_closure", f"Transitive closure failed: {e}", e)
+        return result
 
 
 class GraphTraverseStep:
@@ -185,21 +224,13 @@ class GraphTraverseStep:
         logger = logging.getLogger(__name__)
 
         try:
-            # Convert to list if Arrow table, preserve original for filtering
-            original_data = data
-            if hasattr(data, 'to_pylist'):
-                data = data.to_pylist()
-
             # Build adjacency list
             graph = defaultdict(list)
             nodes = set()
-            for row in data:
-                from_val = row.get(self.from_field)
-                to_val = row.get(self.to_field)
-                if from_val and to_val:
-                    graph[from_val].append(to_val)
-                    nodes.add(from_val)
-                    nodes.add(to_val)
+            for from_val, to_val in iter_edges(data, self.from_field, self.to_field):
+                graph[from_val].append(to_val)
+                nodes.add(from_val)
+                nodes.add(to_val)
 
             # Determine root nodes
             # BUG-002 FIX: Handle string root parameter correctly
@@ -233,7 +264,7 @@ class GraphTraverseStep:
                 has_incoming = set()
                 for neighbors in graph.values():
                     has_incoming.update(neighbors)
-                roots = [n for n in nodes if n not in has_incoming] or list(nodes)[:1]
+                roots = [n for n in nodes if n not in has_incoming] or list(islice(nodes, 1))
 
             if not roots:
                 logger.warning("No root nodes found for graph traversal")
@@ -266,6 +297,17 @@ class GraphTraverseStep:
             # BUG-002 FIX: Filter original data to only edges within the visited subgraph
             # Only include edges where BOTH endpoints are visited
             # This ensures max_depth is respected (unvisited to_nodes mean depth exceeded)
+            if hasattr(data, 'column_names'):
+                import pyarrow as pa
+                import pyarrow.compute as pc
+
+                visited_set = pa.array(list(visited))
+                mask = pc.and_(
+                    pc.is_in(data.column(self.from_field), value_set=visited_set),
+                    pc.is_in(data.column(self.to_field), value_set=visited_set),
+                )
+                return pipeline_ok(data.filter(mask))
+
             filtered = []
             for row in data:
                 from_val = row.get(self.from_field)
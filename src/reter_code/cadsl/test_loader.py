@@ -450,6 +450,94 @@ def test_load_result_bool():
         return False
 
 
+def test_factory_reuse():
+    """Test that one pipeline factory serves repeated calls with new params."""
+    import pyarrow as pa
+    from reter_code.cadsl.loader import build_pipeline_factory
+    from reter_code.cadsl.parser import parse_cadsl
+    from reter_code.cadsl.transformer import transform_cadsl
+    from reter_code.dsl.core import Context
+
+    print("\n" + "=" * 60)
+    print("TEST: Factory Reuse")
+    print("=" * 60)
+
+    class FakeReter:
+        def reql(self, query, timeout_ms=None):
+            return pa.table({"?name": ["a", "b"], "?line": [1, 2]})
+
+    source = '''
+    query test() {
+        param kind: str = "Method";
+        reql { SELECT ?name ?line WHERE { ?x has-name ?name . ?x is-at-line ?line } }
+        | select { name, line }
+        | map { ...row, message: "{kind} {name}" }
+        | emit { results }
+    }
+    '''
+    spec = transform_cadsl(parse_cadsl(source).tree)[0]
+    factory = build_pipeline_factory(spec)
+
+    for kind in ("Method", "Function", "Method"):
+        ctx = Context(reter=FakeReter(), params={"kind": kind})
+        messages = [r["message"] for r in factory(ctx).execute(ctx)["results"]]
+        print(f"  {kind}: {messages}")
+        if messages != [f"{kind} a", f"{kind} b"]:
+            print("Factory reuse: FAILED")
+            return False
+
+    print("Factory reuse: PASSED")
+    return True
+
+
+def test_in_place_map_ownership():
+    """Test that maps only extend rows no one else holds on to."""
+    import pyarrow as pa
+    from reter_code.cadsl.loader import build_pipeline_factory
+    from reter_code.cadsl.parser import parse_cadsl
+    from reter_code.cadsl.transformer import transform_cadsl
+    from reter_code.dsl.core import Context
+
+    print("\n" + "=" * 60)
+    print("TEST: In-Place Map Ownership")
+    print("=" * 60)
+
+    class FakeReter:
+        def reql(self, query, timeout_ms=None):
+            return pa.table({"?name": ["b", "a", "c"], "?line": [2, 1, 0]})
+
+    template = '''
+    query test() {
+        reql { SELECT ?name ?line WHERE { ?x has-name ?name . ?x is-at-line ?line } }
+        | %s
+        | filter { line > 0 }
+        | order_by { line }
+        | map { ...row, tag: "seen" }
+        | emit { results }
+    }
+    '''
+    expected = [{"name": "a", "line": 1, "tag": "seen"},
+                {"name": "b", "line": 2, "tag": "seen"}]
+
+    # select builds fresh rows; the python step hands back rows the caller holds
+    for step in ("select { name, line }", "python { result = ctx.params[\"held\"] }"):
+        held = [{"name": "b", "line": 2}, {"name": "a", "line": 1}, {"name": "c", "line": 0}]
+        spec = transform_cadsl(parse_cadsl(template % step).tree)[0]
+        ctx = Context(reter=FakeReter(), params={"held": held})
+        results = build_pipeline_factory(spec)(ctx).execute(ctx)["results"]
+        print(f"  {step.split()[0]}: {results}")
+        if results != expected:
+            print("In-place map ownership: FAILED")
+            return False
+        if any("tag" in row for row in held):
+            print(f"  Held rows were mutated: {held}")
+            print("In-place map ownership: FAILED")
+            return False
+
+    print("In-place map ownership: PASSED")
+    return True
+
+
 # ============================================================
 # TEST RUNNER
 # ============================================================
@@ -472,6 +560,8 @@ def run_all_tests() -> int:
         test_empty_source,
         test_convenience_functions,
         test_load_result_bool,
+        test_factory_reuse,
+        test_in_place_map_ownership,
     ]
 
     passed = 0
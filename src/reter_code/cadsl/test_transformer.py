@@ -20,6 +20,10 @@ from reter_code.cadsl import (
     compile_condition,
     compile_expression,
     compile_object_expr,
+    ArrowConditionCompiler,
+    ArrowExpressionCompiler,
+    ArrowObjectExprCompiler,
+    ObjectExprCompiler,
 )
 
 
@@ -226,6 +230,569 @@ def test_object_expression():
     return False
 
 
+def test_arrow_condition_compiler():
+    """Test that vectorized filters agree with the row predicate."""
+    import pyarrow as pa
+    from reter_code.dsl.core import Context
+
+    print("\n" + "=" * 60)
+    print("TEST: Arrow Condition Compiler")
+    print("=" * 60)
+
+    table = pa.table({
+        "n": [1, 2, 3, 4, None],
+        "s": ["a", "ab", None, "xb", "a"],
+    })
+    ctx = Context(reter=None, params={"lim": 3, "names": ["a", "xb"], "target": ""})
+    conditions = [
+        ('n > {lim}', True),
+        ('not (n > {lim})', True),
+        ('s != "a"', True),
+        ('s starts_with "a" or s ends_with "b"', True),
+        ('s contains "b" or s starts_with "x" or s ends_with "." or n > {lim}', True),
+        ('s in {names} and n is not null', True),
+        ('({target} == "" or s == {target}) and not (s is null)', True),
+        ('n > s', False),  # Mixed types stay on the row path
+    ]
+
+    rows = table.to_pylist()
+    for source, vectorized in conditions:
+        result = parse_cadsl(
+            "query test() { reql { SELECT ?x WHERE { ?x type class } } "
+            f"| filter {{ {source} }} | emit {{ results }} }}"
+        )
+        if not result.success:
+            print(f"Parse failed: {result.errors}")
+            return False
+
+        spec = transform_cadsl(result.tree)[0]
+        step = [s for s in spec.steps if s["type"] == "filter"][0]
+        expected = [r for r in rows if step["predicate"](r, ctx)]
+        expr = ArrowConditionCompiler(table.schema, ctx).compile(step["_condition_node"])
+
+        if (expr is not None) != vectorized:
+            print(f"  {source}: vectorized={expr is not None} (expected {vectorized})")
+            print("Arrow condition compiler: FAILED")
+            return False
+        if expr is not None and table.filter(expr).to_pylist() != expected:
+            print(f"  {source}: {table.filter(expr).to_pylist()} != {expected}")
+            print("Arrow condition compiler: FAILED")
+            return False
+        print(f"  {source}: OK")
+
+    print("Arrow condition compiler: PASSED")
+    return True
+
+
+def test_arrow_expression_compiler():
+    """Test that vectorized compute expressions agree with the row closures."""
+    import pyarrow as pa
+    from reter_code.dsl.core import Context
+
+    print("\n" + "=" * 60)
+    print("TEST: Arrow Expression Compiler")
+    print("=" * 60)
+
+    table = pa.table({
+        "a": [5, 2, None, 0],
+        "b": [1, 0, 3, None],
+        "f": [0.5, 1.5, None, 2.0],
+        "s": ["x", "y", None, "z"],
+    })
+    ctx = Context(reter=None, params={"k": 3})
+    expressions = [
+        ('a - b', True),
+        ('a / b', True),
+        ('(a + f) * {k} - -b', True),
+        ('"Method"', True),
+        ('s', True),
+        ('b ?? 7', True),
+        ('s ?? "-"', True),
+        ('b ?? "-"', False),
+        ('a % 2', False),  # Python modulo semantics stay on the row path
+        ('lower(s)', False),
+    ]
+
+    rows = table.to_pylist()
+    for source, vectorized in expressions:
+        result = parse_cadsl(
+            "query test() { reql { SELECT ?x WHERE { ?x type class } } "
+            f"| compute {{ out: {source} }} | emit {{ results }} }}"
+        )
+        if not result.success:
+            print(f"Parse failed: {result.errors}")
+            return False
+
+        spec = transform_cadsl(result.tree)[0]
+        step = [s for s in spec.steps if s["type"] == "compute"][0]
+        expected = [step["computations"]["out"](r, ctx) for r in rows]
+        kernel = ArrowExpressionCompiler(table.schema, ctx).compile(
+            step["_expression_nodes"]["out"]
+        )
+
+        if (kernel is not None) != vectorized:
+            print(f"  {source}: vectorized={kernel is not None} (expected {vectorized})")
+            print("Arrow expression compiler: FAILED")
+            return False
+        if kernel is not None and kernel(table).to_pylist() != expected:
+            print(f"  {source}: {kernel(table).to_pylist()} != {expected}")
+            print("Arrow expression compiler: FAILED")
+            return False
+        print(f"  {source}: OK")
+
+    print("Arrow expression compiler: PASSED")
+    return True
+
+
+def test_arrow_object_expr_compiler():
+    """Test that vectorized map objects agree with the row transforms."""
+    import pyarrow as pa
+    from reter_code.dsl.core import Context
+
+    print("\n" + "=" * 60)
+    print("TEST: Arrow Object Expression Compiler")
+    print("=" * 60)
+
+    table = pa.table({
+        "name": ["run", "stop", None],
+        "missing": [2, 1, None],
+        "ratio": [0.5, 1.0, None],
+        "note": ["ok", "{name}", "ok"],
+        "flag": [True, False, None],
+    })
+    ctx = Context(reter=None, params={"kind": "Method"})
+    objects = [
+        ('...row, message: "{kind} {name} missing {missing} types"', True),
+        ('...row, missing: missing * 2, issue: "untyped"', True),
+        ('name: name, text: "{unknown} stays"', True),
+        ('...row, message: "{name} at {ratio}"', True),  # Floats formatted with str()
+        ('...row, message: "{name} ok: {flag}"', True),
+        ('...row, copy: note', False),  # Row values containing '{' are interpolated
+        ('label: "x", ...row', False),
+    ]
+
+    rows = table.to_pylist()
+    for source, vectorized in objects:
+        result = parse_cadsl(
+            "query test() { reql { SELECT ?x WHERE { ?x type class } } "
+            f"| map {{ {source} }} | emit {{ results }} }}"
+        )
+        if not result.success:
+            print(f"Parse failed: {result.errors}")
+            return False
+
+        spec = transform_cadsl(result.tree)[0]
+        step = [s for s in spec.steps if s["type"] == "map"][0]
+        expected = [step["transform"](r, ctx) for r in rows]
+        kernel = ArrowObjectExprCompiler(table.schema, ctx).compile(step["_object_node"])
+        mapped = kernel(table) if kernel is not None else None
+
+        if (mapped is not None) != vectorized:
+            print(f"  {source}: vectorized={mapped is not None} (expected {vectorized})")
+            print("Arrow object expression compiler: FAILED")
+            return False
+        if mapped is not None and mapped.to_pylist() != expected:
+            print(f"  {source}: {mapped.to_pylist()} != {expected}")
+            print("Arrow object expression compiler: FAILED")
+            return False
+        print(f"  {source}: OK")
+
+    print("Arrow object expression compiler: PASSED")
+    return True
+
+
+def test_in_place_object_expr():
+    """Test that in-place map objects match the copying transforms."""
+    from reter_code.dsl.core import Context
+
+    print("\n" + "=" * 60)
+    print("TEST: In-place Object Expression")
+    print("=" * 60)
+
+    ctx = Context(reter=None, params={"kind": "Method"})
+    rows = [{"a": 1, "b": 2, "name": "run"}, {"a": 3, "b": 4, "name": "{x}"}]
+    objects = [
+        ('...row, issue: "dup", message: "{kind} {name} {issue}"', True),
+        ('...row, a: b, b: a', True),  # Values read the unchanged row
+        ('...row, ...name', False),
+        ('issue: "dup", ...row', False),
+    ]
+
+    for source, in_place in objects:
+        result = parse_cadsl(
+            "query test() { reql { SELECT ?x WHERE { ?x type class } } "
+            f"| map {{ {source} }} | emit {{ results }} }}"
+        )
+        if not result.success:
+            print(f"Parse failed: {result.errors}")
+            return False
+
+        node = [s for s in transform_cadsl(result.tree)[0].steps if s["type"] == "map"][0]["_object_node"]
+        expected = [ObjectExprCompiler().compile(node)(dict(r), ctx) for r in rows]
+        owned = [dict(r) for r in rows]
+        mapped = [ObjectExprCompiler().compile(node, in_place=True)(r, ctx) for r in owned]
+
+        if mapped != expected or all(m is o for m, o in zip(mapped, owned)) != in_place:
+            print(f"  {source}: {mapped} != {expected} (in place: {in_place})")
+            print("In-place object expression: FAILED")
+            return False
+        print(f"  {source}: OK")
+
+    print("In-place object expression: PASSED")
+    return True
+
+
+def test_precompiled_templates():
+    """Test that precompiled "text {field}" values match two-pass interpolation."""
+    from reter_code.dsl.core import Context
+
+    print("\n" + "=" * 60)
+    print("TEST: Precompiled Templates")
+    print("=" * 60)
+
+    rows = [{"name": "run", "line": 3, "kind": "row"}, {"name": "{line}"}, "not a row"]
+    contexts = [
+        Context(reter=None, params={"kind": "Method"}),
+        Context(reter=None, params={"kind": "{name}"}),  # Braces in a param
+        None,
+    ]
+    templates = ["{kind} {name} at {line} ({missing})", "{{kind}}", "no fields"]
+
+    compiler = ObjectExprCompiler()
+    for template in templates:
+        result = parse_cadsl(
+            "query test() { reql { SELECT ?x WHERE { ?x type class } } "
+            f'| map {{ message: "{template}" }} | emit {{ results }} }}'
+        )
+        if not result.success:
+            print(f"Parse failed: {result.errors}")
+            return False
+
+        node = [s for s in transform_cadsl(result.tree)[0].steps if s["type"] == "map"][0]["_object_node"]
+        transform = compiler.compile(node)
+        literal = compiler.expr_compiler.compile(node.children[0].children[1])
+        for ctx in contexts:
+            for row in rows:
+                expected = compiler._interpolate(literal(row, ctx), row, ctx)
+                actual = transform(row, ctx)["message"]
+                if actual != expected:
+                    print(f"  {template!r}: {actual!r} != {expected!r}")
+                    print("Precompiled templates: FAILED")
+                    return False
+        print(f"  {template!r}: OK")
+
+    print("Precompiled templates: PASSED")
+    return True
+
+
+def test_batch_map():
+    """Test that the whole-list map matches the copying per-row transform."""
+    import copy
+    from reter_code.dsl.core import Context
+
+    print("\n" + "=" * 60)
+    print("TEST: Batch Map")
+    print("=" * 60)
+
+    result = parse_cadsl(
+        "query test() { reql { SELECT ?x WHERE { ?x type class } } "
+        '| map { ...row, refactoring: "inline_method", count: 2, name: "x", '
+        'message: "Method {name} has {count} calls", scope: "{kind}/{name}", '
+        "kind: kind } "
+        "| emit { results } }"
+    )
+    if not result.success:
+        print(f"Parse failed: {result.errors}")
+        return False
+
+    node = [s for s in transform_cadsl(result.tree)[0].steps if s["type"] == "map"][0]["_object_node"]
+    compiler = ObjectExprCompiler()
+    transform = compiler.compile(node)
+    batch = compiler.compile_batch(node)
+    if batch is None:
+        print("  compile_batch returned None")
+        return False
+
+    contexts = [
+        Context(reter=None, params={"kind": "param"}),
+        Context(reter=None, params={"kind": "{name}"}),  # Braces in a param
+    ]
+    for ctx in contexts:
+        for rows in ([], [{"name": "run", "count": 1.5, "kind": "m"}, {"name": "go"}],
+                     [{"name": "run"}, "not a row"]):
+            expected = [transform(row, ctx) for row in rows]
+            actual = batch(copy.deepcopy(rows), ctx)
+            if actual != expected or [list(r) for r in actual if isinstance(r, dict)] != \
+                    [list(r) for r in expected if isinstance(r, dict)]:
+                print(f"  {actual!r} != {expected!r}")
+                print("Batch map: FAILED")
+                return False
+
+    if compiler.compile_batch(node, in_place=False) is not None:
+        print("  Expected no batch form of ...row for rows the caller does not own")
+        return False
+
+    # Named fields only: fresh rows, the input is left as it was
+    result = parse_cadsl(
+        "query test() { reql { SELECT ?x WHERE { ?x type class } } "
+        '| map { name: name, issue: "god_class", count: len(matches), '
+        'message: "Class {name} has {count} methods" } | emit { results } }'
+    )
+    node = [s for s in transform_cadsl(result.tree)[0].steps if s["type"] == "map"][0]["_object_node"]
+    transform = compiler.compile(node)
+    batch = compiler.compile_batch(node, in_place=False)
+    if batch is None:
+        print("  compile_batch returned None without ...row")
+        return False
+    for ctx in contexts:
+        rows = [{"name": "A", "count": 3, "matches": [1, 2]}, {"name": "{x}", "matches": []}]
+        before = copy.deepcopy(rows)
+        expected = [transform(row, ctx) for row in rows]
+        actual = batch(rows, ctx)
+        if actual != expected or rows != before:
+            print(f"  {actual!r} != {expected!r}")
+            print("Batch map: FAILED")
+            return False
+
+    print("Batch map: PASSED")
+    return True
+
+
+def test_set_similarity():
+    """Test that scored-only set similarity matches the set path for every type."""
+    import random
+    from reter_code.cadsl.transformer import SetSimilarityStep
+
+    print("\n" + "=" * 60)
+    print("TEST: Set Similarity")
+    print("=" * 60)
+
+    random.seed(7)
+    names = [f"m{i}" for i in range(40)]
+    values = [random.sample(names, random.randint(0, 8)) for _ in range(12)]
+    values += [["a", "a"], "a", None, []]
+    rows = [{"left": random.choice(values), "right": random.choice(values)}
+            for _ in range(200)]
+
+    # Bit vectors for a small universe, frozensets once it exceeds MAX_MASK_BITS
+    for max_bits in (SetSimilarityStep.MAX_MASK_BITS, 8):
+        for sim_type in ("jaccard", "dice", "overlap", "cosine"):
+            step = SetSimilarityStep("left", "right", sim_type)
+            step.MAX_MASK_BITS = max_bits
+            actual = step.execute(rows).unwrap()
+            # Asking for the intersection forces the per-row set path
+            expected = SetSimilarityStep(
+                "left", "right", sim_type, intersection_output="shared"
+            ).execute(rows).unwrap()
+            if [r["similarity"] for r in actual] != [r["similarity"] for r in expected]:
+                print(f"  {sim_type} (max_bits={max_bits}) differs from the set path")
+                print("Set similarity: FAILED")
+                return False
+            if any("shared" in r for r in actual):
+                print("  Unexpected element output")
+                return False
+
+    print("Set similarity: PASSED")
+    return True
+
+
+def test_levenshtein():
+    """Test the trimmed Levenshtein distance against the full DP table."""
+    import random
+    from reter_code.cadsl.transformer import StringMatchStep
+
+    print("\n" + "=" * 60)
+    print("TEST: Levenshtein")
+    print("=" * 60)
+
+    def reference(s1, s2):
+        prev = list(range(len(s2) + 1))
+        for i, c1 in enumerate(s1, 1):
+            curr = [i]
+            for j, c2 in enumerate(s2, 1):
+                curr.append(min(prev[j] + 1, curr[j - 1] + 1, prev[j - 1] + (c1 != c2)))
+            prev = curr
+        return prev[-1]
+
+    random.seed(3)
+    words = ["", "a", "get_x", "get_y", "set_value", "value", "aaa", "abab", "baba"]
+    words += ["".join(random.choice("ab_") for _ in range(random.randint(0, 9)))
+              for _ in range(40)]
+    for s1 in words:
+        for s2 in words:
+            if StringMatchStep._levenshtein(s1, s2) != reference(s1, s2):
+                print(f"  {s1!r} vs {s2!r}: {StringMatchStep._levenshtein(s1, s2)}"
+                      f" != {reference(s1, s2)}")
+                print("Levenshtein: FAILED")
+                return False
+
+    print("Levenshtein: PASSED")
+    return True
+
+
+def test_collect_arrow():
+    """Test that Arrow collect with composite keys matches the row path."""
+    import pyarrow as pa
+    from reter_code.cadsl.steps.data_flow import CollectStep
+
+    print("\n" + "=" * 60)
+    print("TEST: Collect Arrow")
+    print("=" * 60)
+
+    rows = [
+        {"c1": "A", "c2": "B", "name": "x", "line": 3},
+        {"c1": "A", "c2": "C", "name": "y", "line": 1},
+        {"c1": "A", "c2": "B", "name": "z", "line": 7},
+        {"c1": "B", "c2": "B", "name": "x", "line": 2},
+        {"c1": "A", "c2": "B", "name": "x", "line": 5},
+    ]
+    step = CollectStep(["c1", "c2"], {
+        "first_name": ("name", "first"),
+        "shared": ("name", "count"),
+        "total": ("line", "sum"),
+    })
+    arrow = step.execute(pa.Table.from_pylist(rows)).unwrap()
+    if not isinstance(arrow, pa.Table):
+        print(f"  Arrow input fell back to the row path: {type(arrow)}")
+        print("Collect Arrow: FAILED")
+        return False
+    expected = step.execute(rows).unwrap()
+    if arrow.to_pylist() != expected:
+        print(f"  Arrow: {arrow.to_pylist()}")
+        print(f"  Rows:  {expected}")
+        print("Collect Arrow: FAILED")
+        return False
+    if [r["first_name"] for r in expected] != ["x", "y", "x"]:
+        print(f"  Unexpected first values: {expected}")
+        print("Collect Arrow: FAILED")
+        return False
+
+    print("Collect Arrow: PASSED")
+    return True
+
+
+def test_common_affix():
+    """Test the affix modes of string_match against the per-length loops."""
+    import random
+    from reter_code.cadsl.transformer import StringMatchStep
+
+    print("\n" + "=" * 60)
+    print("TEST: Common Affix")
+    print("=" * 60)
+
+    def reference(left, right, match_type, min_length):
+        shorter = min(len(left), len(right))
+        if match_type in ("common_affix", "common_prefix"):
+            for plen in range(min_length, shorter + 1):
+                s1, s2 = left[plen:], right[plen:]
+                if left[:plen] == right[:plen] and s1 and s2 and s1 != s2:
+                    return True, f"prefix:{left[:plen]}"
+        if match_type in ("common_affix", "common_suffix"):
+            for slen in range(min_length, shorter + 1):
+                p1, p2 = left[:-slen], right[:-slen]
+                if left[-slen:] == right[-slen:] and p1 and p2 and p1 != p2:
+                    return True, f"suffix:{left[-slen:]}"
+        return False, None
+
+    random.seed(5)
+    words = ["", "a", "get_x", "get_y", "set_x", "get_value", "value", "aaa", "aab"]
+    words += ["".join(random.choice("ab_") for _ in range(random.randint(0, 7)))
+              for _ in range(30)]
+    rows = [{"left": l, "right": r} for l in words for r in words]
+    for match_type in ("common_affix", "common_prefix", "common_suffix"):
+        for min_length in range(5):
+            step = StringMatchStep("left", "right", match_type, min_length,
+                                   output="hit", match_output="affix")
+            for row in step.execute(rows).unwrap():
+                expected = reference(row["left"], row["right"], match_type, min_length)
+                if (row["hit"], row.get("affix")) != expected:
+                    print(f"  {match_type} (min_length={min_length}) "
+                          f"{row['left']!r} vs {row['right']!r}: "
+                          f"{(row['hit'], row.get('affix'))} != {expected}")
+                    print("Common affix: FAILED")
+                    return False
+
+    print("Common affix: PASSED")
+    return True
+
+
+def test_graph_closure_cache():
+    """Test that graph closures are memoized per edge list and copied out."""
+    from collections import OrderedDict
+    from reter_code.cadsl.steps.graph import GraphClosureStep
+
+    print("\n" + "=" * 60)
+    print("TEST: Graph Closure Cache")
+    print("=" * 60)
+
+    class CountingClosure(GraphClosureStep):
+        _cache = OrderedDict()  # Isolated from other tests
+        computed = 0
+
+        def _closure(self, edges):
+            CountingClosure.computed += 1
+            return super()._closure(edges)
+
+    edges = [{"a": "A", "b": "B"}, {"a": "B", "b": "C"}]
+    step = CountingClosure("a", "b")
+    first = step.execute(edges).unwrap()
+    first[0]["reachable"].append("mutated")
+    second = step.execute(list(edges)).unwrap()
+    if CountingClosure.computed != 1 or "mutated" in second[0]["reachable"]:
+        print(f"  Computed {CountingClosure.computed} times: {second}")
+        print("Graph closure cache: FAILED")
+        return False
+
+    # New edges or another depth get their own closure
+    step.execute(edges + [{"a": "C", "b": "D"}])
+    CountingClosure("a", "b", max_depth=1).execute(edges)
+    if CountingClosure.computed != 3:
+        print(f"  Computed {CountingClosure.computed} times, expected 3")
+        print("Graph closure cache: FAILED")
+        return False
+
+    print("Graph closure cache: PASSED")
+    return True
+
+
+def test_rag_enrich_shared_queries():
+    """Test that rag_enrich searches each distinct query once and fans it out."""
+    from reter_code.cadsl.transformer import RagEnrichStep
+    from reter_code.dsl.core import Context
+
+    print("\n" + "=" * 60)
+    print("TEST: RAG Enrich Shared Queries")
+    print("=" * 60)
+
+    class CountingRag:
+        def __init__(self):
+            self.calls = []
+
+        def search(self, query, top_k, entity_types):
+            self.calls.append(query)
+            return [{"name": f"match:{query}", "score": 0.9}], {}
+
+    rows = [{"name": n} for n in ("a", "b", "a", "c", "a", "b", "c")]
+    rag = CountingRag()
+    ctx = Context(reter=None, params={"rag_manager": rag})
+    # A batch size of 2 splits duplicates across batches
+    step = RagEnrichStep("find {name}", mode="all", batch_size=2)
+    result = step.execute(rows, ctx).unwrap()
+
+    if sorted(rag.calls) != ["find a", "find b", "find c"]:
+        print(f"  Searched {rag.calls}")
+        print("RAG enrich shared queries: FAILED")
+        return False
+    for row in result:
+        if row["rag_matches"] != [{"name": f"match:find {row['name']}", "score": 0.9}]:
+            print(f"  Wrong matches for {row}")
+            print("RAG enrich shared queries: FAILED")
+            return False
+
+    print("RAG enrich shared queries: PASSED")
+    return True
+
+
 # ============================================================
 # TRANSFORMER TESTS
 # ============================================================
@@ -457,6 +1024,18 @@ def run_all_tests() -> int:
     tests = [
         test_expression_compiler,
         test_object_expression,
+        test_arrow_condition_compiler,
+        test_arrow_expression_compiler,
+        test_arrow_object_expr_compiler,
+        test_in_place_object_expr,
+        test_precompiled_templates,
+        test_batch_map,
+        test_collect_arrow,
+        test_set_similarity,
+        test_levenshtein,
+        test_common_affix,
+        test_graph_closure_cache,
+        test_rag_enrich_shared_queries,
         test_transform_simple_query,
         test_transform_detector,
         test_transform_python_step,
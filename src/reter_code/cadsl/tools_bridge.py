@@ -12,10 +12,14 @@ Usage:
     result = diagrams.class_diagram(ctx)
 """
 
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from copy import deepcopy
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from dataclasses import dataclass, field
 import logging
+import threading
 
 from .loader import (
     load_tools_directory,
@@ -64,6 +68,149 @@ class RegistryToolSpec:
 
 CADSL_TOOLS_DIR = Path(__file__).parent / "tools"
 
+# Step types whose output depends only on their input rows and params.
+# Tools made only of these (over a REQL source) can have results memoized.
+PURE_STEP_TYPES = frozenset({
+    "filter", "select", "map", "flat_map", "order_by", "limit", "offset",
+    "group_by", "aggregate", "flatten", "unique", "collect", "compute",
+    "cross_join", "set_similarity", "when", "unless", "branch", "catch",
+    "render", "render_chart", "render_mermaid", "emit",
+})
+
+RESULT_CACHE_SIZE = 256
+
+
+# ============================================================
+# SHARED SPEC CACHE
+# ============================================================
+
+# .cadsl file path -> (stat stamp, specs, {tool_name: pipeline factory}).
+# Process-wide, so every tool module and the execute_cadsl handler share
+# one parse per file.
+_spec_cache: Dict[Path, Tuple[Tuple[int, int], list, Dict[str, Callable]]] = {}
+
+
+def load_cadsl_specs(cadsl_file: Path) -> Tuple[list, Dict[str, Callable]]:
+    """
+    Parse and transform a .cadsl file, reusing the cached result while
+    the file is unchanged on disk.
+
+    Returns:
+        Tuple of (tool specs, {tool_name: pipeline factory})
+
+    Raises:
+        ValueError: If the file fails to parse or its tools fail to build
+    """
+    stat = cadsl_file.stat()
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    cached = _spec_cache.get(cadsl_file)
+    if cached is not None and cached[0] == stamp:
+        return cached[1], cached[2]
+
+    result = parse_cadsl_file(cadsl_file)
+    if not result.success:
+        raise ValueError(f"Parse error: {result.errors}")
+
+    try:
+        transformer = CADSLTransformer()
+        specs = transformer.transform(result.tree)
+        factories = {spec.name: build_pipeline_factory(spec) for spec in specs}
+    except Exception as e:
+        # E.g. an invalid regex in a filter; callers only handle ValueError
+        raise ValueError(f"Build error: {e}") from e
+
+    _spec_cache[cadsl_file] = (stamp, specs, factories)
+    return specs, factories
+
+
+def clear_spec_cache(directory: Optional[Path] = None) -> None:
+    """Drop cached specs, either all of them or those under ``directory``."""
+    if directory is None:
+        _spec_cache.clear()
+        return
+    for path in [p for p in _spec_cache if directory in p.parents]:
+        del _spec_cache[path]
+
+
+def _is_memoizable(spec) -> bool:
+    """True if a tool's result is determined by its params and the network."""
+    if spec.source_type != "reql":
+        return False
+
+    def pure(value) -> bool:
+        if isinstance(value, dict):
+            if "type" in value and value["type"] not in PURE_STEP_TYPES:
+                return False
+            return all(pure(v) for v in value.values())
+        if isinstance(value, (list, tuple)):
+            return all(pure(v) for v in value)
+        return True
+
+    return all(pure(step) for step in spec.steps)
+
+
+def _freeze(value):
+    """Convert params to a hashable cache key."""
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple, set)):
+        return tuple(_freeze(v) for v in value)
+    hash(value)
+    return value
+
+
+_SCALAR_TYPES = (str, int, float, bool, type(None))
+
+
+class _PackedRows:
+    """Cached row list stored as one key tuple plus a value tuple per row.
+
+    A tuple of scalars is less than half the size of the equivalent dict
+    and, being immutable, needs no deep copy on the way in or out.
+    """
+    __slots__ = ("keys", "rows")
+
+    def __init__(self, keys: tuple, rows: list):
+        self.keys = keys
+        self.rows = rows
+
+    @classmethod
+    def pack(cls, value) -> Optional["_PackedRows"]:
+        """Pack a list of flat dicts sharing one key order, else None."""
+        if not isinstance(value, list) or not value or not isinstance(value[0], dict):
+            return None
+        keys = tuple(value[0])
+        rows = []
+        for item in value:
+            if not isinstance(item, dict) or tuple(item) != keys:
+                return None
+            values = tuple(item.values())
+            if not all(isinstance(v, _SCALAR_TYPES) for v in values):
+                return None
+            rows.append(values)
+        return cls(keys, rows)
+
+    def unpack(self) -> List[Dict[str, Any]]:
+        keys = self.keys
+        return [dict(zip(keys, values)) for values in self.rows]
+
+
+def _pack_result(result: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy a tool result for the result cache, packing row lists."""
+    packed = {}
+    for key, value in result.items():
+        rows = _PackedRows.pack(value)
+        packed[key] = rows if rows is not None else deepcopy(value)
+    return packed
+
+
+def _unpack_result(packed: Dict[str, Any]) -> Dict[str, Any]:
+    """Rebuild a fresh, caller-owned result from a cached one."""
+    return {
+        key: value.unpack() if isinstance(value, _PackedRows) else deepcopy(value)
+        for key, value in packed.items()
+    }
+
 
 # ============================================================
 # TOOL MODULE WRAPPER
@@ -77,8 +224,10 @@ class CADSLToolModule:
         inspection.list_modules(ctx)
         smells.god_class(ctx)
 
-    Tools are loaded fresh from disk on each execution (no caching),
-    so changes to .cadsl files take effect immediately.
+    Parsed tool specs and their pipeline factories come from the shared
+    spec cache (see load_cadsl_specs) and are reused until the file's mtime
+    or size changes, so edits to .cadsl files still take effect on the next
+    execution.
 
     ::: This is-in-layer Domain-Specific-Language-Layer.
     ::: This is a loader.
@@ -90,6 +239,9 @@ class CADSLToolModule:
         self.name = name
         self.tools_path = tools_path
         self._tool_files: Dict[str, Path] = {}  # tool_name -> .cadsl file path
+        # (tool, file stamp, params, reter id, reter version) -> result
+        self._result_cache: OrderedDict = OrderedDict()
+        self._result_cache_lock = threading.Lock()  # run_many executes tools concurrently
         self._discovered = False
 
     def _discover_tools(self):
@@ -109,14 +261,9 @@ class CADSLToolModule:
             tool_name = cadsl_file.stem
             self._tool_files[tool_name] = cadsl_file
 
-            # Parse to get metadata for Registry (lightweight - just for discovery)
+            # Parse to get metadata for Registry (cached for later executions)
             try:
-                result = parse_cadsl_file(cadsl_file)
-                if not result.success:
-                    continue
-
-                transformer = CADSLTransformer()
-                specs = transformer.transform(result.tree)
+                specs, _ = load_cadsl_specs(cadsl_file)
 
                 for spec in specs:
                     # Update tool_files with actual spec name (may differ from filename)
@@ -140,7 +287,7 @@ class CADSLToolModule:
         logger.debug(f"Discovered {len(self._tool_files)} tools in {self.name}")
 
     def _parse_and_execute(self, tool_name: str, ctx) -> Dict[str, Any]:
-        """Parse a .cadsl file fresh from disk and execute it."""
+        """Execute a .cadsl tool, re-parsing the file only if it changed."""
         from reter_code.dsl.core import Context
 
         cadsl_file = self._tool_files.get(tool_name)
@@ -148,14 +295,10 @@ class CADSLToolModule:
             return {"success": False, "error": f"Tool file not found: {tool_name}"}
 
         try:
-            # Parse fresh from disk
-            result = parse_cadsl_file(cadsl_file)
-            if not result.success:
-                return {"success": False, "error": f"Parse error: {result.errors}"}
-
-            # Transform to executable spec
-            transformer = CADSLTransformer()
-            specs = transformer.transform(result.tree)
+            try:
+                specs, factories = load_cadsl_specs(cadsl_file)
+            except ValueError as e:
+                return {"success": False, "error": str(e)}
 
             # Find the matching tool spec
             spec = None
@@ -187,30 +330,67 @@ class CADSLToolModule:
                 instance_name=ctx.instance_name,
             )
 
-            # Build and execute pipeline
-            factory = build_pipeline_factory(spec)
-            pipeline = factory(ctx_with_defaults)
+            cache_key = self._result_cache_key(cadsl_file, spec, ctx_with_defaults)
+            if cache_key is not None:
+                with self._result_cache_lock:
+                    cached = self._result_cache.get(cache_key)
+                    if cached is not None:
+                        self._result_cache.move_to_end(cache_key)
+                if cached is not None:
+                    return _unpack_result(cached)
+
+            # Bind params to the cached factory and execute
+            pipeline = factories[spec.name](ctx_with_defaults)
             result = pipeline.execute(ctx_with_defaults)
 
             # Unwrap PipelineResult
             if hasattr(result, 'unwrap'):
                 try:
-                    return result.unwrap()
+                    result = result.unwrap()
                 except Exception as e:
                     return {"success": False, "error": str(e)}
 
+            if cache_key is not None and isinstance(result, dict) and result.get("success", True):
+                try:
+                    cached = _pack_result(result)
+                except TypeError:
+                    pass  # e.g. lazily emitted row streams
+                else:
+                    with self._result_cache_lock:
+                        self._result_cache[cache_key] = cached
+                        if len(self._result_cache) > RESULT_CACHE_SIZE:
+                            self._result_cache.popitem(last=False)
+
             return result
 
         except Exception as e:
             logger.exception(f"Error executing CADSL tool {tool_name}")
             return {"success": False, "error": str(e)}
 
+    def _result_cache_key(self, cadsl_file: Path, spec, ctx) -> Optional[tuple]:
+        """
+        Build the memoization key for a tool call, or None if the call
+        must not be memoized (impure steps, unversioned or unhashable input).
+        """
+        version = getattr(ctx.reter, "version", None)
+        token = getattr(ctx.reter, "instance_token", None)
+        if version is None or token is None or not _is_memoizable(spec):
+            return None
+        try:
+            params = _freeze(ctx.params)
+        except TypeError:
+            return None
+        cached = _spec_cache.get(cadsl_file)
+        if cached is None:
+            return None
+        return (spec.name, cached[0], params, token, version)
+
     def _make_executor(self, tool_name: str) -> Callable:
-        """Create an executor function that parses fresh from disk on each call."""
+        """Create an executor function that picks up on-disk edits on each call."""
         module = self  # Capture reference for closure
 
         def executor(ctx):
-            """Execute the CADSL tool (parsed fresh from disk)."""
+            """Execute the CADSL tool (re-parsed if the file changed)."""
             from reter_code.dsl.core import Context
 
             if not isinstance(ctx, Context):
@@ -253,20 +433,18 @@ class CADSLToolModule:
         return None
 
     def get_tool_spec(self, name: str) -> Optional[Dict[str, Any]]:
-        """Get tool specification metadata (parses file fresh)."""
+        """Get tool specification metadata (re-parsed if the file changed)."""
         self._discover_tools()
         cadsl_file = self._tool_files.get(name)
         if not cadsl_file:
             return None
 
         try:
-            result = parse_cadsl_file(cadsl_file)
-            if not result.success:
+            try:
+                specs, _ = load_cadsl_specs(cadsl_file)
+            except ValueError:
                 return None
 
-            transformer = CADSLTransformer()
-            specs = transformer.transform(result.tree)
-
             for spec in specs:
                 if spec.name == name:
                     return {
@@ -299,6 +477,22 @@ class CADSLToolModule:
         self._discover_tools()
         return list(self._tool_files.keys())
 
+    def list_detectors(self) -> List[str]:
+        """List the read-only detectors (detectors that create no tasks)."""
+        names = []
+        for name in self.list_tools():
+            try:
+                specs, _ = load_cadsl_specs(self._tool_files[name])
+            except (OSError, ValueError):
+                continue
+            spec = next((s for s in specs if s.name == name), None)
+            if spec is None or spec.tool_type != "detector":
+                continue
+            if any(step.get("type") == "create_task" for step in spec.steps):
+                continue
+            names.append(name)
+        return names
+
     def rescan(self) -> Dict[str, Any]:
         """
         Rescan the tools directory for new/removed .cadsl files.
@@ -309,6 +503,9 @@ class CADSLToolModule:
         old_tools = set(self._tool_files.keys())
         self._discovered = False
         self._tool_files.clear()
+        clear_spec_cache(self.tools_path)
+        with self._result_cache_lock:
+            self._result_cache.clear()
         self._discover_tools()
         new_tools = set(self._tool_files.keys())
 
@@ -363,19 +560,103 @@ def get_tool(name: str) -> Optional[Callable]:
 
 
 def execute_tool(name: str, ctx) -> Dict[str, Any]:
-    """Execute a tool by name (parses fresh from disk)."""
+    """Execute a tool by name (re-parsed only if its file changed)."""
     tool = get_tool(name)
     if tool is None:
         return {"success": False, "error": f"Tool not found: {name}"}
     return tool(ctx)
 
 
+def _run_batch(
+    calls: List[Any],
+    ctx,
+    lookup: Callable[[str], Optional[Callable]],
+    max_workers: Optional[int],
+) -> Dict[str, Dict[str, Any]]:
+    """Run tools concurrently, resolving each name with ``lookup``."""
+    normalized = []
+    for call in calls:
+        if isinstance(call, str):
+            normalized.append((call, {}))
+        else:
+            name, params = call
+            normalized.append((name, dict(params or {})))
+
+    if not normalized:
+        return {}
+
+    def run_one(name: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        tool = lookup(name)
+        if tool is None:
+            return {"success": False, "error": f"Tool not found: {name}"}
+        return tool(ctx.with_params(**params))
+
+    workers = max_workers or min(len(normalized), 8)
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="cadsl") as pool:
+        futures = [(name, pool.submit(run_one, name, params)) for name, params in normalized]
+        results = {}
+        for name, future in futures:
+            try:
+                results[name] = future.result()
+            except Exception as e:
+                logger.exception(f"Error executing CADSL tool {name}")
+                results[name] = {"success": False, "error": str(e)}
+    return results
+
+
+def run_many(
+    calls: List[Any],
+    ctx,
+    max_workers: Optional[int] = None,
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Execute several tools concurrently against the same RETER instance.
+
+    Intended for report-style callers that run many read-only tools
+    back-to-back (architecture, classes, imports, ...). ReterWrapper runs
+    one query at a time, so what overlaps is the pipeline work around the
+    queries; identical queries are executed once and the query and result
+    caches are shared and lock-protected.
+
+    Args:
+        calls: Tool names, or ``(name, params)`` tuples. ``params`` are
+            layered over ``ctx.params`` for that call only.
+        ctx: Base Context (its reter is shared by every call)
+        max_workers: Thread pool size (defaults to one per call, max 8)
+
+    Returns:
+        Dict mapping tool name to its result. Later calls of the same
+        name overwrite earlier ones.
+    """
+    return _run_batch(calls, ctx, get_tool, max_workers)
+
+
+def run_detectors(
+    module: CADSLToolModule,
+    ctx,
+    max_workers: Optional[int] = None,
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Run every read-only detector of one module as a single batch.
+
+    E.g. ``run_detectors(refactoring, ctx)`` for a full refactoring
+    report. The detectors run concurrently like run_many and share the
+    REQL result cache, so identical queries are executed once. Detectors
+    that create tasks, and files that fail to load, are left out.
+
+    Returns:
+        Dict mapping detector name to its result
+    """
+    return _run_batch(module.list_detectors(), ctx, module.get_tool, max_workers)
+
+
 def rescan_all() -> Dict[str, Any]:
     """
     Rescan all tool directories for new/removed .cadsl files.
 
     Note: This is only needed if you add/remove .cadsl files.
-    Edits to existing files are picked up automatically on each execution.
+    Edits to existing files are picked up automatically on the next
+    execution (cached specs are keyed by file mtime and size).
 
     Returns:
         Dict with scan results for each module
@@ -412,7 +693,11 @@ __all__ = [
     "get_all_tools",
     "get_tool",
     "execute_tool",
+    "run_many",
+    "run_detectors",
     "rescan_all",
+    "load_cadsl_specs",
+    "clear_spec_cache",
     # Classes
     "CADSLToolModule",
 ]
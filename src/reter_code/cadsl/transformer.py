@@ -7,6 +7,8 @@ that can be run against a RETER instance.
 
 from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 from dataclasses import dataclass, field
+from functools import lru_cache
+from itertools import chain
 import textwrap
 
 from lark import Tree, Token
@@ -18,6 +20,7 @@ from .compiler import (
     ExpressionCompiler,
     ConditionCompiler,
     ObjectExprCompiler,
+    ArrowExpressionCompiler,
     unquote,
 )
 from .utils import get_tool_name, get_tool_type
@@ -837,7 +840,7 @@ class CADSLTransformer:
                 return {
                     "type": "filter",
                     "predicate": predicate,
-                    "_condition_node": child,  # For debugging
+                    "_condition_node": child,  # Compiled to Arrow by the loader
                 }
         return {"type": "filter", "predicate": lambda r, ctx=None: True}
 
@@ -886,17 +889,13 @@ class CADSLTransformer:
             def make_transform(fields_map, expr_map):
                 def transform(row, ctx=None):
                     result = {}
-                    # Copy selected/renamed fields (handle ?-prefixed REQL keys)
+                    # Copy selected/renamed fields
                     for out_name, src_name in fields_map.items():
                         clean_out = out_name.lstrip("?")
                         if src_name in row:
                             result[clean_out] = row[src_name]
-                        elif not src_name.startswith("?") and f"?{src_name}" in row:
-                            result[clean_out] = row[f"?{src_name}"]
                         elif out_name in row:
                             result[clean_out] = row[out_name]
-                        elif not out_name.startswith("?") and f"?{out_name}" in row:
-                            result[clean_out] = row[f"?{out_name}"]
                     # Add computed expressions
                     for out_name, expr_func in expr_map.items():
                         try:
@@ -916,7 +915,11 @@ class CADSLTransformer:
         obj_expr = self._find_child(node, "object_expr")
         if obj_expr:
             transform = compile_object_expr(obj_expr)
-            return {"type": "map", "transform": transform}
+            return {
+                "type": "map",
+                "transform": transform,
+                "_object_node": obj_expr,  # Compiled to Arrow by the loader
+            }
 
         return {"type": "map", "transform": lambda r, ctx=None: r}
 
@@ -1336,14 +1339,20 @@ class CADSLTransformer:
     def _transform_compute_step(self, node: Tree) -> Dict[str, Any]:
         """Transform compute step: compute { ratio: a / b, pct: ratio * 100 }"""
         computations = {}
+        expression_nodes = {}
 
         for child in node.children:
             if isinstance(child, Tree) and child.data == "compute_field":
                 name = str(child.children[0])
                 expr = compile_expression(child.children[1])
                 computations[name] = expr
+                expression_nodes[name] = child.children[1]
 
-        return {"type": "compute", "computations": computations}
+        return {
+            "type": "compute",
+            "computations": computations,
+            "_expression_nodes": expression_nodes,  # Compiled to Arrow by ComputeStep
+        }
 
     def _transform_collect_step(self, node: Tree) -> Dict[str, Any]:
         """Transform collect step: collect { by: field, name: op(field) }"""
@@ -1355,6 +1364,8 @@ class CADSLTransformer:
                     if isinstance(param, Tree):
                         if param.data == "collect_by":
                             result["by"] = str(param.children[0])
+                        elif param.data == "collect_by_multi":
+                            result["by"] = [str(c) for c in param.children]
                         elif param.data == "collect_field":
                             # name: op(field)
                             name = str(param.children[0])
@@ -2645,6 +2656,30 @@ class BlockBetaConfig:
     max_per_group: int = 20
 
 
+@dataclass(slots=True)
+class _ClassMembers:
+    """Methods and attributes collected for one class of a class diagram.
+
+    ::: This is-in-layer Domain-Specific-Language-Layer.
+    ::: This is a value-object.
+    """
+    methods: set = field(default_factory=set)
+    attributes: set = field(default_factory=set)
+
+
+@lru_cache(maxsize=256)
+def _sequence_header(participants: Tuple[str, ...]) -> str:
+    """Render the header and participant block for a sorted participant tuple.
+
+    Sequence diagrams are re-rendered with the same participants and only
+    different messages, so the header is cached per participant set.
+    """
+    lines = ["sequenceDiagram"]
+    for p in participants:
+        lines.append(f"    participant {p.replace(' ', '_')} as {p}")
+    return "\n".join(lines)
+
+
 @dataclass
 class MermaidConfig:
     """Unified configuration for all Mermaid diagram types.
@@ -2856,7 +2891,6 @@ class RenderMermaidStep:
     def _render_sequence(self, data):
         """Render a sequence diagram."""
         seq = self.config.sequence
-        lines = ["sequenceDiagram"]
 
         # Collect participants
         participants = set()
@@ -2873,17 +2907,15 @@ class RenderMermaidStep:
             elif seq.participants:
                 participants.add(row.get(seq.participants))
 
-        # Render participants
-        for p in sorted(participants):
-            if p:
-                safe_p = str(p).replace(" ", "_")
-                lines.append(f"    participant {safe_p} as {p}")
+        # Render participants (cached per participant set)
+        lines = [_sequence_header(tuple(str(p) for p in sorted(participants) if p))]
 
-        # Render messages
-        for from_val, to_val, label in messages:
-            safe_from = str(from_val).replace(" ", "_")
-            safe_to = str(to_val).replace(" ", "_")
-            lines.append(f"    {safe_from}->>+{safe_to}: {label}")
+        # Render messages in row order, escaping each participant name once
+        safe = {p: str(p).replace(" ", "_") for p in participants}
+        lines.extend(
+            f"    {safe[from_val]}->>+{safe[to_val]}: {label}"
+            for from_val, to_val, label in messages
+        )
 
         return "\n".join(lines)
 
@@ -2903,20 +2935,21 @@ class RenderMermaidStep:
             if not class_name:
                 continue
 
-            if class_name not in class_info:
-                class_info[class_name] = {"methods": set(), "attributes": set()}
+            info = class_info.get(class_name)
+            if info is None:
+                info = class_info[class_name] = _ClassMembers()
 
             # Collect methods
             if cd.methods:
                 method = row.get(cd.methods)
                 if method:
-                    class_info[class_name]["methods"].add(method)
+                    info.methods.add(method)
 
             # Collect attributes
             if cd.attributes:
                 attr = row.get(cd.attributes)
                 if attr:
-                    class_info[class_name]["attributes"].add(attr)
+                    info.attributes.add(attr)
 
             # Collect inheritance
             if cd.inheritance_from and cd.inheritance_to:
@@ -2960,9 +2993,9 @@ class RenderMermaidStep:
             info = class_info[cls_name]
             safe_name = str(cls_name).replace(" ", "_").replace("-", "_").replace(".", "_")
             lines.append(f"    class {safe_name} {LBRACE}")
-            for attr in sorted(info["attributes"]):
+            for attr in sorted(info.attributes):
                 lines.append(f"        +{attr}")
-            for method in sorted(info["methods"]):
+            for method in sorted(info.methods):
                 lines.append(f"        +{method}()")
             lines.append(f"    {RBRACE}")
 
@@ -3269,20 +3302,29 @@ class ComputeStep:
 
     Syntax: compute { ratio: a / b, pct: ratio * 100 }
 
+    Arrow input is computed column-at-a-time when every expression has an
+    Arrow equivalent (see ArrowExpressionCompiler); otherwise per row.
+
     ::: This is-in-layer Domain-Specific-Language-Layer.
     ::: This is a step.
     ::: This is-in-process Main-Process.
     ::: This is stateless.
     """
 
-    def __init__(self, computations):
+    def __init__(self, computations, expression_nodes=None):
         self.computations = computations
+        self.expression_nodes = expression_nodes or {}
 
     def execute(self, data, ctx=None):
         """Execute field computation."""
         from reter_code.dsl.core import pipeline_ok, pipeline_err
 
         try:
+            if hasattr(data, 'column_names'):
+                result = self._compute_arrow(data, ctx)
+                if result is not None:
+                    return pipeline_ok(result)
+
             # Convert to list if Arrow table
             if hasattr(data, 'to_pylist'):
                 data = data.to_pylist()
@@ -3302,6 +3344,34 @@ class ComputeStep:
         except Exception as e:
             return pipeline_err("compute", f"Compute failed: {e}", e)
 
+    def _compute_arrow(self, table, ctx):
+        """
+        Add the computed columns to an Arrow table.
+
+        Returns None if any expression cannot be vectorized or fails,
+        in which case the caller falls back to the row-by-row path.
+        """
+        import pyarrow as pa
+
+        if set(self.expression_nodes) != set(self.computations):
+            return None
+
+        for name in self.computations:
+            kernel = ArrowExpressionCompiler(table.schema, ctx).compile(
+                self.expression_nodes[name]
+            )
+            if kernel is None:
+                return None
+            try:
+                column = kernel(table)
+            except (pa.ArrowInvalid, pa.ArrowNotImplementedError, pa.ArrowTypeError):
+                return None  # e.g. integer overflow, which Python would not hit
+            if name in table.column_names:
+                table = table.set_column(table.column_names.index(name), name, column)
+            else:
+                table = table.append_column(name, column)
+        return table
+
 
 class JoinStep:
     """
@@ -3343,6 +3413,8 @@ class JoinStep:
 
             # Execute right source
             right_data = self._execute_right_source(ctx)
+            if isinstance(right_data, pa.Table) and right_data.num_rows == 0:
+                right_data = []
             if isinstance(right_data, list):
                 if not right_data:
                     # Right side empty - return empty for inner, left data for left/outer
@@ -3723,6 +3795,9 @@ class SetSimilarityStep:
     ::: This is stateless.
     """
 
+    # Largest element universe scored with int bit vectors
+    MAX_MASK_BITS = 4096
+
     def __init__(self, left_col, right_col, sim_type="jaccard", output="similarity",
                  intersection_output=None, union_output=None):
         self.left_col = left_col
@@ -3744,6 +3819,9 @@ class SetSimilarityStep:
             if not data:
                 return pipeline_ok([])
 
+            if not (self.intersection_output or self.union_output):
+                return pipeline_ok(self._scored_rows(data))
+
             result = []
             for row in data:
                 new_row = dict(row)
@@ -3756,23 +3834,9 @@ class SetSimilarityStep:
 
                 intersection = left_set & right_set
                 union = left_set | right_set
-
-                # Calculate similarity
-                if self.sim_type == "jaccard":
-                    similarity = len(intersection) / len(union) if union else 0
-                elif self.sim_type == "dice":
-                    total = len(left_set) + len(right_set)
-                    similarity = 2 * len(intersection) / total if total else 0
-                elif self.sim_type == "overlap":
-                    min_size = min(len(left_set), len(right_set))
-                    similarity = len(intersection) / min_size if min_size else 0
-                elif self.sim_type == "cosine":
-                    denom = (len(left_set) * len(right_set)) ** 0.5
-                    similarity = len(intersection) / denom if denom else 0
-                else:
-                    similarity = len(intersection) / len(union) if union else 0
-
-                new_row[self.output] = round(similarity, 4)
+                new_row[self.output] = self._score(
+                    len(left_set), len(right_set), len(intersection)
+                )
 
                 if self.intersection_output:
                     new_row[self.intersection_output] = list(intersection)
@@ -3785,6 +3849,79 @@ class SetSimilarityStep:
         except Exception as e:
             return pipeline_err("set_similarity", f"Set similarity failed: {e}", e)
 
+    def _score(self, left_size, right_size, shared):
+        """Return the rounded similarity of two sets from their sizes."""
+        union_size = left_size + right_size - shared
+        if self.sim_type == "jaccard":
+            similarity = shared / union_size if union_size else 0
+        elif self.sim_type == "dice":
+            total = left_size + right_size
+            similarity = 2 * shared / total if total else 0
+        elif self.sim_type == "overlap":
+            min_size = min(left_size, right_size)
+            similarity = shared / min_size if min_size else 0
+        elif self.sim_type == "cosine":
+            denom = (left_size * right_size) ** 0.5
+            similarity = shared / denom if denom else 0
+        else:
+            similarity = shared / union_size if union_size else 0
+        return round(similarity, 4)
+
+    def _scored_rows(self, data):
+        """
+        Score rows when only the similarity is output, so only set sizes matter.
+
+        Each distinct column value is interned to an index once, so equal
+        values (e.g. classes with the same method names) share it and each
+        distinct pair of them is scored once, memoized on the two indices.
+        While the distinct elements fit in MAX_MASK_BITS, values are int bit
+        vectors and a pair costs an AND and a bit count; wider ints would be
+        slower than set intersection, so larger universes use frozensets.
+        """
+        index, values = {}, []
+        pairs = [
+            (self._intern(row.get(self.left_col) or [], index, values),
+             self._intern(row.get(self.right_col) or [], index, values))
+            for row in data
+        ]
+
+        elements = set(chain.from_iterable(values))
+        if len(elements) <= self.MAX_MASK_BITS:
+            bits = {element: 1 << i for i, element in enumerate(elements)}
+            members = [sum(bits[e] for e in frozenset(v)) for v in values]
+            sizes = [m.bit_count() for m in members]
+
+            def shared(i, j):
+                return (members[i] & members[j]).bit_count()
+        else:
+            members = [frozenset(v) for v in values]
+            sizes = [len(m) for m in members]
+
+            def shared(i, j):
+                return len(members[i] & members[j])
+
+        scores = {}
+        result = []
+        for row, pair in zip(data, pairs):
+            score = scores.get(pair)
+            if score is None:
+                i, j = pair
+                score = scores[pair] = self._score(sizes[i], sizes[j], shared(i, j))
+            new_row = dict(row)
+            new_row[self.output] = score
+            result.append(new_row)
+        return result
+
+    @staticmethod
+    def _intern(value, index, values):
+        """Return the index of a column value, appending unseen values to ``values``."""
+        key = tuple(value) if isinstance(value, (list, tuple, set)) else (value,)
+        i = index.get(key)
+        if i is None:
+            i = index[key] = len(values)
+            values.append(key)
+        return i
+
 
 class StringMatchStep:
     """
@@ -3836,29 +3973,25 @@ class StringMatchStep:
                 match_value = None
 
                 if self.match_type in ("common_affix", "common_prefix", "common_suffix"):
+                    # A common affix of some length implies one of every
+                    # shorter length, and with it the rests differ exactly
+                    # when the names do. So only the shortest allowed affix
+                    # is compared, and both rests must be non-empty
+                    min_len = min(len(left), len(right)) if left != right else 0
+
                     # Check prefix
                     if self.match_type in ("common_affix", "common_prefix"):
-                        min_len = min(len(left), len(right))
-                        for plen in range(self.min_length, min_len + 1):
-                            if left[:plen] == right[:plen]:
-                                # Found common prefix, check if different suffixes
-                                s1, s2 = left[plen:], right[plen:]
-                                if s1 and s2 and s1 != s2:
-                                    has_match = True
-                                    match_value = f"prefix:{left[:plen]}"
-                                    break
-
-                    # Check suffix
+                        plen = max(self.min_length, 0)
+                        if plen < min_len and left[:plen] == right[:plen]:
+                            has_match = True
+                            match_value = f"prefix:{left[:plen]}"
+
+                    # Check suffix (a length of 0 would slice the whole name)
                     if not has_match and self.match_type in ("common_affix", "common_suffix"):
-                        min_len = min(len(left), len(right))
-                        for slen in range(self.min_length, min_len + 1):
-                            if left[-slen:] == right[-slen:]:
-                                # Found common suffix, check if different prefixes
-                                p1, p2 = left[:-slen], right[:-slen]
-                                if p1 and p2 and p1 != p2:
-                                    has_match = True
-                                    match_value = f"suffix:{left[-slen:]}"
-                                    break
+                        slen = max(self.min_length, 1)
+                        if slen < min_len and left[-slen:] == right[-slen:]:
+                            has_match = True
+                            match_value = f"suffix:{left[-slen:]}"
 
                 elif self.match_type == "contains":
                     if left in right:
@@ -3884,22 +4017,46 @@ class StringMatchStep:
         except Exception as e:
             return pipeline_err("string_match", f"String match failed: {e}", e)
 
-    def _levenshtein(self, s1, s2):
-        """Calculate Levenshtein distance."""
+    @staticmethod
+    def _levenshtein(s1, s2):
+        """Calculate Levenshtein distance.
+
+        A shared prefix or suffix never changes the distance, so only the
+        differing middles go through the DP. Names compared here mostly
+        share one (get_x/get_y), which shrinks the table to a few cells.
+        """
+        if s1 == s2:
+            return 0
+        n = min(len(s1), len(s2))
+        start = 0
+        while start < n and s1[start] == s2[start]:
+            start += 1
+        end = 0
+        while end < n - start and s1[-1 - end] == s2[-1 - end]:
+            end += 1
+        s1 = s1[start:len(s1) - end]
+        s2 = s2[start:len(s2) - end]
         if len(s1) < len(s2):
-            return self._levenshtein(s2, s1)
+            s1, s2 = s2, s1
 
         if len(s2) == 0:
             return len(s1)
 
-        prev_row = range(len(s2) + 1)
-        for i, c1 in enumerate(s1):
-            curr_row = [i + 1]
+        prev_row = list(range(len(s2) + 1))
+        for i, c1 in enumerate(s1, 1):
+            curr_row = [i]
+            append = curr_row.append
+            deletions = i + 1
             for j, c2 in enumerate(s2):
+                # min(insertion, deletion, substitution) without a min() call
+                distance = prev_row[j] + (c1 != c2)
                 insertions = prev_row[j + 1] + 1
-                deletions = curr_row[j] + 1
-                substitutions = prev_row[j] + (c1 != c2)
-                curr_row.append(min(insertions, deletions, substitutions))
+                if insertions < distance:
+                    distance = insertions
+                if deletions < distance:
+                    distance = deletions
+                append(distance)
+                deletions = distance + 1
             prev_row = curr_row
 
         return prev_row[-1]
@@ -3980,18 +4137,9 @@ class RagEnrichStep:
                             f"Available fields: {list(data[0].keys())}"
                         )
 
-            # Get RAG manager from context or default instance (same pattern as RAGSearchSource)
-            rag_manager = None
-            if ctx and hasattr(ctx, 'get'):
-                rag_manager = ctx.get("rag_manager")
-            if rag_manager is None:
-                try:
-                    from reter_code.services.default_instance_manager import DefaultInstanceManager
-                    default_mgr = DefaultInstanceManager.get_instance()
-                    if default_mgr:
-                        rag_manager = default_mgr.get_rag_manager()
-                except Exception as e:
-                    logger.debug(f"Could not get RAG manager: {e}")
+            # Get RAG manager from context or default instance (same as RAGSearchSource)
+            from reter_code.dsl.core import _get_rag_manager
+            rag_manager = _get_rag_manager(ctx if ctx and hasattr(ctx, 'get') else None)
 
             if rag_manager is None:
                 return pipeline_err(
@@ -4001,6 +4149,7 @@ class RagEnrichStep:
 
             # Process in batches for performance
             result = []
+            searched = {}
             for batch_start in range(0, len(data), self.batch_size):
                 batch_end = min(batch_start + self.batch_size, len(data))
                 batch = data[batch_start:batch_end]
@@ -4012,7 +4161,7 @@ class RagEnrichStep:
                     queries.append(query)
 
                 # Execute batch search
-                batch_results = self._batch_search(rag_manager, queries, ctx)
+                batch_results = self._batch_search(rag_manager, queries, ctx, searched)
 
                 # Enrich rows with results
                 for i, row in enumerate(batch):
@@ -4061,55 +4210,63 @@ class RagEnrichStep:
 
         def replacer(match):
             field = match.group(1)
-            # Try exact field name first
             if field in row:
                 return str(row[field])
-            # Try ?-prefixed version (REQL output)
-            if f"?{field}" in row:
-                return str(row[f"?{field}"])
             return match.group(0)  # Keep original if not found
 
         return re.sub(r'\{(\w+)\}', replacer, self.query_template)
 
-    def _batch_search(self, rag_manager, queries, ctx):
-        """Execute batch RAG search. Returns list of result lists."""
+    def _batch_search(self, rag_manager, queries, ctx, searched=None):
+        """Execute batch RAG search. Returns list of result lists.
+
+        Each distinct query text is searched once: rows whose template
+        expands to the same text (e.g. a template without placeholders)
+        share its matches. Pass the same ``searched`` dict for every batch
+        to share them across batches too.
+        """
+        if searched is None:
+            searched = {}
         results = []
 
         for query in queries:
-            try:
-                # Use RAG manager's search method (returns (results, stats))
-                if hasattr(rag_manager, 'search'):
-                    search_results, stats = rag_manager.search(
-                        query=query,
-                        top_k=self.top_k,
-                        entity_types=self.entity_types
-                    )
+            if query not in searched:
+                searched[query] = self._search_one(rag_manager, query)
+            results.append(searched[query])
 
-                    # Check for errors
-                    if stats.get("error"):
-                        results.append([])
-                        continue
+        return results
 
-                    # Convert RAGSearchResult objects to dicts
-                    matches = []
-                    for r in search_results:
-                        if hasattr(r, 'to_dict'):
-                            matches.append(r.to_dict())
-                        elif isinstance(r, dict):
-                            matches.append(r)
-                        elif hasattr(r, '__dict__'):
-                            matches.append(vars(r))
-                        else:
-                            matches.append({'entity': str(r), 'similarity': 0})
-                    results.append(matches)
-                else:
-                    results.append([])
-            except Exception as e:
-                import logging
-                logging.getLogger(__name__).debug(f"RAG search failed for query '{query[:50]}...': {e}")
-                results.append([])
+    def _search_one(self, rag_manager, query):
+        """Search one query text. Returns its list of match dicts."""
+        try:
+            # Use RAG manager's search method (returns (results, stats))
+            if not hasattr(rag_manager, 'search'):
+                return []
+            search_results, stats = rag_manager.search(
+                query=query,
+                top_k=self.top_k,
+                entity_types=self.entity_types
+            )
 
-        return results
+            # Check for errors
+            if stats.get("error"):
+                return []
+
+            # Convert RAGSearchResult objects to dicts
+            matches = []
+            for r in search_results:
+                if hasattr(r, 'to_dict'):
+                    matches.append(r.to_dict())
+                elif isinstance(r, dict):
+                    matches.append(r)
+                elif hasattr(r, '__dict__'):
+                    matches.append(vars(r))
+                else:
+                    matches.append({'entity': str(r), 'similarity': 0})
+            return matches
+        except Exception as e:
+            import logging
+            logging.getLogger(__name__).debug(f"RAG search failed for query '{query[:50]}...': {e}")
+            return []
 
 
 # ============================================================
@@ -4430,8 +4587,7 @@ class CreateTaskStep:
             result = template
             for match in re.finditer(r'\{(\w+)\}', template):
                 field = match.group(1)
-                # Try both with and without ? prefix (REQL output)
-                value = row.get(field, row.get(f"?{field}", ""))
+                value = row.get(field, "")
                 result = result.replace(match.group(0), str(value) if value else "")
             return result
 
@@ -4454,7 +4610,7 @@ class CreateTaskStep:
             task_data["prompt"] = expand_template(self.prompt_template, row)
 
         if self.affects_field:
-            affects_value = row.get(self.affects_field, row.get(f"?{self.affects_field}"))
+            affects_value = row.get(self.affects_field)
             if affects_value:
                 task_data["affects"] = str(affects_value)
 
@@ -4595,13 +4751,12 @@ class FetchContentStep:
             for row in data:
                 new_row = dict(row)
 
-                # Get field values (try with and without ? prefix)
-                file_path = row.get(self.file_field) or row.get(f"?{self.file_field}")
-                start_line = row.get(self.start_line_field) or row.get(f"?{self.start_line_field}")
+                file_path = row.get(self.file_field)
+                start_line = row.get(self.start_line_field)
 
                 end_line = None
                 if self.end_line_field:
-                    end_line = row.get(self.end_line_field) or row.get(f"?{self.end_line_field}")
+                    end_line = row.get(self.end_line_field)
 
                 # Extract content
                 body = ""
@@ -4666,14 +4821,14 @@ class PythonStep:
 
     def execute(self, data, ctx=None):
         """Execute the Python code."""
-        from reter_code.dsl.core import pipeline_ok, pipeline_err
+        from reter_code.dsl.core import pipeline_ok, pipeline_err, to_list
 
         if self.compiled is None:
             return pipeline_err("python", f"Python syntax error: {self.error}")
 
         # Create execution namespace
         namespace = {
-            "rows": data,
+            "rows": to_list(data),
             "ctx": ctx,
             "result": None,
             # Common imports
@@ -26,7 +26,9 @@ from .catpy import (
     PipelineResult,
     pipeline_ok, pipeline_err,
 )
-from .core import Context
+from .core import (
+    Context, _MEMBER_FILE, _MEMBER_NAME, _bind_query, _duplicate_pair_columns, _get_rag_manager,
+)
 
 T = TypeVar("T")
 U = TypeVar("U")
@@ -107,6 +109,7 @@ class ArrowSource(ABC):
     ::: This is stateless.
     ::: This is-in-process Main-Process.
     """
+    __slots__ = ()
 
     @abstractmethod
     def execute(self, ctx: Context) -> PipelineResult[pa.Table]:
@@ -133,13 +136,8 @@ class ArrowREQLSource(ArrowSource):
     def execute(self, ctx: Context) -> PipelineResult[pa.Table]:
         """Execute REQL query and return Arrow table directly."""
         try:
-            query = self.query
-
             # Substitute parameters
-            for key, value in ctx.params.items():
-                placeholder = "{" + key + "}"
-                if placeholder in query:
-                    query = query.replace(placeholder, str(value))
+            query = _bind_query(self.query, ctx.params)
 
             # Execute query - returns PyArrow table
             table = ctx.reter.reql(query)
@@ -152,7 +150,7 @@ class ArrowREQLSource(ArrowSource):
             return pipeline_err("reql", f"Query failed: {e}", e)
 
 
-@dataclass
+@dataclass(slots=True)
 class ArrowRAGSource(ArrowSource):
     """RAG source that returns Arrow table.
 
@@ -168,14 +166,7 @@ class ArrowRAGSource(ArrowSource):
     def execute(self, ctx: Context) -> PipelineResult[pa.Table]:
         """Execute RAG operation and return Arrow table."""
         try:
-            from reter_code.services.default_instance_manager import DefaultInstanceManager
-
-            rag_manager = ctx.get("rag_manager")
-            if rag_manager is None:
-                default_mgr = DefaultInstanceManager.get_instance()
-                if default_mgr:
-                    rag_manager = default_mgr.get_rag_manager()
-
+            rag_manager = _get_rag_manager(ctx)
             if rag_manager is None:
                 return pipeline_err("rag", "RAG manager not available")
 
@@ -195,19 +186,9 @@ class ArrowRAGSource(ArrowSource):
                     exclude_same_class=self.params.get("exclude_same_class", True),
                     entity_types=self.params.get("entity_types", ["method", "function"])
                 )
-                # Flatten pairs to rows
-                data = []
-                for pair in result.get("pairs", []):
-                    e1, e2 = pair["entity1"], pair["entity2"]
-                    data.append({
-                        "similarity": pair["similarity"],
-                        "entity1_name": e1["name"],
-                        "entity1_file": e1["file"],
-                        "entity1_line": e1["line"],
-                        "entity2_name": e2["name"],
-                        "entity2_file": e2["file"],
-                        "entity2_line": e2["line"],
-                    })
+                # Flat findings, built column by column
+                columns = _duplicate_pair_columns(result.get("pairs", []), classes=False)
+                return pipeline_ok(pa.table(columns))
 
             elif self.operation == "clusters":
                 result = rag_manager.find_similar_clusters(
@@ -219,13 +200,14 @@ class ArrowRAGSource(ArrowSource):
                 )
                 data = []
                 for cluster in result.get("clusters", []):
-                    unique_files = list(set(m["file"] for m in cluster["members"]))
+                    members = cluster["members"]
                     data.append({
                         "cluster_id": cluster["cluster_id"],
                         "member_count": cluster["member_count"],
-                        "unique_files": len(unique_files),  # Count for CADSL templates
-                        "members": [m["name"] for m in cluster["members"]],
-                        "files": unique_files,
+                        # Counted by the manager on normalized paths
+                        "unique_files": cluster["unique_files"],
+                        "members": list(map(_MEMBER_NAME, members)),
+                        "files": list(dict.fromkeys(map(_MEMBER_FILE, members))),
                     })
             else:
                 return pipeline_err("rag", f"Unknown RAG operation: {self.operation}")
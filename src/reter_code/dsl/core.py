@@ -16,10 +16,16 @@ The Pipeline follows monad laws:
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+import functools
+import heapq
+import inspect
+import operator
+import re
+from dataclasses import dataclass, field, replace
+from itertools import islice
 from typing import (
     TypeVar, Generic, Callable, List, Dict, Any, Optional,
-    Union, Tuple, Iterator, Sequence
+    Union, Tuple, Iterable, Iterator, Sequence
 )
 from enum import Enum
 from abc import ABC, abstractmethod
@@ -65,6 +71,14 @@ def is_arrow(data) -> bool:
     return isinstance(data, pa.Table)
 
 
+def normalize_columns(table: pa.Table) -> pa.Table:
+    """Strip the REQL ? prefix from column names (metadata-only rename)."""
+    names = table.column_names
+    if not any(n.startswith("?") for n in names):
+        return table
+    return table.rename_columns([n.lstrip("?") for n in names])
+
+
 def resolve_column(table: pa.Table, name: str) -> Optional[str]:
     """Find column name, handling ? prefix from REQL."""
     if name in table.column_names:
@@ -152,6 +166,8 @@ class Source(ABC, Generic[T]):
     ::: This is-in-process Main-Process.
     ::: This is stateless.
     """
+    # Empty so slotted subclasses carry no per-instance __dict__
+    __slots__ = ()
 
     @abstractmethod
     def execute(self, ctx: Context) -> PipelineResult[T]:
@@ -180,6 +196,35 @@ class MappedSource(Source[U], Generic[T, U]):
         return result.fmap(self.transform)
 
 
+# {name} parameter placeholders; REQL's own braces ({ ?x ... }) never match
+_PLACEHOLDER = re.compile(r"\{([A-Za-z_]\w*)\}")
+
+
+@functools.lru_cache(maxsize=None)
+def _query_template(query: str) -> Tuple[str, ...]:
+    """Split query text into literals (even slots) and parameter names (odd slots).
+
+    Cached per query text, so each tool's query is scanned once rather than
+    once per parameter per execution.
+    """
+    return tuple(_PLACEHOLDER.split(query))
+
+
+def _bind_query(query: str, params: Dict[str, Any]) -> str:
+    """Substitute ``{name}`` placeholders from params; unknown names are kept."""
+    parts = _query_template(query)
+    if len(parts) == 1:
+        return query
+    bound = list(parts)
+    for i in range(1, len(parts), 2):
+        name = parts[i]
+        if name in params:
+            bound[i] = str(params[name])
+        else:
+            bound[i] = "{" + name + "}"
+    return "".join(bound)
+
+
 @dataclass
 class REQLSource(Source[pa.Table]):
     """REQL query source - returns PyArrow table for vectorized operations.
@@ -189,7 +234,12 @@ class REQLSource(Source[pa.Table]):
     - Predicates use hyphenated format: is-in-file, has-name, is-defined-in
 
     Parameter placeholders like {limit}, {target} are still supported
-    and resolved from ctx.params at runtime.
+    and resolved from ctx.params at runtime. The query is split into its
+    template when the source is built, so a source built once (as tool
+    factories do) never scans its text while running.
+
+    Result columns are normalized once here (``?name`` -> ``name``), so
+    downstream steps can look fields up by their plain name.
 
     Timeout can be specified via ctx.params['timeout_ms'] (default: 300000ms = 5 minutes).
 
@@ -200,16 +250,16 @@ class REQLSource(Source[pa.Table]):
     """
     query: str
 
+    def __post_init__(self) -> None:
+        _query_template(self.query)
+
     def execute(self, ctx: Context) -> PipelineResult[pa.Table]:
         """Execute REQL query against RETER - returns PyArrow table."""
         try:
             query = self.query
 
             # Substitute parameters in query: {target} -> actual value
-            for key, value in ctx.params.items():
-                placeholder = "{" + key + "}"
-                if placeholder in query:
-                    query = query.replace(placeholder, str(value))
+            query = _bind_query(query, ctx.params)
 
             # Get timeout from params (default 5 minutes = 300000ms)
             timeout_ms = ctx.params.get('timeout_ms', 300000)
@@ -220,7 +270,7 @@ class REQLSource(Source[pa.Table]):
             if table is None or table.num_rows == 0:
                 return pipeline_ok(pa.table({}))
 
-            return pipeline_ok(table)
+            return pipeline_ok(normalize_columns(table))
         except Exception as e:
             return pipeline_err("reql", f"Query failed: {e}: {query}", e)
 
@@ -240,21 +290,23 @@ class ValueSource(Source[T], Generic[T]):
         return pipeline_ok(self.value)
 
 
-def _get_rag_manager(ctx: Context):
+def _get_rag_manager(ctx: Optional[Context]):
     """Get RAG manager from context or default instance."""
-    rag_manager = ctx.get("rag_manager")
-    if rag_manager is None:
-        try:
-            from reter_code.services.default_instance_manager import DefaultInstanceManager
-            default_mgr = DefaultInstanceManager.get_instance()
-            if default_mgr:
-                rag_manager = default_mgr.get_rag_manager()
-        except Exception:
-            pass
+    rag_manager = ctx.get("rag_manager") if ctx is not None else None
+    if rag_manager is not None:
+        return rag_manager
+
+    try:
+        from reter_code.services.default_instance_manager import DefaultInstanceManager
+        default_mgr = DefaultInstanceManager.get_instance()
+        if default_mgr:
+            rag_manager = default_mgr.get_rag_manager()
+    except Exception:
+        rag_manager = None
     return rag_manager
 
 
-@dataclass
+@dataclass(slots=True)
 class RAGSearchSource(Source[List[Dict[str, Any]]]):
     """RAG semantic search source.
 
@@ -293,8 +345,47 @@ class RAGSearchSource(Source[List[Dict[str, Any]]]):
             return pipeline_err("rag", f"Semantic search failed: {e}", e)
 
 
-@dataclass
-class RAGDuplicatesSource(Source[List[Dict[str, Any]]]):
+# (similarity, entity1, entity2) of a find_duplicate_candidates pair
+_PAIR_FIELDS = operator.itemgetter("similarity", "entity1", "entity2")
+
+# Name and file of a cluster member (or of a pair entity)
+_MEMBER_NAME = operator.itemgetter("name")
+_MEMBER_FILE = operator.itemgetter("file")
+
+
+def _duplicate_pair_columns(pairs: List[Dict[str, Any]],
+                            classes: bool = True) -> Dict[str, List[Any]]:
+    """Flatten duplicate pairs into finding columns (one list per field)."""
+    similarities, entities1, entities2 = (
+        zip(*map(_PAIR_FIELDS, pairs)) if pairs else ((), (), ())
+    )
+    columns: Dict[str, List[Any]] = {"similarity": list(similarities)}
+    for prefix, entities in (("entity1", entities1), ("entity2", entities2)):
+        columns[f"{prefix}_name"] = list(map(_MEMBER_NAME, entities))
+        columns[f"{prefix}_file"] = list(map(_MEMBER_FILE, entities))
+        columns[f"{prefix}_line"] = [e["line"] for e in entities]
+        if classes:
+            columns[f"{prefix}_class"] = [e.get("class_name", "") for e in entities]
+    return columns
+
+
+def _duplicate_pairs_table(pairs: List[Dict[str, Any]],
+                           classes: bool = True) -> Union[pa.Table, List[Dict]]:
+    """Duplicate findings as an Arrow table built column by column.
+
+    Later steps work on the columns and emit turns them into rows once at
+    the end, so no per-finding dict is built up front. Metadata that
+    Arrow cannot type (mixed values in one field) stays as rows.
+    """
+    columns = _duplicate_pair_columns(pairs, classes)
+    try:
+        return pa.table(columns)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        return [dict(zip(columns, row)) for row in zip(*columns.values())]
+
+
+@dataclass(slots=True)
+class RAGDuplicatesSource(Source[Union[pa.Table, List[Dict[str, Any]]]]):
     """RAG duplicate code detection source.
 
     ::: This is-in-layer Domain-Specific-Language-Layer.
@@ -308,7 +399,7 @@ class RAGDuplicatesSource(Source[List[Dict[str, Any]]]):
     exclude_same_class: bool = True
     entity_types: Optional[List[str]] = None
 
-    def execute(self, ctx: Context) -> PipelineResult[List[Dict[str, Any]]]:
+    def execute(self, ctx: Context) -> PipelineResult[Union[pa.Table, List[Dict[str, Any]]]]:
         """Find duplicate code using RAG embeddings."""
         try:
             rag_manager = _get_rag_manager(ctx)
@@ -326,28 +417,12 @@ class RAGDuplicatesSource(Source[List[Dict[str, Any]]]):
             if not result.get("success"):
                 return pipeline_err("rag", result.get("error", "Duplicate detection failed"))
 
-            # Transform pairs to flat findings
-            findings = []
-            for pair in result.get("pairs", []):
-                e1, e2 = pair["entity1"], pair["entity2"]
-                findings.append({
-                    "similarity": pair["similarity"],
-                    "entity1_name": e1["name"],
-                    "entity1_file": e1["file"],
-                    "entity1_line": e1["line"],
-                    "entity1_class": e1.get("class_name", ""),
-                    "entity2_name": e2["name"],
-                    "entity2_file": e2["file"],
-                    "entity2_line": e2["line"],
-                    "entity2_class": e2.get("class_name", ""),
-                })
-
-            return pipeline_ok(findings)
+            return pipeline_ok(_duplicate_pairs_table(result.get("pairs", [])))
         except Exception as e:
             return pipeline_err("rag", f"Duplicate detection failed: {e}", e)
 
 
-@dataclass
+@dataclass(slots=True)
 class RAGClustersSource(Source[List[Dict[str, Any]]]):
     """RAG code clustering source using K-means.
 
@@ -383,16 +458,15 @@ class RAGClustersSource(Source[List[Dict[str, Any]]]):
             # Transform clusters to findings
             findings = []
             for cluster in result.get("clusters", []):
-                member_names = [m["name"] for m in cluster["members"]]
-                member_files = list(set(m["file"] for m in cluster["members"]))
+                members = cluster["members"]
                 findings.append({
                     "cluster_id": cluster["cluster_id"],
                     "member_count": cluster["member_count"],
                     "unique_files": cluster["unique_files"],
-                    "members": member_names,
-                    "files": member_files,
+                    "members": list(map(_MEMBER_NAME, members)),
+                    "files": list(dict.fromkeys(map(_MEMBER_FILE, members))),
                     "avg_distance": cluster.get("avg_distance", 0),
-                    "details": cluster["members"]
+                    "details": members
                 })
 
             return pipeline_ok(findings)
@@ -400,7 +474,7 @@ class RAGClustersSource(Source[List[Dict[str, Any]]]):
             return pipeline_err("rag", f"Clustering failed: {e}", e)
 
 
-@dataclass
+@dataclass(slots=True)
 class RAGDBScanSource(Source[List[Dict[str, Any]]]):
     """RAG code clustering source using DBSCAN (Density-Based Spatial Clustering).
 
@@ -444,17 +518,16 @@ class RAGDBScanSource(Source[List[Dict[str, Any]]]):
             # Transform clusters to findings
             findings = []
             for cluster in result.get("clusters", []):
-                member_names = [m["name"] for m in cluster["members"]]
-                member_files = list(set(m["file"] for m in cluster["members"]))
+                members = cluster["members"]
                 findings.append({
                     "cluster_id": cluster["cluster_id"],
                     "member_count": cluster["member_count"],
                     "unique_files": cluster["unique_files"],
-                    "members": member_names,
-                    "files": member_files,
+                    "members": list(map(_MEMBER_NAME, members)),
+                    "files": list(dict.fromkeys(map(_MEMBER_FILE, members))),
                     "avg_distance": cluster.get("avg_distance", 0),
                     "avg_similarity": cluster.get("avg_similarity", 0),
-                    "details": cluster["members"]
+                    "details": members
                 })
 
             return pipeline_ok(findings)
@@ -726,6 +799,10 @@ class ComposedStep(Step[T, V], Generic[T, U, V]):
 class FilterStep(Step[Union[pa.Table, List[T]], Union[pa.Table, List[T]]], Generic[T]):
     """Filter items based on predicate - Arrow-optimized.
 
+    When followed by a limit, ``limit`` is set (see Pipeline.limit) and a
+    row-by-row filter stops at the first ``limit`` matching rows instead of
+    testing every row.
+
     ::: This is-in-layer Domain-Specific-Language-Layer.
     ::: This is a step.
     ::: This is-in-process Main-Process.
@@ -733,6 +810,9 @@ class FilterStep(Step[Union[pa.Table, List[T]], Union[pa.Table, List[T]]], Gener
     """
     predicate: Callable[[T], bool]
     condition: Optional[Callable[[], bool]] = None  # when/unless condition
+    # Optional vectorized form of predicate: table -> pc.Expression or None
+    arrow_predicate: Optional[Callable[[pa.Table], Any]] = None
+    limit: Optional[int] = None
 
     def execute(self, data: Union[pa.Table, List[T]], ctx: Optional["Context"] = None) -> PipelineResult[Union[pa.Table, List[T]]]:
         if self.condition is not None and not self.condition():
@@ -742,6 +822,9 @@ class FilterStep(Step[Union[pa.Table, List[T]], Union[pa.Table, List[T]]], Gener
             if is_arrow(data):
                 return self._arrow_filter(data, ctx)
 
+            if self.limit is not None:
+                return pipeline_ok(list(islice(self.stream(data, ctx), self.limit)))
+
             # Fall back to row-by-row for list
             import inspect
             try:
@@ -755,21 +838,47 @@ class FilterStep(Step[Union[pa.Table, List[T]], Union[pa.Table, List[T]]], Gener
         except Exception as e:
             return pipeline_err("filter", f"Filter failed: {e}", e)
 
+    def stream(self, rows: Iterable[T], ctx: Optional["Context"] = None) -> Iterator[T]:
+        """Lazily filter a row iterable (used when a limit follows)."""
+        if self.condition is not None and not self.condition():
+            return iter(rows)
+        import inspect
+        try:
+            takes_ctx = len(inspect.signature(self.predicate).parameters) >= 2
+        except (ValueError, TypeError):
+            takes_ctx = False
+        if takes_ctx:
+            return (item for item in rows if self.predicate(item, ctx))
+        return (item for item in rows if self.predicate(item))
+
     def _arrow_filter(self, table: pa.Table, ctx: Optional["Context"]) -> PipelineResult[pa.Table]:
         """Apply filter using Arrow compute - vectorized."""
+        if self.arrow_predicate is not None:
+            try:
+                expr = self.arrow_predicate(table)
+                if expr is not None:
+                    filtered = table.filter(expr)
+                    if filtered.num_rows == 0:
+                        return pipeline_ok(pa.table({}))
+                    return pipeline_ok(filtered)
+            except (pa.ArrowInvalid, pa.ArrowNotImplementedError, pa.ArrowTypeError):
+                pass  # Fall back to the row-by-row predicate
         try:
             # Convert to list and filter row-by-row (predicate is Python function)
             # For true vectorization, use ArrowFilterStep with expression parsing
             rows = table.to_pylist()
-            import inspect
-            try:
-                sig = inspect.signature(self.predicate)
-                if len(sig.parameters) >= 2:
-                    filtered = [item for item in rows if self.predicate(item, ctx)]
-                else:
+            if self.limit is not None:
+                filtered = list(islice(self.stream(rows, ctx), self.limit))
+            else:
+                import inspect
+                try:
+                    sig = inspect.signature(self.predicate)
+                    if len(sig.parameters) >= 2:
+                        filtered = [item for item in rows if self.predicate(item, ctx)]
+                    else:
+                        filtered = [item for item in rows if self.predicate(item)]
+                except (ValueError, TypeError):
                     filtered = [item for item in rows if self.predicate(item)]
-            except (ValueError, TypeError):
-                filtered = [item for item in rows if self.predicate(item)]
 
             if not filtered:
                 return pipeline_ok(pa.table({}))
@@ -794,7 +903,7 @@ class SelectStep(Step[Union[pa.Table, List[Dict]], Union[pa.Table, List[Dict]]])
             if is_arrow(data):
                 return self._arrow_select(data)
 
-            # List of dicts fallback
+            # List of dicts fallback (REQL keys are already normalized)
             result = []
             for item in data:
                 new_item = {}
@@ -802,12 +911,8 @@ class SelectStep(Step[Union[pa.Table, List[Dict]], Union[pa.Table, List[Dict]]])
                     clean_out = out_name.lstrip("?")
                     if src_name in item:
                         new_item[clean_out] = item[src_name]
-                    elif not src_name.startswith("?") and f"?{src_name}" in item:
-                        new_item[clean_out] = item[f"?{src_name}"]
                     elif out_name in item:
                         new_item[clean_out] = item[out_name]
-                    elif not out_name.startswith("?") and f"?{out_name}" in item:
-                        new_item[clean_out] = item[f"?{out_name}"]
                 result.append(new_item)
             return pipeline_ok(result)
         except Exception as e:
@@ -837,6 +942,15 @@ class SelectStep(Step[Union[pa.Table, List[Dict]], Union[pa.Table, List[Dict]]])
 class OrderByStep(Step[Union[pa.Table, List[Dict]], Union[pa.Table, List[Dict]]]):
     """Sort items by field - Arrow-optimized.
 
+    Secondary keys in ``then_by`` break ties, so ``order_by { file, line }``
+    is a single multi-key sort rather than one sort per field.
+
+    When followed by a limit, ``limit`` is set (see Pipeline.limit) and only
+    the first ``limit`` rows are selected (top-k) instead of sorting all rows.
+
+    Arrow input that is already in order (e.g. a REQL ``ORDER BY`` on the
+    same keys) is detected with one linear pass and returned unsorted.
+
     ::: This is-in-layer Domain-Specific-Language-Layer.
     ::: This is a step.
     ::: This is-in-process Main-Process.
@@ -844,20 +958,29 @@ class OrderByStep(Step[Union[pa.Table, List[Dict]], Union[pa.Table, List[Dict]]]
     """
     field_name: str
     descending: bool = False
+    then_by: Tuple[Tuple[str, bool], ...] = ()
+    limit: Optional[int] = None
+
+    @property
+    def sort_keys(self) -> List[Tuple[str, bool]]:
+        return [(self.field_name, self.descending), *self.then_by]
 
     def execute(self, data: Union[pa.Table, List[Dict]], ctx: Optional["Context"] = None) -> PipelineResult[Union[pa.Table, List[Dict]]]:
         try:
             if is_arrow(data):
                 return self._arrow_sort(data)
 
-            # List fallback
-            def get_value(x):
-                if self.field_name in x:
-                    return x.get(self.field_name, "")
-                elif not self.field_name.startswith("?") and f"?{self.field_name}" in x:
-                    return x.get(f"?{self.field_name}", "")
-                return ""
-            return pipeline_ok(sorted(data, key=get_value, reverse=self.descending))
+            # List fallback: stable sorts from the least significant key
+            if self.limit is not None and not self.then_by:
+                # Top-k; documented equivalent to sorted(...)[:limit]
+                select = heapq.nlargest if self.descending else heapq.nsmallest
+                return pipeline_ok(select(
+                    self.limit, data, key=lambda x: x.get(self.field_name, "")
+                ))
+            data = list(data)
+            for field_name, descending in reversed(self.sort_keys):
+                data.sort(key=lambda x, f=field_name: x.get(f, ""), reverse=descending)
+            return pipeline_ok(data)
         except Exception as e:
             return pipeline_err("order_by", f"Sort failed: {e}", e)
 
@@ -867,16 +990,59 @@ class OrderByStep(Step[Union[pa.Table, List[Dict]], Union[pa.Table, List[Dict]]]
             if table.num_rows == 0:
                 return pipeline_ok(table)
 
-            col_name = resolve_column(table, self.field_name)
-            if col_name is None:
+            sort_keys = []
+            for field_name, descending in self.sort_keys:
+                col_name = resolve_column(table, field_name)
+                if col_name is not None:
+                    sort_keys.append((col_name, "descending" if descending else "ascending"))
+            if not sort_keys:
                 return pipeline_ok(table)
 
-            order = "descending" if self.descending else "ascending"
-            indices = pc.sort_indices(table, sort_keys=[(col_name, order)])
+            if self._is_sorted(table, sort_keys):
+                if self.limit is not None:
+                    return pipeline_ok(table.slice(0, self.limit))
+                return pipeline_ok(table)
+
+            if self.limit is not None and self.limit < table.num_rows:
+                # Top-k selection. The row index breaks ties so the result
+                # matches the stable full sort followed by a slice.
+                indexed = table.append_column(
+                    "__row_index", pa.array(range(table.num_rows), pa.int64())
+                )
+                indices = pc.select_k_unstable(
+                    indexed, self.limit,
+                    sort_keys=sort_keys + [("__row_index", "ascending")],
+                )
+                return pipeline_ok(table.take(indices))
+
+            indices = pc.sort_indices(table, sort_keys=sort_keys)
             return pipeline_ok(table.take(indices))
         except Exception as e:
             return pipeline_err("order_by", f"Arrow sort failed: {e}", e)
 
+    @staticmethod
+    def _is_sorted(table: pa.Table, sort_keys: List[Tuple[str, str]]) -> bool:
+        """True if every adjacent pair of rows is already in sort order.
+
+        A stable sort of such a table is the identity. Columns with nulls
+        or floats (NaN placement) are never treated as sorted.
+        """
+        if table.num_rows < 2:
+            return True
+        ordered = None
+        for col_name, order in reversed(sort_keys):
+            column = table.column(col_name)
+            if column.null_count or pa.types.is_floating(column.type):
+                return False
+            head, tail = column.slice(0, len(column) - 1), column.slice(1)
+            before = pc.less if order == "ascending" else pc.greater
+            if ordered is None:
+                # Least significant key: ties are allowed
+                ordered = pc.or_(before(head, tail), pc.equal(head, tail))
+            else:
+                ordered = pc.or_(before(head, tail), pc.and_(pc.equal(head, tail), ordered))
+        return pc.all(ordered).as_py()
+
 
 @dataclass
 class LimitStep(Step[Union[pa.Table, List[T]], Union[pa.Table, List[T]]], Generic[T]):
@@ -891,7 +1057,9 @@ class LimitStep(Step[Union[pa.Table, List[T]], Union[pa.Table, List[T]]], Generi
 
     def execute(self, data: Union[pa.Table, List[T]], ctx: Optional["Context"] = None) -> PipelineResult[Union[pa.Table, List[T]]]:
         if is_arrow(data):
-            return pipeline_ok(data.slice(0, self.count))
+            # Clamped: slicing a column-less table (an emptied result)
+            # past its end reports the requested length as rows
+            return pipeline_ok(data.slice(0, min(self.count, data.num_rows)))
         return pipeline_ok(data[:self.count])
 
 
@@ -922,19 +1090,35 @@ class MapStep(Step[Union[pa.Table, List[T]], Union[pa.Table, List[U]]], Generic[
     ::: This is stateless.
     """
     transform: Callable[[T], U]
+    # Optional columnar form of transform: table -> Table or None
+    arrow_transform: Optional[Callable[[pa.Table], Optional[pa.Table]]] = None
+    # Optional whole-list form of transform: rows -> rows in one call
+    batch_transform: Optional[Callable[[List[T]], List[U]]] = None
+
+    def _apply(self, rows: List[T]) -> List[U]:
+        if self.batch_transform is not None:
+            return self.batch_transform(rows)
+        return [self.transform(item) for item in rows]
 
     def execute(self, data: Union[pa.Table, List[T]], ctx: Optional["Context"] = None) -> PipelineResult[Union[pa.Table, List[U]]]:
         try:
+            if is_arrow(data) and data.num_rows and self.arrow_transform is not None:
+                try:
+                    mapped = self.arrow_transform(data)
+                    if mapped is not None:
+                        return pipeline_ok(mapped)
+                except (pa.ArrowInvalid, pa.ArrowNotImplementedError, pa.ArrowTypeError):
+                    pass  # Fall back to the row-by-row transform
+
             # For Arrow tables, convert to list, apply transform, convert back
             # This preserves Arrow format while allowing arbitrary transforms
             if is_arrow(data):
-                rows = data.to_pylist()
-                transformed = [self.transform(item) for item in rows]
+                transformed = self._apply(data.to_pylist())
                 if not transformed:
                     return pipeline_ok(pa.table({}))
                 return pipeline_ok(pa.Table.from_pylist(transformed))
 
-            return pipeline_ok([self.transform(item) for item in data])
+            return pipeline_ok(self._apply(data))
         except Exception as e:
             return pipeline_err("map", f"Map failed: {e}", e)
 
@@ -983,42 +1167,87 @@ class GroupByStep(Step[List[Dict], Dict[str, Any]]):
 
     def execute(self, data: Union[pa.Table, List[Dict]], ctx: Optional["Context"] = None) -> PipelineResult[Dict[str, Any]]:
         try:
-            # Convert Arrow table to list of dicts
             if is_arrow(data):
+                if (self.field_name and not self.key_fn
+                        and self.field_name in data.column_names):
+                    groups = self._arrow_groups(data)
+                    if groups is not None:
+                        return self._aggregate(groups, ctx)
+                # Convert Arrow table to list of dicts
                 data = data.to_pylist()
 
+            if self.key_fn:
+                keys = (str(self.key_fn(item)) for item in data)
+            elif self.field_name:
+                field_name = self.field_name
+                keys = (str(item.get(field_name, "")) for item in data)
+            else:
+                data = list(data)
+                return self._aggregate({"default": data} if data else {}, ctx)
+
+            # Rows of one group usually arrive together (queries order or
+            # group by the key), so the dict is only touched when the key
+            # changes rather than once per row
             groups: Dict[str, List[Dict]] = {}
-            for item in data:
-                if self.key_fn:
-                    key = str(self.key_fn(item))
-                elif self.field_name:
-                    key = str(item.get(self.field_name, ""))
-                else:
-                    key = "default"
-                if key not in groups:
-                    groups[key] = []
-                groups[key].append(item)
-
-            # Apply aggregation if provided
-            if self.aggregate_fn:
-                result = {}
-                for key, items in groups.items():
-                    # Try to call with context if the function accepts it
-                    try:
-                        import inspect
-                        sig = inspect.signature(self.aggregate_fn)
-                        if len(sig.parameters) >= 2:
-                            result[key] = self.aggregate_fn(items, ctx)
-                        else:
-                            result[key] = self.aggregate_fn(items)
-                    except (ValueError, TypeError):
-                        result[key] = self.aggregate_fn(items)
-                return pipeline_ok({"items": result})
-
-            return pipeline_ok(groups)
+            current_key = current = None
+            for key, item in zip(keys, data):
+                if current is None or key != current_key:
+                    current = groups.setdefault(key, [])
+                    current_key = key
+                current.append(item)
+
+            return self._aggregate(groups, ctx)
         except Exception as e:
             return pipeline_err("group_by", f"Group by failed: {e}", e)
 
+    def _arrow_groups(self, table: pa.Table) -> Optional[Dict[str, List[Dict]]]:
+        """Group an Arrow table by field_name without per-row key lookups.
+
+        The key column is dictionary-encoded and the table reordered by
+        code (stably) in Arrow, so each group is one slice of the converted
+        rows. Groups keep first-seen order. Returns None for columns Arrow
+        cannot encode.
+        """
+        if table.num_rows == 0:
+            return {}
+        try:
+            encoded = table.column(self.field_name).combine_chunks().dictionary_encode(
+                null_encoding="encode"
+            )
+        except (pa.ArrowNotImplementedError, pa.ArrowTypeError):
+            return None
+
+        counts = [0] * len(encoded.dictionary)
+        value_counts = pc.value_counts(encoded.indices)
+        for code, count in zip(value_counts.field("values").to_pylist(),
+                               value_counts.field("counts").to_pylist()):
+            counts[code] = count
+
+        rows = table.take(pc.sort_indices(encoded.indices)).to_pylist()
+        groups: Dict[str, List[Dict]] = {}
+        start = 0
+        for value, count in zip(encoded.dictionary.to_pylist(), counts):
+            groups.setdefault(str(value), []).extend(rows[start:start + count])
+            start += count
+        return groups
+
+    def _aggregate(self, groups: Dict[str, List[Dict]],
+                   ctx: Optional["Context"]) -> PipelineResult[Dict[str, Any]]:
+        """Apply aggregate_fn per group, if set; otherwise return the groups."""
+        if self.aggregate_fn:
+            # Call with context if the function accepts it; decided once,
+            # not per group
+            try:
+                takes_ctx = len(inspect.signature(self.aggregate_fn).parameters) >= 2
+            except (ValueError, TypeError):
+                takes_ctx = False
+            if takes_ctx:
+                result = {key: self.aggregate_fn(items, ctx) for key, items in groups.items()}
+            else:
+                result = {key: self.aggregate_fn(items) for key, items in groups.items()}
+            return pipeline_ok({"items": result})
+        return pipeline_ok(groups)
+
 
 @dataclass
 class AggregateStep(Step[Union[pa.Table, List[Dict]], Dict[str, Any]]):
@@ -1131,9 +1360,16 @@ class UniqueStep(Step[Union[pa.Table, List[T]], Union[pa.Table, List[T]]], Gener
             else:
                 seen = set()
                 result = []
+                # Rows usually share one field order, so field names are
+                # sorted once per layout rather than once per row
+                layouts: Dict[Tuple[str, ...], Tuple[str, ...]] = {}
                 for item in data:
                     if isinstance(item, dict):
-                        k = tuple(sorted(item.items()))
+                        layout = tuple(item)
+                        names = layouts.get(layout)
+                        if names is None:
+                            names = layouts[layout] = tuple(sorted(layout))
+                        k = (names, tuple([item[name] for name in names]))
                     else:
                         k = item
                     if k not in seen:
@@ -1336,9 +1572,14 @@ class Pipeline(Monad[T], Generic[T]):
     # -------------------------------------------------------------------------
 
     def filter(self, predicate: Callable[[Any], bool],
-               when: Optional[Callable[[], bool]] = None) -> "Pipeline":
-        """Filter items matching predicate."""
-        return self._add_step(FilterStep(predicate, when))
+               when: Optional[Callable[[], bool]] = None,
+               arrow_predicate: Optional[Callable[[pa.Table], Any]] = None) -> "Pipeline":
+        """Filter items matching predicate.
+
+        arrow_predicate, if given, maps an Arrow table to an equivalent
+        compute expression (or None) so Arrow input is filtered vectorized.
+        """
+        return self._add_step(FilterStep(predicate, when, arrow_predicate))
 
     def select(self, *fields: str, **renames: str) -> "Pipeline":
         """Select and optionally rename fields."""
@@ -1346,24 +1587,51 @@ class Pipeline(Monad[T], Generic[T]):
         field_map.update(renames)
         return self._add_step(SelectStep(field_map))
 
-    def order_by(self, field: str) -> "Pipeline":
-        """Sort by field. Prefix with - for descending."""
-        descending = field.startswith("-")
-        if descending:
-            field = field[1:]
-        return self._add_step(OrderByStep(field, descending))
+    def order_by(self, field: str, *then_by: str) -> "Pipeline":
+        """Sort by field, then by any further fields. Prefix with - for descending."""
+        keys = [(f.lstrip("-"), f.startswith("-")) for f in (field, *then_by)]
+        (field, descending), *rest = keys
+        return self._add_step(OrderByStep(field, descending, tuple(rest)))
 
     def limit(self, count: int) -> "Pipeline":
-        """Limit number of results."""
+        """Limit number of results.
+
+        Directly after order_by, the sort is fused into a top-k selection;
+        directly after filter, the filter stops once it has ``count`` rows.
+        """
+        if (self._steps and isinstance(self._steps[-1], (OrderByStep, FilterStep))
+                and isinstance(count, int) and count >= 0):
+            last = self._steps[-1]
+            if last.limit is None or count < last.limit:
+                fused = replace(last, limit=count)
+                return Pipeline(
+                    _source=self._source,
+                    _steps=self._steps[:-1] + [fused],
+                    _emit_key=self._emit_key,
+                )._add_step(LimitStep(count))
         return self._add_step(LimitStep(count))
 
     def offset(self, count: int) -> "Pipeline":
         """Skip first N results."""
         return self._add_step(OffsetStep(count))
 
-    def map(self, transform: Callable[[Any], Any]) -> "Pipeline":
-        """Transform each item (alias for fmap on list elements)."""
-        return self._add_step(MapStep(transform))
+    def map(self, transform: Callable[[Any], Any],
+            arrow_transform: Optional[Callable[[pa.Table], Optional[pa.Table]]] = None,
+            batch_transform: Optional[Callable[[List], List]] = None) -> "Pipeline":
+        """Transform each item (alias for fmap on list elements).
+
+        arrow_transform, if given, maps a whole Arrow table to the
+        transformed table (or None) so Arrow input skips the per-row dicts.
+        batch_transform, if given, maps the whole row list in one call and
+        is used instead of calling transform per row.
+        """
+        return self._add_step(MapStep(transform, arrow_transform, batch_transform))
+
+    def map_batch(self, transform: Callable[[List], List]) -> "Pipeline":
+        """Transform the whole row list in one call (rows -> rows)."""
+        return self._add_step(MapStep(
+            lambda item: transform([item])[0], batch_transform=transform
+        ))
 
     def flat_map(self, transform: Callable[[Any], List]) -> "Pipeline":
         """Transform and flatten (monadic bind for lists)."""
@@ -6,13 +6,18 @@ using the AI lexer variant for natural language DL syntax.
 """
 
 import os
+import re
 import sys
+import threading
 import time
+from collections import OrderedDict
 from pathlib import Path
 from typing import List, Optional, Any, Tuple, Dict, Set, Callable, TypeVar
 
 T = TypeVar('T')
 import functools
+import itertools
+import math
 
 from reter import Reter
 
@@ -73,6 +78,88 @@ __all__ = [
 ]
 
 
+@functools.lru_cache(maxsize=1024)
+def _query_cache_key(query: str) -> str:
+    """Query text without per-line layout.
+
+    Tools embed the same pattern at different indentation. Detectors
+    re-issue identical query text, so the key is normalized once per text.
+    """
+    return "\n".join(line.strip() for line in query.splitlines() if line.strip())
+
+
+# Per-instance tokens for result caches; unlike id(), never reused
+_INSTANCE_TOKENS = itertools.count(1)
+
+
+# $name placeholders bound by reql(bindings=...). Quoted literals are matched
+# too, without a group, so a $ inside them is skipped, and a $ inside an ID
+# such as py:Outer$Inner is not a placeholder
+_BINDING = re.compile(
+    r"""(?:"(?:[^"\\]|\\.)*"|'(?:[^'\\]|\\.)*')|(?<![\w:.$])\$([A-Za-z_]\w*)"""
+)
+
+
+@functools.lru_cache(maxsize=1024)
+def _query_template(query: str) -> Tuple[str, ...]:
+    """Normalized query split into literals (even slots) and $names (odd slots).
+
+    Keyed on the template text, so a query issued with many different
+    bindings is normalized and scanned once.
+    """
+    text = _query_cache_key(query)
+    parts, pos = [], 0
+    for match in _BINDING.finditer(text):
+        if match.group(1) is None:
+            continue  # quoted literal, kept verbatim
+        parts += [text[pos:match.start()], match.group(1)]
+        pos = match.end()
+    parts.append(text[pos:])
+    return tuple(parts)
+
+
+# Characters with a REQL string escape; other control characters are rejected
+_STRING_ESCAPES = {
+    "\\": "\\\\", '"': '\\"', "\n": "\\n", "\r": "\\r",
+    "\t": "\\t", "\b": "\\b", "\f": "\\f",
+}
+_STRING_ESCAPE_RE = re.compile(r'[\\"\x00-\x1f\x7f]')
+
+
+def _escape_char(match: "re.Match") -> str:
+    """Escape one special character of a bound string."""
+    char = match.group(0)
+    if char not in _STRING_ESCAPES:
+        raise ValueError(f"Cannot bind control character {char!r} in a REQL string")
+    return _STRING_ESCAPES[char]
+
+
+def _literal(value: Any) -> str:
+    """
+    Render a bound value as a REQL literal.
+
+    Raises:
+        ValueError: For NaN/infinite floats and control characters that
+            have no string escape
+    """
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, float) and not math.isfinite(value):
+        raise ValueError(f"Cannot bind non-finite number {value} in a REQL query")
+    if isinstance(value, (int, float)):
+        return str(value)
+    return '"' + _STRING_ESCAPE_RE.sub(_escape_char, str(value)) + '"'
+
+
+def _bind_query(query: str, bindings: Dict[str, Any]) -> str:
+    """Substitute ``$name`` placeholders; unbound names stay REQL variables."""
+    parts = list(_query_template(query))
+    for i in range(1, len(parts), 2):
+        name = parts[i]
+        parts[i] = _literal(bindings[name]) if name in bindings else "$" + name
+    return "".join(parts)
+
+
 class ReterWrapper(ReterLoaderMixin):
     """
     Wrapper for RETER - Incremental Semantic Reasoning Engine
@@ -127,6 +214,18 @@ class ReterWrapper(ReterLoaderMixin):
             raise
         self._session_stats = {"total_wmes": 0, "total_sources": 0}
 
+        # L1 cache of REQL results, shared by every detector run against
+        # this instance. Cleared whenever the network changes (see _dirty).
+        self._query_cache: OrderedDict[str, Any] = OrderedDict()
+        self._query_cache_size = 256
+        self._query_cache_lock = threading.Lock()
+        self._query_inflight: Dict[str, threading.Event] = {}
+        # The native reasoner is not thread-safe; concurrent tool runs
+        # (run_many) take this lock around every query
+        self._reasoner_lock = threading.RLock()
+        self._version = 0  # Bumped alongside the query cache invalidation
+        self._instance_token = next(_INSTANCE_TOKENS)
+
         # Change tracking for auto-save
         self._dirty = False  # True if instance has unsaved changes
         self._last_save_time = time.time()  # Timestamp of last save
@@ -143,6 +242,39 @@ class ReterWrapper(ReterLoaderMixin):
         else:
             logger.debug("Skipping ontology load (will be loaded from snapshot)")
 
+    @property
+    def _dirty(self) -> bool:
+        """True if instance has unsaved changes."""
+        return self.__dirty
+
+    @_dirty.setter
+    def _dirty(self, value: bool) -> None:
+        # Every write, load and save path updates the dirty flag, so this is
+        # the single place where cached query results are invalidated.
+        self.__dirty = value
+        with self._query_cache_lock:
+            self._query_cache.clear()
+            self._version += 1
+
+    @property
+    def version(self) -> int:
+        """
+        Network version, bumped whenever the network may have changed.
+
+        Callers can key their own result caches on it.
+        """
+        return self._version
+
+    @property
+    def instance_token(self) -> int:
+        """
+        Process-unique token for this instance.
+
+        Unlike id(), it is never reused by a later instance, so result caches
+        can key on (instance_token, version).
+        """
+        return self._instance_token
+
     def _load_oo_ontology(self) -> None:
         """
         Load the Object-Oriented meta-ontology first.
@@ -388,9 +520,10 @@ class ReterWrapper(ReterLoaderMixin):
 
     def _run_with_lock(self, func: Callable[..., T], *args: Any) -> T:
         """
-        Run a function directly - no lock needed in synchronous version.
+        Run a function while holding the reasoner lock.
         """
-        return func(*args)
+        with self._reasoner_lock:
+            return func(*args)
 
     def _load_directory_generic(
         self,
@@ -695,7 +828,12 @@ class ReterWrapper(ReterLoaderMixin):
         self._dirty = True  # Mark instance as modified
         return wme_count, source, time_ms
 
-    def reql(self, query: str, timeout_ms: Optional[int] = None) -> Any:
+    def reql(
+        self,
+        query: str,
+        timeout_ms: Optional[int] = None,
+        bindings: Optional[Dict[str, Any]] = None,
+    ) -> Any:
         """
         Execute REQL query and return PyArrow Table.
 
@@ -709,10 +847,20 @@ class ReterWrapper(ReterLoaderMixin):
         Returns PyArrow Table directly. Server.py should handle conversion
         to dicts if needed for API responses.
 
+        Results are cached per query text until the network is next
+        modified, so detectors sharing a query only hit RETER once; a
+        query already running on another thread is awaited, not re-run.
+        Queries from different threads reach the reasoner one at a time.
+
+        With ``bindings``, ``$name`` placeholders in the query are replaced
+        by the bound values (strings are quoted). The template is
+        normalized once, however many different values it is bound to.
+
         Args:
             query: REQL query string
             timeout_ms: Query timeout in milliseconds. If None, uses RETER_REQL_TIMEOUT_MS
                        (default 300000ms = 5 minutes). Set to 0 for no timeout.
+            bindings: Values for ``$name`` placeholders in the query
 
         Returns:
             PyArrow Table with query results
@@ -731,8 +879,47 @@ class ReterWrapper(ReterLoaderMixin):
         if timeout_ms is None:
             timeout_ms = RETER_REQL_TIMEOUT_MS
 
-        # Unified storage: ReteNetwork handles hybrid mode internally
-        return safe_cpp_call(self.reasoner.reql, query, timeout_ms)
+        if bindings:
+            query = key = _bind_query(query, bindings)
+        else:
+            key = _query_cache_key(query)
+
+        with self._query_cache_lock:
+            cached = self._query_cache.get(key)
+            if cached is not None:
+                self._query_cache.move_to_end(key)
+                return cached
+            # Concurrent callers (run_many) share one in-flight execution
+            pending = self._query_inflight.get(key)
+            if pending is None:
+                self._query_inflight[key] = threading.Event()
+            version = self._version
+
+        if pending is not None:
+            # Bounded by the query timeout (0 means none, as for the query)
+            pending.wait(timeout_ms / 1000 if timeout_ms else None)
+            with self._query_cache_lock:
+                cached = self._query_cache.get(key)
+            if cached is not None:
+                return cached
+            # The owner failed, timed out or the network changed meanwhile:
+            # run it ourselves
+            return self._run_with_lock(safe_cpp_call, self.reasoner.reql, query, timeout_ms)
+
+        try:
+            # Unified storage: ReteNetwork handles hybrid mode internally
+            result = self._run_with_lock(safe_cpp_call, self.reasoner.reql, query, timeout_ms)
+
+            # PyArrow tables are immutable, so results can be shared safely
+            with self._query_cache_lock:
+                if version == self._version:
+                    self._query_cache[key] = result
+                    if len(self._query_cache) > self._query_cache_size:
+                        self._query_cache.popitem(last=False)
+            return result
+        finally:
+            with self._query_cache_lock:
+                self._query_inflight.pop(key).set()
 
     def get_all_sources(self) -> Tuple[List[str], float]:
         """
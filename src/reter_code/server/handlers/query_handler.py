@@ -154,6 +154,7 @@ class QueryHandler(BaseHandler):
         from ...cadsl.parser import parse_cadsl
         from ...cadsl.transformer import CADSLTransformer
         from ...cadsl.loader import build_pipeline_factory
+        from ...cadsl.tools_bridge import load_cadsl_specs
         from ...dsl.core import Context as PipelineContext
         from ...dsl.catpy import Err, Ok
 
@@ -201,8 +202,6 @@ class QueryHandler(BaseHandler):
             path = Path(script_stripped)
             if path.exists() and path.is_file():
                 source_file = str(path)
-                with open(path, 'r', encoding='utf-8') as f:
-                    cadsl_content = f.read()
             elif not path.exists():
                 return {
                     "success": False,
@@ -213,23 +212,41 @@ class QueryHandler(BaseHandler):
                 }
 
         try:
-            # Parse CADSL
-            parse_result = parse_cadsl(cadsl_content)
-            if not parse_result.success:
-                return {
-                    "success": False,
-                    "results": [],
-                    "count": 0,
-                    "cadsl_script": cadsl_content[:500] + "..." if len(cadsl_content) > 500 else cadsl_content,
-                    "source_file": source_file,
-                    "error": f"Parse error: {parse_result.errors}"
-                }
+            if source_file is not None:
+                # Files share the tool modules' spec cache (parsed once per edit)
+                try:
+                    tool_specs, factories = load_cadsl_specs(Path(source_file))
+                except ValueError as e:
+                    cadsl_content = Path(source_file).read_text(encoding='utf-8')
+                    return {
+                        "success": False,
+                        "results": [],
+                        "count": 0,
+                        "cadsl_script": cadsl_content[:500] + "..." if len(cadsl_content) > 500 else cadsl_content,
+                        "source_file": source_file,
+                        "error": str(e)
+                    }
+            else:
+                # Parse CADSL
+                parse_result = parse_cadsl(cadsl_content)
+                if not parse_result.success:
+                    return {
+                        "success": False,
+                        "results": [],
+                        "count": 0,
+                        "cadsl_script": cadsl_content[:500] + "..." if len(cadsl_content) > 500 else cadsl_content,
+                        "source_file": None,
+                        "error": f"Parse error: {parse_result.errors}"
+                    }
 
-            # Transform to tool spec
-            transformer = CADSLTransformer()
-            tool_specs = transformer.transform(parse_result.tree)
+                # Transform to tool spec
+                transformer = CADSLTransformer()
+                tool_specs = transformer.transform(parse_result.tree)
+                factories = {}
 
             if not tool_specs:
+                if source_file is not None:
+                    cadsl_content = Path(source_file).read_text(encoding='utf-8')
                 return {
                     "success": False,
                     "results": [],
@@ -269,7 +286,7 @@ class QueryHandler(BaseHandler):
             pipeline_ctx = PipelineContext(reter=self.reter, params=pipeline_params)
 
             # Build and execute pipeline
-            pipeline_factory = build_pipeline_factory(tool_spec)
+            pipeline_factory = factories.get(tool_spec.name) or build_pipeline_factory(tool_spec)
             pipeline = pipeline_factory(pipeline_ctx)
             result = pipeline.execute(pipeline_ctx)
 
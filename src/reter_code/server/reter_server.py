@@ -705,6 +705,9 @@ class ReterServer:
         # Cleanup discovery file
         self._cleanup_discovery()
 
+        if self._rag_manager:
+            self._rag_manager.close()
+
         # Close ZeroMQ sockets
         if self._query_socket:
             self._query_socket.close()
@@ -13,6 +13,7 @@ No MCP tools - just text-based orchestration.
 
 import asyncio
 import re
+from itertools import islice
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 from dataclasses import dataclass
@@ -757,7 +758,7 @@ def _create_query_tools(reter_client=None):
                 for i, row in enumerate(results[:limit]):
                     if isinstance(row, dict):
                         # Format dict nicely
-                        row_str = ", ".join(f"{k}={v}" for k, v in list(row.items())[:5])
+                        row_str = ", ".join(f"{k}={v}" for k, v in islice(row.items(), 5))
                         if len(row) > 5:
                             row_str += f", ... ({len(row)} fields)"
                     else:
@@ -20,6 +20,10 @@ Supported settings in reter_code.json:
     "rag_embedding_cache_size": 1000,      // -> RETER_RAG_CACHE_SIZE
     "rag_max_body_lines": 50,              // -> RETER_RAG_MAX_BODY_LINES
     "rag_batch_size": 32,                  // -> RETER_RAG_BATCH_SIZE
+    "rag_index_type": "flat",              // -> RETER_RAG_INDEX_TYPE ("flat" or "sq8")
+    "rag_use_gpu": false,                  // -> RETER_RAG_USE_GPU (needs faiss-gpu)
+    "rag_gpu_min_vectors": 50000,          // -> RETER_RAG_GPU_MIN_VECTORS
+    "rag_persist_analysis": false,         // -> RETER_RAG_PERSIST_ANALYSIS (keep pair searches across restarts)
     "rag_index_markdown": true,            // -> RETER_RAG_INDEX_MARKDOWN
     "rag_markdown_include": "**/*.md",     // -> RETER_RAG_MARKDOWN_INCLUDE
     "rag_markdown_exclude": "node_modules/**",  // -> RETER_RAG_MARKDOWN_EXCLUDE
@@ -67,6 +71,10 @@ class ConfigLoader:
         "rag_embedding_cache_size": "RETER_RAG_CACHE_SIZE",
         "rag_max_body_lines": "RETER_RAG_MAX_BODY_LINES",
         "rag_batch_size": "RETER_RAG_BATCH_SIZE",
+        "rag_index_type": "RETER_RAG_INDEX_TYPE",
+        "rag_use_gpu": "RETER_RAG_USE_GPU",
+        "rag_gpu_min_vectors": "RETER_RAG_GPU_MIN_VECTORS",
+        "rag_persist_analysis": "RETER_RAG_PERSIST_ANALYSIS",
         "rag_index_markdown": "RETER_RAG_INDEX_MARKDOWN",
         "rag_markdown_include": "RETER_RAG_MARKDOWN_INCLUDE",
         "rag_markdown_exclude": "RETER_RAG_MARKDOWN_EXCLUDE",
@@ -86,6 +94,10 @@ class ConfigLoader:
         "rag_embedding_cache_size": 1000,
         "rag_max_body_lines": 50,
         "rag_batch_size": 32,
+        "rag_index_type": "flat",
+        "rag_use_gpu": False,
+        "rag_gpu_min_vectors": 50000,
+        "rag_persist_analysis": False,
         "rag_index_markdown": True,
         "rag_markdown_include": "**/*.md",
         "rag_markdown_exclude": "node_modules/**",
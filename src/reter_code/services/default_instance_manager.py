@@ -25,6 +25,8 @@ RAG Integration:
 import os
 import hashlib
 import threading
+import weakref
+from itertools import islice
 from pathlib import Path
 from typing import Dict, List, Set, Optional, Tuple, Any, TYPE_CHECKING
 from ..logging_config import configure_logger_for_debug_trace
@@ -177,6 +179,14 @@ class DefaultInstanceManager:
 
     INSTANCE_NAME = "default"
 
+    # Most recently created manager, for code running without a server context
+    _current: Optional["weakref.ref[DefaultInstanceManager]"] = None
+
+    @classmethod
+    def get_instance(cls) -> Optional["DefaultInstanceManager"]:
+        """Get the most recently created default instance manager, if alive."""
+        return cls._current() if cls._current is not None else None
+
     def __init__(self, persistence: "StatePersistenceService", progress_callback: Optional[Any] = None):
         """
         Initialize the default instance manager.
@@ -228,6 +238,8 @@ class DefaultInstanceManager:
         # Read configuration from environment
         self._load_config()
 
+        DefaultInstanceManager._current = weakref.ref(self)
+
     def _load_config(self) -> None:
         """Load configuration from environment variables or auto-detect from CWD."""
         root = os.getenv("RETER_PROJECT_ROOT")
@@ -1156,6 +1168,17 @@ class DefaultInstanceManager:
                 if rel_path_str.startswith("CMakeFiles/") or rel_path_str.startswith("build/"):
                     continue
 
+                # Reuse the persisted MD5 when mtime and size are unchanged
+                cached = self._source_state.get_file(rel_path_str) if self._source_state else None
+                if cached is not None and cached.md5:
+                    try:
+                        stat = code_file.stat()
+                        if cached.mtime == stat.st_mtime and cached.size == stat.st_size:
+                            files[rel_path_str] = (str(code_file), cached.md5)
+                            continue
+                    except OSError:
+                        pass
+
                 # Read file and compute MD5
                 try:
                     content = code_file.read_text(encoding='utf-8')
@@ -1408,7 +1431,7 @@ class DefaultInstanceManager:
 
         # Debug: log first few current files for comparison
         logger.debug(f"[default] _sync_files: {len(current_files)} current files, {len(existing_sources)} existing sources")
-        for i, (rel_path, (abs_path, current_md5)) in enumerate(list(current_files.items())[:5]):
+        for i, (rel_path, (abs_path, current_md5)) in enumerate(islice(current_files.items(), 5)):
             logger.debug(f"[default]   current[{i}]: {rel_path} -> md5={current_md5[:8]}...")
 
         # Count files to add/modify for deciding on entity accumulation
@@ -550,15 +550,12 @@ class EmbeddingService:
         if query_norm == 0:
             return np.zeros(len(embeddings), dtype=np.float32)
 
-        query_normalized = query_embedding / query_norm
-
-        # Normalize embeddings
+        # Scale the raw dot products by the norms instead of building a
+        # normalized copy of the whole (n, dim) matrix
         norms = np.linalg.norm(embeddings, axis=1)
         norms[norms == 0] = 1.0  # Avoid division by zero
-        embeddings_normalized = embeddings / norms[:, np.newaxis]
-
-        # Compute dot products
-        similarities = np.dot(embeddings_normalized, query_normalized)
+        similarities = np.dot(embeddings, query_embedding)
+        similarities /= norms * query_norm
 
         return similarities.astype(np.float32)
 
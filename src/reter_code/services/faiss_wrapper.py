@@ -9,11 +9,15 @@ Provides a high-level interface for FAISS operations with support for:
 - Both flat and IVF index types
 """
 
+import hashlib
 import logging
+import os
+import threading
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, Tuple, List, Dict, Any
-from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+from dataclasses import dataclass, replace
 
 import numpy as np
 
@@ -74,36 +78,78 @@ class FAISSWrapper:
 
     Attributes:
         dimension: Vector dimension
-        index_type: Type of index ("flat" or "ivf")
+        index_type: Type of index ("flat", "sq8", "ivf" or "hnsw")
         metric: Distance metric ("ip" for inner product, "l2" for Euclidean)
     """
 
+    # Query rows per FAISS search call in find_similar_pairs
+    PAIR_SEARCH_BLOCK = 4096
+    # Pair search / K-means results kept until the index changes
+    ANALYSIS_CACHE_SIZE = 8
+
     def __init__(
         self,
         dimension: int = 768,
         index_type: str = "flat",
         metric: str = "ip",
-        nlist: int = 100
+        nlist: int = 100,
+        hnsw_m: int = 32,
+        ef_construction: int = 200,
+        ef_search: int = 64,
+        use_gpu: bool = False,
+        gpu_min_vectors: int = 50000,
+        persist_analysis: bool = False
     ):
         """
         Initialize the FAISS wrapper.
 
         Args:
             dimension: Vector dimension (must match embedding model)
-            index_type: "flat" for exact search, "ivf" for approximate (faster for large indices)
+            index_type: "flat" for exact search, "sq8" for 8-bit scalar-quantized
+                vectors (4x less memory), "ivf" or "hnsw" for approximate
+                (faster for large indices; HNSW does not support removal)
             metric: "ip" for inner product (cosine after normalization), "l2" for Euclidean
             nlist: Number of clusters for IVF index (ignored for flat)
+            hnsw_m: Graph neighbors per node for HNSW index
+            ef_construction: HNSW build-time search depth
+            ef_search: HNSW query-time search depth
+            use_gpu: Run bulk pair search and K-means on GPU (faiss-gpu) when
+                available; falls back to CPU otherwise
+            gpu_min_vectors: Minimum index size before the GPU is used
+            persist_analysis: Keep pair search results in a file next to the
+                saved index, written on save() and close(), so they survive a
+                restart while the index is unchanged
         """
         if not FAISS_AVAILABLE:
             raise ImportError(
                 "faiss is required for RAG functionality. "
                 "Install with: pip install faiss-cpu"
             )
+        if index_type == "sq8" and metric != "ip":
+            raise ValueError(
+                "sq8 index requires metric='ip' (quantizes unit vectors)"
+            )
 
         self._dimension = dimension
         self._index_type = index_type
         self._metric = metric
         self._nlist = nlist
+        self._hnsw_m = hnsw_m
+        self._ef_construction = ef_construction
+        self._ef_search = ef_search
+        self._use_gpu = use_gpu
+        self._gpu_min_vectors = gpu_min_vectors
+        self._gpu_resources = None
+        self._gpu_index = None  # GPU copy of the flat base index
+        self._gpu_id_map: Optional[np.ndarray] = None
+        self._gpu_lock = threading.Lock()  # One GPU copy per index state
+        self._analysis_cache: Dict[Tuple, Any] = {}
+        # Detectors run concurrently share the cache
+        self._analysis_lock = threading.Lock()
+        self._generation = 0  # Bumped with every cache invalidation
+        self._persist_analysis = persist_analysis
+        # File holding exactly the in-memory index; None once it changes
+        self._index_path: Optional[str] = None
         self._index: Optional[faiss.IndexIDMap2] = None
         self._next_id: int = 0
         self._is_trained: bool = False
@@ -129,10 +175,24 @@ class FAISSWrapper:
         """
         Create a new FAISS index.
 
-        Creates either a flat index (exact search) or IVF index (approximate search).
-        Both are wrapped in IndexIDMap to support deletion by ID.
+        Creates a flat index (exact search), an SQ8 index (exact search over
+        8-bit codes), or an IVF or HNSW index (approximate search). All are
+        wrapped in IndexIDMap for custom IDs.
         """
-        if self._metric == "ip":
+        faiss_metric = (
+            faiss.METRIC_INNER_PRODUCT if self._metric == "ip" else faiss.METRIC_L2
+        )
+        if self._index_type == "sq8":
+            base_index = faiss.IndexScalarQuantizer(
+                self._dimension, faiss.ScalarQuantizer.QT_8bit, faiss_metric
+            )
+            self._is_trained = False
+        elif self._index_type == "hnsw":
+            base_index = faiss.IndexHNSWFlat(self._dimension, self._hnsw_m, faiss_metric)
+            base_index.hnsw.efConstruction = self._ef_construction
+            base_index.hnsw.efSearch = self._ef_search
+            self._is_trained = True
+        elif self._metric == "ip":
             # Inner product (use for normalized vectors / cosine similarity)
             if self._index_type == "ivf":
                 quantizer = faiss.IndexFlatIP(self._dimension)
@@ -157,6 +217,7 @@ class FAISSWrapper:
 
         # Wrap in IndexIDMap to support custom IDs and deletion
         self._index = faiss.IndexIDMap2(base_index)
+        self._index_changed()
         self._next_id = 0
 
         logger.info(
@@ -164,6 +225,106 @@ class FAISSWrapper:
             f"metric={self._metric}, dim={self._dimension}"
         )
 
+    def _index_changed(self) -> None:
+        """Drop everything derived from the stored vectors."""
+        with self._gpu_lock:
+            self._gpu_index = None
+            self._gpu_id_map = None
+        with self._analysis_lock:
+            self._analysis_cache.clear()
+            self._generation += 1
+        self._index_path = None
+
+    def _cached_analysis(self, key: Tuple, compute: Callable[[], Any]) -> Any:
+        """
+        Return the result of compute() for key, computing it only once per
+        index state.
+
+        Duplicate and cluster detectors run over the same unchanged index
+        with the same settings share one pair search or K-means pass. A
+        result computed while the index changed is returned but not cached.
+        """
+        with self._analysis_lock:
+            if key in self._analysis_cache:
+                return self._analysis_cache[key]
+            generation = self._generation
+        result = compute()
+        with self._analysis_lock:
+            if generation != self._generation:
+                return result
+            if (key not in self._analysis_cache
+                    and len(self._analysis_cache) >= self.ANALYSIS_CACHE_SIZE):
+                del self._analysis_cache[next(iter(self._analysis_cache))]
+            self._analysis_cache[key] = result
+        return result
+
+    def _pair_searches_path(self) -> Optional[Path]:
+        """Sidecar file for persisted pair searches, if persistence applies."""
+        if not self._persist_analysis or self._index_path is None:
+            return None
+        return Path(self._index_path + ".pairs.npz")
+
+    def _id_set_digest(self) -> np.ndarray:
+        """Identity of the stored id set, tying a sidecar to one index state."""
+        ids = np.sort(faiss.vector_to_array(self._index.id_map).astype(np.int64))
+        digest = hashlib.blake2b(ids.tobytes(), digest_size=16)
+        digest.update(np.int64(self._next_id).tobytes())
+        return np.frombuffer(digest.digest(), dtype=np.uint8)
+
+    def _save_pair_searches(self) -> None:
+        """Write the cached pair searches next to the saved index."""
+        path = self._pair_searches_path()
+        if path is None:
+            return
+        with self._analysis_lock:
+            entries = [(key, value) for key, value in self._analysis_cache.items()
+                       if key[0] == "pairs"]
+        try:
+            if not entries:
+                path.unlink(missing_ok=True)
+                return
+            arrays = {"ids_digest": self._id_set_digest()}
+            for i, ((_, threshold, k, allowed), (lo, hi, scores, order)) in enumerate(entries):
+                arrays[f"{i}_params"] = np.array([threshold, k], dtype=np.float64)
+                if allowed is not None:
+                    arrays[f"{i}_allowed"] = np.frombuffer(allowed, dtype=np.int64)
+                arrays[f"{i}_lo"] = lo
+                arrays[f"{i}_hi"] = hi
+                arrays[f"{i}_scores"] = scores
+                arrays[f"{i}_order"] = order
+            # Written whole, then renamed, so a reader never sees a partial file
+            tmp_path = path.with_name(path.name + ".tmp")
+            with open(tmp_path, "wb") as f:
+                np.savez(f, **arrays)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Could not persist pair searches to {path}: {e}")
+
+    def _load_pair_searches(self) -> None:
+        """Restore pair searches saved with the index just loaded."""
+        path = self._pair_searches_path()
+        if path is None or not path.exists():
+            return
+        try:
+            with np.load(path) as data:
+                if not np.array_equal(data["ids_digest"], self._id_set_digest()):
+                    return
+                i = 0
+                while f"{i}_params" in data.files:
+                    threshold, k = data[f"{i}_params"].tolist()
+                    allowed = (data[f"{i}_allowed"].tobytes()
+                               if f"{i}_allowed" in data.files else None)
+                    key = ("pairs", threshold, int(k), allowed)
+                    entry = (
+                        data[f"{i}_lo"], data[f"{i}_hi"],
+                        data[f"{i}_scores"], data[f"{i}_order"],
+                    )
+                    with self._analysis_lock:
+                        self._analysis_cache[key] = entry
+                    i += 1
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"Ignoring unreadable pair searches in {path}: {e}")
+
     def _ensure_index(self) -> None:
         """Ensure index is initialized."""
         if self._index is None:
@@ -234,8 +395,18 @@ class FAISSWrapper:
             # Update next_id to avoid collisions
             self._next_id = max(self._next_id, int(ids.max()) + 1)
 
-        # Train IVF index if needed
-        if self._index_type == "ivf" and not self._is_trained:
+        # Train SQ8 / IVF index if needed
+        if self._index_type == "sq8" and not self._is_trained:
+            # Vectors are unit length, so every component lies in [-1, 1];
+            # training on that fixed range means no later batch is clamped,
+            # however small the first one was
+            base_index = faiss.downcast_index(self._index.index)
+            bounds = np.ones((2, self._dimension), dtype=np.float32)
+            bounds[0] = -1.0
+            base_index.train(bounds)
+            self._is_trained = True
+            logger.info("Trained SQ8 index on the unit vector range")
+        elif self._index_type == "ivf" and not self._is_trained:
             # Need at least nlist vectors to train
             if n >= self._nlist:
                 # Get the underlying index for training
@@ -251,6 +422,7 @@ class FAISSWrapper:
 
         # Add vectors with IDs
         self._index.add_with_ids(vectors, ids)
+        self._index_changed()
 
         logger.debug(f"Added {n} vectors, total now: {self._index.ntotal}")
         return ids
@@ -278,6 +450,7 @@ class FAISSWrapper:
         # Create ID selector for removal
         id_selector = faiss.IDSelectorArray(len(ids), faiss.swig_ptr(ids))
         removed = self._index.remove_ids(id_selector)
+        self._index_changed()
 
         logger.debug(
             f"Removed {removed} vectors, "
@@ -426,8 +599,24 @@ class FAISSWrapper:
         Path(path).parent.mkdir(parents=True, exist_ok=True)
 
         faiss.write_index(self._index, path)
+        self._index_path = path
+        if self._persist_analysis:
+            self._save_pair_searches()
+        else:
+            # Left by an earlier save with persistence on; no longer matches
+            Path(path + ".pairs.npz").unlink(missing_ok=True)
         logger.info(f"Saved FAISS index to {path} ({self._index.ntotal} vectors)")
 
+    def close(self) -> None:
+        """
+        Write pair searches cached since the last save or load.
+
+        Only applies while the index still matches the file on disk; the
+        index itself is left as is.
+        """
+        if self._persist_analysis:
+            self._save_pair_searches()
+
     def load(self, path: str) -> None:
         """
         Load index from file.
@@ -442,12 +631,19 @@ class FAISSWrapper:
             raise FileNotFoundError(f"Index file not found: {path}")
 
         self._index = faiss.read_index(path)
+        self._index_changed()
 
         # Infer properties from loaded index
         self._dimension = self._index.d
+        self._index_type = self._index_type_of(self._index)
+        self._metric = (
+            "ip" if self._index.metric_type == faiss.METRIC_INNER_PRODUCT else "l2"
+        )
 
         # Update next_id based on existing vectors
-        if self._index.ntotal > 0:
+        if self._index.ntotal > 0 and hasattr(self._index, "id_map"):
+            self._next_id = int(faiss.vector_to_array(self._index.id_map).max()) + 1
+        elif self._index.ntotal > 0:
             # Try to get max ID (this may not work for all index types)
             try:
                 # Search for a dummy vector to get some IDs
@@ -460,11 +656,28 @@ class FAISSWrapper:
 
         self._is_trained = True  # Loaded index is always trained
 
+        self._index_path = path
+        self._load_pair_searches()
+
         logger.info(
             f"Loaded FAISS index from {path} "
             f"({self._index.ntotal} vectors, dim={self._dimension})"
         )
 
+    @staticmethod
+    def _index_type_of(index: Any) -> str:
+        """Index type name ("flat", "sq8", "ivf" or "hnsw") of a FAISS index."""
+        if hasattr(index, "id_map"):
+            index = index.index
+        base_index = faiss.downcast_index(index)
+        if isinstance(base_index, faiss.IndexScalarQuantizer):
+            return "sq8"
+        if isinstance(base_index, faiss.IndexHNSW):
+            return "hnsw"
+        if isinstance(base_index, faiss.IndexIVF):
+            return "ivf"
+        return "flat"
+
     def clear(self) -> None:
         """Clear all vectors from the index."""
         if self._index is not None:
@@ -493,6 +706,17 @@ class FAISSWrapper:
             return np.array([], dtype=np.float32).reshape(0, self._dimension), np.array([], dtype=np.int64)
 
         n = self._index.ntotal
+
+        # Fast path: IDs straight from the IndexIDMap and vectors in one
+        # bulk reconstruct, in the same storage order
+        if hasattr(self._index, "id_map"):
+            try:
+                ids = faiss.vector_to_array(self._index.id_map).astype(np.int64)
+                vectors = self._index.index.reconstruct_n(0, n)
+                return np.ascontiguousarray(vectors, dtype=np.float32), ids
+            except RuntimeError:
+                pass  # e.g. IVF without a direct map
+
         dummy = np.zeros((1, self._dimension), dtype=np.float32)
         _, all_ids = self._index.search(dummy, n)
         all_ids = all_ids[0]
@@ -509,11 +733,86 @@ class FAISSWrapper:
 
         return vectors, valid_ids
 
+    def _gpu_available(self, n_vectors: int) -> bool:
+        """Check whether a bulk operation over n_vectors should run on GPU."""
+        if not self._use_gpu or n_vectors < self._gpu_min_vectors:
+            return False
+        if not hasattr(faiss, "StandardGpuResources") or faiss.get_num_gpus() == 0:
+            logger.info("No GPU available for FAISS, using CPU")
+            self._use_gpu = False
+            return False
+        return True
+
+    def _search_blocks(self, vectors: np.ndarray,
+                       k: int) -> Iterator[Tuple[int, np.ndarray, np.ndarray]]:
+        """
+        Yield (start, distances, ids) for each PAIR_SEARCH_BLOCK rows of vectors.
+
+        With more than one block, the next block is searched on a worker
+        thread while the caller filters the current one; FAISS and NumPy
+        both release the GIL, so the two overlap. Only one search runs at
+        a time.
+        """
+        starts = range(0, len(vectors), self.PAIR_SEARCH_BLOCK)
+
+        def search(start):
+            return self._bulk_search(vectors[start:start + self.PAIR_SEARCH_BLOCK], k)
+
+        if len(starts) == 1:
+            yield (0, *search(0))
+            return
+
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            pending = pool.submit(search, starts[0])
+            for i, start in enumerate(starts):
+                distances, ids = pending.result()
+                if i + 1 < len(starts):
+                    pending = pool.submit(search, starts[i + 1])
+                yield start, distances, ids
+
+    def _bulk_search(self, vectors: np.ndarray, k: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Search the index with many already-normalized query vectors.
+
+        Large flat indices are copied once to GPU memory and kept resident
+        until the index changes; otherwise the CPU index is searched.
+        """
+        if self._index_type != "flat" or not self._gpu_available(self._index.ntotal):
+            return self._index.search(vectors, k)
+
+        with self._gpu_lock:
+            if self._gpu_index is None:
+                if self._gpu_resources is None:
+                    self._gpu_resources = faiss.StandardGpuResources()
+                self._gpu_index = faiss.index_cpu_to_gpu(
+                    self._gpu_resources, 0, self._index.index
+                )
+                self._gpu_id_map = faiss.vector_to_array(self._index.id_map)
+                logger.info(f"Copied FAISS index to GPU ({self._index.ntotal} vectors)")
+            gpu_index, id_map = self._gpu_index, self._gpu_id_map
+
+        # The GPU copy holds the base index, so map storage positions to IDs
+        distances, positions = gpu_index.search(vectors, k)
+        ids = np.where(positions >= 0, id_map[positions], -1)
+        return distances, ids
+
     def cluster_vectors(self, n_clusters=50, niter=20, min_cluster_size=2, seed=42):
-        """Cluster all vectors in the index using K-means."""
+        """Cluster all vectors in the index using K-means (seeded, so cached
+        per index state)."""
         if self._index is None or self._index.ntotal == 0:
             return [], np.array([], dtype=np.int64)
 
+        clusters, assignments = self._cached_analysis(
+            ("kmeans", n_clusters, niter, min_cluster_size, seed),
+            lambda: self._cluster_vectors(n_clusters, niter, min_cluster_size, seed),
+        )
+        # Copies, so callers cannot alter the cached result
+        return [
+            replace(c, centroid=c.centroid.copy(), member_ids=list(c.member_ids))
+            for c in clusters
+        ], assignments.copy()
+
+    def _cluster_vectors(self, n_clusters, niter, min_cluster_size, seed):
         vectors, ids = self.get_all_vectors_with_ids()
         n_vectors = len(vectors)
 
@@ -522,7 +821,10 @@ class FAISSWrapper:
 
         logger.info(f"Clustering {n_vectors} vectors into {n_clusters} clusters...")
 
-        kmeans = faiss.Kmeans(d=self._dimension, k=n_clusters, niter=niter, verbose=False, seed=seed)
+        kmeans = faiss.Kmeans(
+            d=self._dimension, k=n_clusters, niter=niter, verbose=False, seed=seed,
+            gpu=self._gpu_available(n_vectors)
+        )
         kmeans.train(vectors)
 
         distances, assignments = kmeans.index.search(vectors, 1)
@@ -641,7 +943,8 @@ class FAISSWrapper:
         logger.info(f"Returning {len(clusters)} clusters with >= {min_cluster_size} members")
         return clusters, assignments
 
-    def find_similar_pairs(self, similarity_threshold=0.85, max_pairs=100, k=10):
+    def find_similar_pairs(self, similarity_threshold=0.85, max_pairs=100, k=10,
+                           allowed_ids=None):
         """Find pairs of vectors that are highly similar.
 
         Args:
@@ -650,40 +953,100 @@ class FAISSWrapper:
             k: Number of nearest neighbors to search per vector. Increase this when
                filtering by entity_types since the top neighbors may be dominated
                by other entity types (e.g., string_literals from log messages).
+            allowed_ids: Optional iterable of vector IDs. Only these vectors are
+               used as queries, and neighbors outside the set are dropped, so
+               every returned pair has both IDs in allowed_ids. The neighbor
+               search itself still runs over the whole index: a query's k
+               nearest neighbors may be mostly outside the set, so raise k
+               when the set is a small part of the index.
         """
         if self._index is None or self._index.ntotal < 2:
             return []
 
+        allowed = None
+        if allowed_ids is not None:
+            allowed = np.fromiter(allowed_ids, dtype=np.int64)
+        k = min(k, self._index.ntotal)
+
+        # All pairs above the threshold, best first; max_pairs only cuts the
+        # cached list, so callers asking for different limits share it
+        key = ("pairs", float(similarity_threshold), k,
+               None if allowed is None else np.sort(allowed).tobytes())
+        lo, hi, pair_scores, order = self._cached_analysis(
+            key, lambda: self._similar_pairs(similarity_threshold, k, allowed)
+        )
+        return [
+            (int(lo[i]), int(hi[i]), float(pair_scores[i])) for i in order[:max_pairs]
+        ]
+
+    def _similar_pairs(self, similarity_threshold, k, allowed):
+        """Return (lo, hi, scores, order) arrays for find_similar_pairs."""
+        empty = np.array([], dtype=np.int64)
         vectors, ids = self.get_all_vectors_with_ids()
+        allowed_mask = None
+        if allowed is not None:
+            if len(ids) and ids.min() >= 0:
+                # Membership table over the id range, looked up directly
+                # instead of np.isin re-sorting allowed for every block; the
+                # spare last slot stays False for the -1 padding
+                allowed_mask = np.zeros(int(ids.max()) + 2, dtype=bool)
+                allowed_mask[allowed[(allowed >= 0) & (allowed <= ids.max())]] = True
+                keep = allowed_mask[ids]
+            else:
+                keep = np.isin(ids, allowed)
+            vectors, ids = vectors[keep], ids[keep]
         n_vectors = len(vectors)
+        if n_vectors < 2:
+            return empty, empty, np.array([]), empty
 
-        k = min(k, n_vectors)
-        distances, neighbor_ids = self.search(vectors, k)
-
-        pairs = []
-        seen_pairs = set()
+        # Stored vectors are already normalized, so query the index directly.
+        # Queries run in row blocks and the threshold is applied per block, so
+        # only (lo, hi, score) triples of surviving pairs are kept
+        lo_parts, hi_parts, score_parts = [], [], []
+        for start, distances, neighbor_ids in self._search_blocks(vectors, k):
+            block_ids = ids[start:start + self.PAIR_SEARCH_BLOCK]
 
-        for i in range(n_vectors):
-            vec_id = int(ids[i])
-            for j in range(k):
-                neighbor_id = int(neighbor_ids[i][j])
-                if neighbor_id == -1 or neighbor_id == vec_id:
-                    continue
-
-                pair = (min(vec_id, neighbor_id), max(vec_id, neighbor_id))
-                if pair in seen_pairs:
-                    continue
-                seen_pairs.add(pair)
-
-                distance = float(distances[i][j])
-                if self._metric == "ip":
-                    score = max(0.0, min(1.0, (distance + 1.0) / 2.0))
-                else:
-                    score = float(np.exp(-distance))
-
-                if score >= similarity_threshold:
-                    pairs.append((pair[0], pair[1], score))
+            distances = distances.astype(np.float64)
+            if self._metric == "ip":
+                scores = np.clip((distances + 1.0) / 2.0, 0.0, 1.0)
+            else:
+                scores = np.exp(-distances)
+
+            # Mask out padding, self matches, weak and (optionally) foreign
+            # neighbors in one pass
+            keep = (
+                (neighbor_ids != -1)
+                & (neighbor_ids != block_ids[:, None])
+                & (scores >= similarity_threshold)
+            )
+            if allowed_mask is not None:
+                keep &= allowed_mask[neighbor_ids]
+            elif allowed is not None:
+                keep &= np.isin(neighbor_ids, allowed)
+
+            rows, cols = np.nonzero(keep)
+            vec_ids = block_ids[rows]
+            hit_ids = neighbor_ids[rows, cols]
+            lo_parts.append(np.minimum(vec_ids, hit_ids))
+            hi_parts.append(np.maximum(vec_ids, hit_ids))
+            score_parts.append(scores[rows, cols])
+
+        lo = np.concatenate(lo_parts)
+        if len(lo) == 0:
+            return empty, empty, np.array([]), empty
+        hi = np.concatenate(hi_parts)
+        pair_scores = np.concatenate(score_parts)
+
+        # Each unordered pair is reported once, from its first occurrence;
+        # ties in score keep that encounter order. Pairs are keyed by one
+        # int64 (the ranks of lo and hi among the searched ids), which
+        # np.unique sorts far faster than rows of a 2-D array
+        sorted_ids = np.sort(ids)
+        keys = (np.searchsorted(sorted_ids, lo) * n_vectors
+                + np.searchsorted(sorted_ids, hi))
+        _, first = np.unique(keys, return_index=True)
+        first.sort()
+        order = first[np.argsort(-pair_scores[first], kind="stable")]
+        return lo, hi, pair_scores, order
 
-        pairs.sort(key=lambda x: x[2], reverse=True)
-        return pairs[:max_pairs]
 
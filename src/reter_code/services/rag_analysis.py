@@ -8,7 +8,7 @@ These are extracted from RAGIndexManager as a mixin to reduce file size.
 """
 
 import time
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterable, List, Optional, Any
 
 import numpy as np
 
@@ -84,6 +84,7 @@ class RAGAnalysisMixin:
         )
 
         # Enrich clusters with metadata and filter
+        vector_metadata = self._metadata.get("vectors", {})
         enriched_clusters = []
 
         for cluster in clusters:
@@ -92,7 +93,7 @@ class RAGAnalysisMixin:
             classes_in_cluster = set()
 
             for vector_id in cluster.member_ids:
-                meta = self._metadata.get("vectors", {}).get(str(vector_id))
+                meta = vector_metadata.get(str(vector_id))
                 if not meta:
                     continue
 
@@ -230,6 +231,7 @@ class RAGAnalysisMixin:
         n_noise = int(np.sum(assignments == -1)) if len(assignments) > 0 else 0
 
         # Enrich clusters with metadata and filter
+        vector_metadata = self._metadata.get("vectors", {})
         enriched_clusters = []
 
         for cluster in clusters:
@@ -238,7 +240,7 @@ class RAGAnalysisMixin:
             classes_in_cluster = set()
 
             for vector_id in cluster.member_ids:
-                meta = self._metadata.get("vectors", {}).get(str(vector_id))
+                meta = vector_metadata.get(str(vector_id))
                 if not meta:
                     continue
 
@@ -351,83 +353,73 @@ class RAGAnalysisMixin:
                 "pairs": [],
             }
 
-        # Find similar pairs
-        # If filtering by entity_types, we need to fetch more pairs since
-        # other entity types (e.g., string_literals from log messages) often
-        # dominate the top similarity scores in k-NN search
+        vector_metadata = self._metadata.get("vectors", {})
+
+        # Find similar pairs. The entity type filter is pushed into the
+        # pair search: only matching vectors are used as queries and only
+        # pairs of two matching vectors come back, so the over-fetch only
+        # covers the same-file/class exclusions
+        allowed_ids = None
         if entity_types:
-            # Fetch a lot more when filtering - other types often fill top slots
-            fetch_multiplier = 100
-            # Also increase k for k-NN search - with mixed entity types, the
-            # top-k neighbors of a method are often dominated by its own
-            # string literals (log messages), not other methods
+            wanted = set(entity_types)
+            allowed_ids = [
+                int(vid) for vid, meta in vector_metadata.items()
+                if meta.get("entity_type") in wanted
+            ]
+            # With mixed entity types, the top-k neighbors of a method are
+            # often its own string literals (log messages), not other methods
             k_neighbors = 100
         else:
-            fetch_multiplier = 5
             k_neighbors = 10
 
         raw_pairs = self._faiss_wrapper.find_similar_pairs(
             similarity_threshold=similarity_threshold,
-            max_pairs=max_results * fetch_multiplier,
+            max_pairs=max_results * 5,
             k=k_neighbors,
+            allowed_ids=allowed_ids,
         )
 
-        # Enrich and filter pairs
-        enriched_pairs = []
-
+        # Resolve both sides once, then apply the exclusions as boolean masks
+        # over all candidate pairs; result dicts are only built for survivors
+        resolved = []
         for id1, id2, similarity in raw_pairs:
-            meta1 = self._metadata.get("vectors", {}).get(str(id1))
-            meta2 = self._metadata.get("vectors", {}).get(str(id2))
-
-            if not meta1 or not meta2:
-                continue
-
-            # Apply entity type filter
-            if entity_types:
-                if meta1.get("entity_type") not in entity_types:
-                    continue
-                if meta2.get("entity_type") not in entity_types:
-                    continue
-
-            file1 = meta1.get("file", "")
-            file2 = meta2.get("file", "")
-            class1 = meta1.get("class_name", "")
-            class2 = meta2.get("class_name", "")
+            meta1 = vector_metadata.get(str(id1))
+            meta2 = vector_metadata.get(str(id2))
+            if meta1 and meta2:
+                resolved.append((similarity, meta1, meta2))
 
+        enriched_pairs = []
+        if resolved:
+            # Strings are interned to integer codes shared by both sides, so
+            # the comparisons below run on int arrays; "" is code 0
+            codes: Dict[str, int] = {"": 0}
             # Normalize paths for comparison (handle / vs \ differences)
-            file1_norm = file1.replace("\\", "/")
-            file2_norm = file2.replace("\\", "/")
-
-            # Apply exclusion filters
-            if exclude_same_file and file1_norm == file2_norm:
-                continue
-            if exclude_same_class and class1 and class1 == class2:
-                continue
-
-            enriched_pairs.append({
-                "similarity": round(similarity, 4),
-                "entity1": {
-                    "name": meta1.get("name", ""),
-                    "qualified_name": meta1.get("qualified_name", ""),
-                    "entity_type": meta1.get("entity_type", ""),
-                    "file": file1,
-                    "line": meta1.get("line", 0),
-                    "class_name": class1,
-                    "docstring_preview": meta1.get("docstring_preview", ""),
-                },
-                "entity2": {
-                    "name": meta2.get("name", ""),
-                    "qualified_name": meta2.get("qualified_name", ""),
-                    "entity_type": meta2.get("entity_type", ""),
-                    "file": file2,
-                    "line": meta2.get("line", 0),
-                    "class_name": class2,
-                    "docstring_preview": meta2.get("docstring_preview", ""),
-                },
-            })
-
-            if len(enriched_pairs) >= max_results:
-                break
+            files1 = self._interned((m1.get("file", "").replace("\\", "/") for _, m1, _ in resolved), codes)
+            files2 = self._interned((m2.get("file", "").replace("\\", "/") for _, _, m2 in resolved), codes)
+            lines1 = np.array([m1.get("line", 0) for _, m1, _ in resolved], dtype=object)
+            lines2 = np.array([m2.get("line", 0) for _, _, m2 in resolved], dtype=object)
+            names1 = self._interned((m1.get("name", "") for _, m1, _ in resolved), codes)
+            names2 = self._interned((m2.get("name", "") for _, _, m2 in resolved), codes)
+            classes1 = self._interned((m1.get("class_name") or "" for _, m1, _ in resolved), codes)
+            classes2 = self._interned((m2.get("class_name") or "" for _, _, m2 in resolved), codes)
+
+            same_file = files1 == files2
+            # Two vectors of one entity (e.g. overlapping chunks of a long
+            # method) are never a duplicate of each other
+            keep = ~(same_file & (lines1 == lines2) & (names1 == names2))
+            if exclude_same_file:
+                keep &= ~same_file
+            if exclude_same_class:
+                keep &= ~((classes1 != 0) & (classes1 == classes2))
+
+            enriched_pairs = [
+                {
+                    "similarity": round(resolved[i][0], 4),
+                    "entity1": self._duplicate_entity(resolved[i][1]),
+                    "entity2": self._duplicate_entity(resolved[i][2]),
+                }
+                for i in np.flatnonzero(keep)[:max_results].tolist()
+            ]
 
         time_ms = int((time.time() - start_time) * 1000)
 
@@ -444,6 +436,26 @@ class RAGAnalysisMixin:
             }
         }
 
+    @staticmethod
+    def _interned(values: Iterable[str], codes: Dict[str, int]) -> np.ndarray:
+        """Integer code per string; equal strings get equal codes across calls."""
+        return np.fromiter(
+            (codes.setdefault(value, len(codes)) for value in values), dtype=np.int64
+        )
+
+    @staticmethod
+    def _duplicate_entity(meta: Dict[str, Any]) -> Dict[str, Any]:
+        """Entity summary for one side of a duplicate pair."""
+        return {
+            "name": meta.get("name", ""),
+            "qualified_name": meta.get("qualified_name", ""),
+            "entity_type": meta.get("entity_type", ""),
+            "file": meta.get("file", ""),
+            "line": meta.get("line", 0),
+            "class_name": meta.get("class_name", ""),
+            "docstring_preview": meta.get("docstring_preview", ""),
+        }
+
     def analyze_documentation_relevance(
         self,
         min_relevance: float = 0.5,
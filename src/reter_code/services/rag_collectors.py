@@ -8,6 +8,7 @@ Extracted from RAGIndexManager to reduce file size.
 """
 
 from dataclasses import dataclass
+from itertools import islice
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple, TYPE_CHECKING
 
@@ -213,7 +214,7 @@ class RAGCollectorMixin:
                         rel_path = parts[1]  # Take part after /src/
                 module_name = rel_path.replace("/", ".")
                 changed_modules.add(module_name)
-            logger.debug(f"[RAG] _collect_all_python_literals_bulk: filtering by {len(changed_modules)} modules: {list(changed_modules)[:5]}...")
+            logger.debug(f"[RAG] _collect_all_python_literals_bulk: filtering by {len(changed_modules)} modules: {list(islice(changed_modules, 5))}...")
 
         try:
             query = """
@@ -313,7 +314,7 @@ class RAGCollectorMixin:
                 rel_path = rel_path.replace("\\", "/")
                 # For JavaScript, use the file path directly as the "module"
                 changed_modules.add(rel_path)
-            logger.debug(f"[RAG] _collect_all_javascript_literals_bulk: filtering by {len(changed_modules)} modules: {list(changed_modules)[:5]}...")
+            logger.debug(f"[RAG] _collect_all_javascript_literals_bulk: filtering by {len(changed_modules)} modules: {list(islice(changed_modules, 5))}...")
 
         try:
             query = """
@@ -6,13 +6,15 @@ Tightly integrated with DefaultInstanceManager for automatic synchronization
 when files change.
 """
 
+import fnmatch
 import hashlib
 import json
 import logging
 import time
 from datetime import datetime, UTC
+from itertools import islice
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Tuple, Callable, Set, TYPE_CHECKING
+from typing import Dict, List, Optional, Any, Tuple, Callable, Set, Iterator, TYPE_CHECKING
 
 import numpy as np
 
@@ -240,7 +242,7 @@ class RAGIndexManager(RAGAnalysisMixin, RAGCollectorMixin):
                 indexed_code[clean_key.replace("\\", "/")] = md5
 
             logger.debug(f"[RAG] get_sync_status: current_code has {len(current_code)} files, indexed_code has {len(indexed_code)} files")
-            logger.debug(f"[RAG] get_sync_status: _indexed_files sample keys: {list(self._indexed_files.keys())[:5]}")
+            logger.debug(f"[RAG] get_sync_status: _indexed_files sample keys: {list(islice(self._indexed_files, 5))}")
 
             stale_files = []
             missing_files = []
@@ -389,12 +391,28 @@ class RAGIndexManager(RAGAnalysisMixin, RAGCollectorMixin):
             f"model={self._embedding_service.model_name}"
         )
 
+    def _faiss_options(self) -> Dict[str, Any]:
+        """FAISSWrapper settings from reter_code.json / environment."""
+        from .config_loader import get_config_loader
+        rag_config = get_config_loader().get_rag_config()
+        index_type = rag_config.get("rag_index_type", "flat")
+        if index_type not in ("flat", "sq8"):
+            raise ValueError(
+                f"Unsupported rag_index_type {index_type!r} (expected 'flat' or 'sq8')"
+            )
+        return {
+            "index_type": index_type,
+            "use_gpu": rag_config.get("rag_use_gpu", False),
+            "gpu_min_vectors": rag_config.get("rag_gpu_min_vectors", 50000),
+            "persist_analysis": rag_config.get("rag_persist_analysis", False),
+        }
+
     def _create_new_index(self) -> None:
         """Create a new empty FAISS index."""
         self._faiss_wrapper = FAISSWrapper(
             dimension=self._embedding_service.embedding_dim,
-            index_type="flat",  # Use flat for smaller corpora
-            metric="ip"  # Inner product (cosine after normalization)
+            metric="ip",  # Inner product (cosine after normalization)
+            **self._faiss_options()
         )
         self._faiss_wrapper.create_index()
 
@@ -433,8 +451,8 @@ class RAGIndexManager(RAGAnalysisMixin, RAGCollectorMixin):
         # Load FAISS index
         self._faiss_wrapper = FAISSWrapper(
             dimension=self._metadata.get("embedding_dimension", 768),
-            index_type="flat",
-            metric="ip"
+            metric="ip",
+            **self._faiss_options()
         )
         self._faiss_wrapper.load(str(self._index_path))
 
@@ -468,6 +486,11 @@ class RAGIndexManager(RAGAnalysisMixin, RAGCollectorMixin):
 
         logger.debug(f"Saved RAG index: {self._faiss_wrapper.total_vectors} vectors")
 
+    def close(self) -> None:
+        """Persist analysis results computed since the index was last saved."""
+        if self._initialized and self._faiss_wrapper:
+            self._faiss_wrapper.close()
+
     def _load_rag_files(self) -> Dict[str, str]:
         """
         Load indexed files tracking from .default.rag_files.json.
@@ -3205,22 +3228,58 @@ class RAGIndexManager(RAGAnalysisMixin, RAGCollectorMixin):
         )
         search_time_ms = int((time.time() - search_start) * 1000)
 
-        # Filter and enrich results
-        results = []
+        # Filter and enrich lazily: only as many candidates as are needed get
+        # built, and file content is read only for the results returned
+        candidates = self._iter_search_results(
+            search_results, search_scope, entity_types, file_filter
+        )
+        if aggregate_chunks:
+            # Aggregate chunks: group by parent entity, keep highest score.
+            # Collect more for aggregation
+            results = self._aggregate_chunk_results(list(islice(candidates, top_k * 3)), top_k)
+        else:
+            results = list(islice(candidates, top_k))
+
+        if include_content:
+            for result in results:
+                result.content = self._get_entity_content(
+                    {"file": result.file, "line": result.line, "end_line": result.end_line}
+                )
+
+        stats = {
+            "query_embedding_time_ms": embed_time_ms,
+            "search_time_ms": search_time_ms,
+            "total_time_ms": int((time.time() - start_time) * 1000),
+            "total_vectors": self._faiss_wrapper.total_vectors,
+            "results_before_filter": len(search_results),
+        }
+
+        return results, stats
+
+    def _iter_search_results(
+        self,
+        search_results: List[SearchResult],
+        search_scope: str,
+        entity_types: Optional[List[str]],
+        file_filter: Optional[str],
+    ) -> Iterator[RAGSearchResult]:
+        """Yield search hits that pass the scope, type and file filters, in score order."""
+        # Code includes: python, javascript, html, csharp, cpp (and their literal variants)
+        code_types = ("python", "python_literal", "python_comment",
+                      "javascript", "javascript_literal", "html",
+                      "csharp", "cpp")
+        vector_metadata = self._metadata["vectors"]
+
         for sr in search_results:
             if sr.vector_id == -1:
                 continue
 
-            meta = self._metadata["vectors"].get(str(sr.vector_id))
+            meta = vector_metadata.get(str(sr.vector_id))
             if not meta:
                 continue
 
             # Apply scope filter
             source_type = meta.get("source_type", "python")
-            # Code includes: python, javascript, html, csharp, cpp (and their literal variants)
-            code_types = ("python", "python_literal", "python_comment",
-                          "javascript", "javascript_literal", "html",
-                          "csharp", "cpp")
             if search_scope == "code" and source_type not in code_types:
                 continue
             if search_scope == "docs" and source_type != "markdown":
@@ -3231,25 +3290,10 @@ class RAGIndexManager(RAGAnalysisMixin, RAGCollectorMixin):
                 continue
 
             # Apply file filter
-            if file_filter:
-                import fnmatch
-                file_path = meta.get("file", "")
-                if not fnmatch.fnmatch(file_path, file_filter):
-                    continue
-
-            # Build result
-            content = None
-            if include_content:
-                content = self._get_entity_content(meta)
-
-            # Extract chunk metadata if present
-            chunk_index = meta.get("chunk_index")
-            total_chunks = meta.get("total_chunks")
-            chunk_line_start = meta.get("chunk_line_start")
-            chunk_line_end = meta.get("chunk_line_end")
-            parent_qualified_name = meta.get("parent_qualified_name")
+            if file_filter and not fnmatch.fnmatch(meta.get("file", ""), file_filter):
+                continue
 
-            result = RAGSearchResult(
+            yield RAGSearchResult(
                 entity_type=meta.get("entity_type", "unknown"),
                 name=meta.get("name", ""),
                 qualified_name=meta.get("qualified_name", ""),
@@ -3260,36 +3304,16 @@ class RAGIndexManager(RAGAnalysisMixin, RAGCollectorMixin):
                 source_type=source_type,
                 docstring=meta.get("docstring_preview"),
                 content_preview=meta.get("content_preview"),
-                content=content,
                 heading=meta.get("heading"),
                 language=meta.get("language"),
                 class_name=meta.get("class_name"),
-                chunk_index=chunk_index,
-                total_chunks=total_chunks,
-                chunk_line_start=chunk_line_start,
-                chunk_line_end=chunk_line_end,
-                parent_qualified_name=parent_qualified_name,
+                # Chunk metadata, if present
+                chunk_index=meta.get("chunk_index"),
+                total_chunks=meta.get("total_chunks"),
+                chunk_line_start=meta.get("chunk_line_start"),
+                chunk_line_end=meta.get("chunk_line_end"),
+                parent_qualified_name=meta.get("parent_qualified_name"),
             )
-            results.append(result)
-
-            if len(results) >= top_k * 3:  # Collect more for aggregation
-                break
-
-        # Aggregate chunks: group by parent entity, keep highest score
-        if aggregate_chunks:
-            results = self._aggregate_chunk_results(results, top_k)
-        else:
-            results = results[:top_k]
-
-        stats = {
-            "query_embedding_time_ms": embed_time_ms,
-            "search_time_ms": search_time_ms,
-            "total_time_ms": int((time.time() - start_time) * 1000),
-            "total_vectors": self._faiss_wrapper.total_vectors,
-            "results_before_filter": len(search_results),
-        }
-
-        return results, stats
 
     def _aggregate_chunk_results(
         self,
@@ -9,6 +9,7 @@ Tests cover:
 """
 
 import pytest
+import pyarrow as pa
 from typing import Dict, Any, List
 
 from src.reter_code.dsl import (
@@ -31,7 +32,8 @@ from src.reter_code.dsl import (
     Registry, namespace
 )
 from src.reter_code.dsl.core import (
-    FilterStep, SelectStep, OrderByStep, LimitStep, MapStep
+    FilterStep, SelectStep, OrderByStep, LimitStep, MapStep, to_list,
+    RAGDuplicatesSource, _bind_query, _get_rag_manager,
 )
 
 
@@ -300,6 +302,12 @@ class TestSteps:
         assert result.is_ok()
         assert len(result.unwrap()) == 2
 
+    def test_limit_step_on_emptied_table(self):
+        # Steps return a column-less table when nothing is left
+        result = LimitStep(count=5).execute(pa.table({}))
+        assert result.is_ok()
+        assert result.unwrap().num_rows == 0
+
     def test_map_step(self, sample_data):
         step = MapStep(transform=lambda r: {"name": r["name"].upper()})
         result = step.execute(sample_data)
@@ -307,6 +315,56 @@ class TestSteps:
         data = result.unwrap()
         assert data[0]["name"] == "FOO"
 
+    def test_bind_query_substitutes_known_placeholders(self):
+        query = "SELECT ?c WHERE { ?c type class . FILTER(?n > {min}) } LIMIT {limit} {other}"
+        bound = _bind_query(query, {"min": 3, "limit": 10, "unused": "x"})
+        assert bound == "SELECT ?c WHERE { ?c type class . FILTER(?n > 3) } LIMIT 10 {other}"
+
+    def test_rag_duplicates_source_is_columnar(self):
+        pairs = [
+            {"similarity": 0.9,
+             "entity1": {"name": "a", "file": "a.py", "line": 1, "class_name": "A"},
+             "entity2": {"name": "b", "file": "b.py", "line": 2}},
+        ]
+
+        class MockRAG:
+            def find_duplicate_candidates(self, **kwargs):
+                return {"success": True, "pairs": pairs}
+
+        ctx = Context(reter=None, params={"rag_manager": MockRAG()})
+        data = RAGDuplicatesSource().execute(ctx).unwrap()
+        assert isinstance(data, pa.Table)
+        assert to_list(data) == [{
+            "similarity": 0.9,
+            "entity1_name": "a", "entity1_file": "a.py", "entity1_line": 1, "entity1_class": "A",
+            "entity2_name": "b", "entity2_file": "b.py", "entity2_line": 2, "entity2_class": "",
+        }]
+
+        # Values Arrow cannot put in one column stay as rows
+        pairs.append({"similarity": 0.8,
+                      "entity1": {"name": "c", "file": "c.py", "line": "?"},
+                      "entity2": {"name": "d", "file": "d.py", "line": 4}})
+        data = RAGDuplicatesSource().execute(ctx).unwrap()
+        assert isinstance(data, list)
+        assert [r["entity1_line"] for r in data] == [1, "?"]
+
+    def test_rag_manager_falls_back_to_default_instance(self, tmp_path, monkeypatch):
+        from types import SimpleNamespace
+        from reter_code.services.default_instance_manager import DefaultInstanceManager
+
+        monkeypatch.setenv("RETER_PROJECT_ROOT", str(tmp_path))
+        monkeypatch.setattr(DefaultInstanceManager, "_current", None)
+        assert _get_rag_manager(Context(reter=None, params={})) is None
+
+        default_mgr = DefaultInstanceManager(SimpleNamespace(snapshots_dir=tmp_path))
+        rag_manager = object()
+        default_mgr.set_rag_manager(rag_manager)
+        assert _get_rag_manager(Context(reter=None, params={})) is rag_manager
+
+        # The context still wins over the default instance
+        own = object()
+        assert _get_rag_manager(Context(reter=None, params={"rag_manager": own})) is own
+
 
 # =============================================================================
 # Pipeline Tests
@@ -354,6 +412,62 @@ class TestPipeline:
         data = result.unwrap()
         assert data[0]["count"] == 25
 
+    def test_order_by_multiple_fields(self):
+        rows = [
+            {"file": "b.py", "line": 3},
+            {"file": "a.py", "line": 9},
+            {"file": "b.py", "line": 1},
+            {"file": "a.py", "line": 2},
+        ]
+        for data in (rows, pa.Table.from_pylist(rows)):
+            pipeline = Pipeline.from_value(data).order_by("file", "-line")
+            result = pipeline.run(Context(reter=None, params={}))
+            assert result.is_ok()
+            assert to_list(result.unwrap()) == [
+                {"file": "a.py", "line": 9},
+                {"file": "a.py", "line": 2},
+                {"file": "b.py", "line": 3},
+                {"file": "b.py", "line": 1},
+            ]
+
+    def test_order_by_limit_selects_top_k(self, sample_data):
+        pipeline = Pipeline.from_value(sample_data).order_by("-count").limit(2)
+        assert pipeline._steps[0].limit == 2
+        for data in (sample_data, pa.Table.from_pylist(sample_data)):
+            result = Pipeline.from_value(data).order_by("-count").limit(2).run(
+                Context(reter=None, params={})
+            )
+            assert result.is_ok()
+            assert [r["count"] for r in to_list(result.unwrap())] == [25, 15]
+
+    def test_filter_limit_stops_early(self, sample_data):
+        seen = []
+
+        def predicate(r):
+            seen.append(r["name"])
+            return r["count"] > 1
+
+        pipeline = Pipeline.from_value(sample_data).filter(predicate).limit(1)
+        assert pipeline._steps[0].limit == 1
+        result = pipeline.run(Context(reter=None, params={}))
+        assert result.is_ok()
+        assert [r["name"] for r in result.unwrap()] == ["Foo"]
+        assert seen == ["Foo"]
+
+    def test_order_by_keeps_presorted_table(self):
+        table = pa.table({"file": ["a.py", "a.py", "b.py"], "line": [3, 9, 1]})
+        ctx = Context(reter=None, params={})
+
+        result = Pipeline.from_value(table).order_by("file", "line").run(ctx)
+        assert result.unwrap() is table
+
+        swapped = table.take([1, 0, 2])
+        result = Pipeline.from_value(swapped).order_by("file", "line").run(ctx)
+        assert result.unwrap().column("line").to_pylist() == [3, 9, 1]
+
+        result = Pipeline.from_value(table).order_by("file", "-line").run(ctx)
+        assert result.unwrap().column("line").to_pylist() == [9, 3, 1]
+
     def test_limit_method(self, sample_data):
         pipeline = (
             Pipeline.from_value(sample_data)
@@ -99,6 +99,167 @@ class TestFAISSWrapper:
         assert removed == 3
         assert wrapper.total_vectors == 7
 
+    def test_find_similar_pairs_after_removal(self, wrapper):
+        """Test pair search reads vectors and IDs in matching order."""
+        vectors = np.random.randn(10, 768).astype(np.float32)
+        vectors[9] = vectors[1] + 0.01 * np.random.randn(768).astype(np.float32)
+        wrapper.add_vectors(vectors)
+        wrapper.remove_vectors(np.array([0, 2, 4], dtype=np.int64))
+
+        all_vectors, all_ids = wrapper.get_all_vectors_with_ids()
+        assert sorted(all_ids.tolist()) == [1, 3, 5, 6, 7, 8, 9]
+        assert np.allclose(all_vectors[list(all_ids).index(9)], wrapper.get_vector(9))
+
+        pairs = wrapper.find_similar_pairs(similarity_threshold=0.95, k=5)
+        assert [(a, b) for a, b, _ in pairs] == [(1, 9)]
+
+    def test_analysis_cached_until_index_changes(self, wrapper):
+        """Test repeated pair searches and K-means share one pass per index state."""
+        vectors = np.random.randn(20, 768).astype(np.float32)
+        vectors[7] = vectors[2] + 0.01 * np.random.randn(768).astype(np.float32)
+        wrapper.add_vectors(vectors)
+
+        pairs = wrapper.find_similar_pairs(similarity_threshold=0.95, max_pairs=10, k=5)
+        calls = []
+        wrapper._bulk_search = lambda *args: calls.append(args)
+        assert wrapper.find_similar_pairs(similarity_threshold=0.95, max_pairs=1, k=5) == pairs[:1]
+        assert not calls
+
+        clusters, _ = wrapper.cluster_vectors(n_clusters=4, min_cluster_size=1)
+        again, _ = wrapper.cluster_vectors(n_clusters=4, min_cluster_size=1)
+        assert [c.member_ids for c in again] == [c.member_ids for c in clusters]
+        assert wrapper._analysis_cache
+
+        wrapper.remove_vectors(np.array([7], dtype=np.int64))
+        assert not wrapper._analysis_cache
+
+    def test_analysis_cache_concurrent(self, wrapper):
+        """Test concurrent detectors can fill and evict the analysis cache."""
+        from concurrent.futures import ThreadPoolExecutor
+        vectors = np.random.randn(40, 768).astype(np.float32)
+        wrapper.add_vectors(vectors)
+        thresholds = [0.5 + i / 100 for i in range(4 * wrapper.ANALYSIS_CACHE_SIZE)]
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(
+                lambda t: wrapper.find_similar_pairs(similarity_threshold=t, k=5),
+                thresholds,
+            ))
+        assert len(results) == len(thresholds)
+        assert len(wrapper._analysis_cache) <= wrapper.ANALYSIS_CACHE_SIZE
+
+    def test_analysis_not_cached_across_index_change(self, wrapper):
+        """Test a result computed while the index changed is not cached."""
+        vectors = np.random.randn(20, 768).astype(np.float32)
+        wrapper.add_vectors(vectors[:10])
+        compute = wrapper._similar_pairs
+
+        def compute_then_add(*args):
+            result = compute(*args)
+            wrapper.add_vectors(vectors[10:])
+            return result
+
+        wrapper._similar_pairs = compute_then_add
+        wrapper.find_similar_pairs(similarity_threshold=0.5, k=5)
+        assert not wrapper._analysis_cache
+
+    def test_cached_clusters_are_copies(self, wrapper):
+        """Test callers mutating cluster results do not alter the cache."""
+        vectors = np.random.randn(40, 768).astype(np.float32)
+        wrapper.add_vectors(vectors)
+        clusters, assignments = wrapper.cluster_vectors(n_clusters=4, min_cluster_size=1)
+        expected = [list(c.member_ids) for c in clusters], assignments.copy()
+
+        clusters[0].member_ids.append(999)
+        clusters[0].centroid[:] = 0
+        assignments[:] = -1
+
+        again, again_assignments = wrapper.cluster_vectors(n_clusters=4, min_cluster_size=1)
+        assert [list(c.member_ids) for c in again] == expected[0]
+        assert np.array_equal(again_assignments, expected[1])
+        assert np.any(again[0].centroid)
+
+    def test_similar_pairs_restricted_to_allowed_ids(self, wrapper):
+        """Test pairs with either side outside allowed_ids are excluded."""
+        base = np.random.randn(3, 768).astype(np.float32)
+        noise = lambda: 0.01 * np.random.randn(768).astype(np.float32)
+        # Near-duplicate pairs: (0, 1) inside, (2, 3) straddling, (4, 5) outside
+        vectors = np.stack([
+            base[0], base[0] + noise(),
+            base[1], base[1] + noise(),
+            base[2], base[2] + noise(),
+        ])
+        wrapper.add_vectors(vectors)
+
+        everything = wrapper.find_similar_pairs(similarity_threshold=0.95, k=5)
+        assert sorted((a, b) for a, b, _ in everything) == [(0, 1), (2, 3), (4, 5)]
+
+        restricted = wrapper.find_similar_pairs(
+            similarity_threshold=0.95, k=5, allowed_ids=[0, 1, 2]
+        )
+        assert [(a, b) for a, b, _ in restricted] == [(0, 1)]
+
+    def test_hnsw_index(self):
+        """Test approximate search with an HNSW index."""
+        from reter_code.services.faiss_wrapper import FAISSWrapper
+        wrapper = FAISSWrapper(dimension=768, index_type="hnsw", metric="ip")
+        vectors = np.random.randn(20, 768).astype(np.float32)
+        wrapper.add_vectors(vectors)
+
+        distances, ids = wrapper.search(vectors[3:4], top_k=5)
+        assert ids[0][0] == 3
+        assert wrapper.get_info()["index_type"] == "hnsw"
+
+    def test_sq8_index(self):
+        """Test 8-bit scalar-quantized index trains on first add and finds pairs."""
+        from reter_code.services.faiss_wrapper import FAISSWrapper
+        wrapper = FAISSWrapper(dimension=768, index_type="sq8", metric="ip")
+        vectors = np.random.randn(50, 768).astype(np.float32)
+        vectors[40] = vectors[4] + 0.01 * np.random.randn(768).astype(np.float32)
+        wrapper.add_vectors(vectors[:30])
+        wrapper.add_vectors(vectors[30:])
+
+        assert wrapper.total_vectors == 50
+        pairs = wrapper.find_similar_pairs(similarity_threshold=0.95, k=5)
+        assert [(a, b) for a, b, _ in pairs] == [(4, 40)]
+
+    def test_sq8_small_first_batch(self, tmp_path):
+        """Test SQ8 ranges do not depend on the first batch added."""
+        from reter_code.services.faiss_wrapper import FAISSWrapper
+        wrapper = FAISSWrapper(dimension=768, index_type="sq8", metric="ip")
+        vectors = np.random.randn(50, 768).astype(np.float32)
+        vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+        wrapper.add_vectors(vectors[:3])
+        wrapper.add_vectors(vectors[3:])
+
+        stored, ids = wrapper.get_all_vectors_with_ids()
+        assert np.abs(stored - vectors[ids]).max() < 0.01
+
+        path = str(tmp_path / "index.faiss")
+        wrapper.save(path)
+        loaded = FAISSWrapper(dimension=768)
+        loaded.load(path)
+        assert loaded.get_info()["index_type"] == "sq8"
+
+    def test_sq8_requires_inner_product(self):
+        """Test SQ8 is rejected for L2 vectors, whose range is unknown."""
+        from reter_code.services.faiss_wrapper import FAISSWrapper
+        with pytest.raises(ValueError):
+            FAISSWrapper(dimension=768, index_type="sq8", metric="l2")
+
+    @pytest.mark.skipif(FAISS_AVAILABLE and faiss.get_num_gpus() > 0,
+                        reason="tests the CPU fallback")
+    def test_use_gpu_falls_back_to_cpu(self):
+        """Test GPU search falls back to CPU when no GPU is present."""
+        from reter_code.services.faiss_wrapper import FAISSWrapper
+        wrapper = FAISSWrapper(dimension=768, use_gpu=True, gpu_min_vectors=5)
+        vectors = np.random.randn(10, 768).astype(np.float32)
+        vectors[7] = vectors[3]
+        wrapper.add_vectors(vectors)
+
+        pairs = wrapper.find_similar_pairs(similarity_threshold=0.99, k=3)
+        assert [(a, b) for a, b, _ in pairs] == [(3, 7)]
+
     def test_save_and_load(self, wrapper):
         """Test saving and loading index."""
         vectors = np.random.randn(10, 768).astype(np.float32)
@@ -121,6 +282,59 @@ class TestFAISSWrapper:
         finally:
             os.unlink(path)
 
+    def test_pair_searches_persist_with_index(self, tmp_path):
+        """Test saved pair searches are reused after loading the same index."""
+        from reter_code.services.faiss_wrapper import FAISSWrapper
+        wrapper = FAISSWrapper(dimension=768, persist_analysis=True)
+        vectors = np.random.randn(20, 768).astype(np.float32)
+        vectors[7] = vectors[2] + 0.01 * np.random.randn(768).astype(np.float32)
+        wrapper.add_vectors(vectors)
+        path = str(tmp_path / "index.faiss")
+        wrapper.save(path)
+        pairs = wrapper.find_similar_pairs(similarity_threshold=0.95, k=5)
+        # Written on close, not after every new pair search
+        assert not Path(path + ".pairs.npz").exists()
+        wrapper.close()
+        assert Path(path + ".pairs.npz").exists()
+
+        loaded = FAISSWrapper(dimension=768, persist_analysis=True)
+        loaded.load(path)
+        calls = []
+        loaded._bulk_search = lambda *args: calls.append(args)
+        assert loaded.find_similar_pairs(similarity_threshold=0.95, k=5) == pairs
+        assert not calls
+
+        loaded.add_vectors(np.random.randn(1, 768).astype(np.float32))
+        loaded.save(path)
+        assert not Path(path + ".pairs.npz").exists()
+
+    def test_stale_pair_searches_not_reused(self, tmp_path):
+        """Test a sidecar saved for another id set of the same size is ignored."""
+        from reter_code.services.faiss_wrapper import FAISSWrapper
+        wrapper = FAISSWrapper(dimension=768, persist_analysis=True)
+        vectors = np.random.randn(20, 768).astype(np.float32)
+        vectors[7] = vectors[2] + 0.01 * np.random.randn(768).astype(np.float32)
+        wrapper.add_vectors(vectors)
+        path = str(tmp_path / "index.faiss")
+        wrapper.save(path)
+        assert wrapper.find_similar_pairs(similarity_threshold=0.95, k=5)
+        wrapper.close()
+        sidecar = tmp_path / "index.faiss.pairs.npz"
+        stale = sidecar.read_bytes()
+
+        wrapper._persist_analysis = False
+        wrapper.remove_vectors(np.array([7], dtype=np.int64))
+        wrapper.add_vectors(np.random.randn(1, 768).astype(np.float32))
+        wrapper.save(path)
+        assert not sidecar.exists()
+
+        # Same ntotal, different ids: an old sidecar must not be trusted
+        sidecar.write_bytes(stale)
+        loaded = FAISSWrapper(dimension=768, persist_analysis=True)
+        loaded.load(path)
+        assert not loaded._analysis_cache
+        assert loaded.find_similar_pairs(similarity_threshold=0.95, k=5) == []
+
     def test_clear(self, wrapper):
         """Test clearing the index."""
         vectors = np.random.randn(10, 768).astype(np.float32)
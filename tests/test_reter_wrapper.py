@@ -204,6 +204,183 @@ class TestReql:
         # Should have result methods
         assert hasattr(result, 'num_rows') or hasattr(result, 'to_pylist')
 
+    def test_reql_shares_layout_equivalent_queries(self, wrapper):
+        """Test that queries differing only in indentation hit the cache."""
+        wrapper.reasoner.reql = MagicMock(wraps=wrapper.reasoner.reql)
+
+        first = wrapper.reql("SELECT ?x\n  WHERE { ?x type class }\n")
+        second = wrapper.reql("    SELECT ?x\n\n    WHERE { ?x type class }")
+
+        assert first is second
+        assert wrapper.reasoner.reql.call_count == 1
+
+    def test_reql_binds_placeholders(self, wrapper):
+        """Test that $name placeholders are bound per call and cached per value."""
+        wrapper.reasoner.reql = MagicMock(wraps=wrapper.reasoner.reql)
+        query = """
+            SELECT ?m WHERE { ?m has-line-count ?n . ?m has-name $name }
+            HAVING (?n <= $max_lines)
+        """
+
+        wrapper.reql(query, bindings={"max_lines": 3, "name": 'say "hi"'})
+        wrapper.reql(query, bindings={"max_lines": 3, "name": 'say "hi"'})
+        wrapper.reql(query, bindings={"max_lines": 5, "name": 'say "hi"'})
+
+        sent = [c.args[0] for c in wrapper.reasoner.reql.call_args_list]
+        assert len(sent) == 2
+        assert '?m has-name "say \\"hi\\""' in sent[0]
+        assert "(?n <= 3)" in sent[0]
+        assert "(?n <= 5)" in sent[1]
+
+    def test_reql_binding_escapes_control_characters(self, wrapper):
+        """Test that bound strings cannot break out of their literal."""
+        wrapper.reasoner.reql = MagicMock(wraps=wrapper.reasoner.reql)
+        query = "SELECT ?m WHERE { ?m has-name $name }"
+
+        wrapper.reql(query, bindings={"name": 'a\nb\r\t"c\\'})
+
+        sent = wrapper.reasoner.reql.call_args.args[0]
+        assert '?m has-name "a\\nb\\r\\t\\"c\\\\" }' in sent
+        assert "\n" not in sent
+
+    @pytest.mark.parametrize("value", [float("nan"), float("inf"), -float("inf"), "a\x00b"])
+    def test_reql_binding_rejects_unrepresentable_values(self, wrapper, value):
+        """Test that NaN, infinities and unescapable characters are refused."""
+        wrapper.reasoner.reql = MagicMock(wraps=wrapper.reasoner.reql)
+
+        with pytest.raises(ValueError):
+            wrapper.reql("SELECT ?m WHERE { ?m has-line-count $n }", bindings={"n": value})
+        wrapper.reasoner.reql.assert_not_called()
+
+    def test_reql_binding_skips_literals_and_ids(self, wrapper):
+        """Test that $ inside quoted literals and IDs is not a placeholder."""
+        wrapper.reasoner.reql = MagicMock(wraps=wrapper.reasoner.reql)
+        query = (
+            'SELECT ?m WHERE { ?m has-name $name . ?m has-doc "costs $name" . '
+            '?m is-defined-in py:Outer$name }'
+        )
+
+        wrapper.reql(query, bindings={"name": "run"})
+
+        sent = wrapper.reasoner.reql.call_args.args[0]
+        assert '?m has-name "run"' in sent
+        assert '"costs $name"' in sent
+        assert "py:Outer$name" in sent
+
+    def test_reql_concurrent_identical_queries_run_once(self, wrapper):
+        """Test that concurrent callers await a query already in flight."""
+        import threading
+        from concurrent.futures import ThreadPoolExecutor
+
+        started = threading.Event()
+        release = threading.Event()
+        original = wrapper.reasoner.reql
+
+        def slow_reql(query, timeout_ms=None):
+            started.set()
+            release.wait(5)
+            return original(query, timeout_ms)
+
+        wrapper.reasoner.reql = MagicMock(side_effect=slow_reql)
+        query = "SELECT ?x WHERE { ?x type method }"
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            first = pool.submit(wrapper.reql, query)
+            started.wait(5)
+            others = [pool.submit(wrapper.reql, query) for _ in range(3)]
+            time.sleep(0.05)
+            release.set()
+            results = [first.result()] + [f.result() for f in others]
+
+        assert wrapper.reasoner.reql.call_count == 1
+        assert all(r is results[0] for r in results)
+
+    def test_reql_waiter_without_timeout_awaits_owner(self, wrapper):
+        """Test that timeout_ms=0 waits for the in-flight query, not re-runs it."""
+        import threading
+        from concurrent.futures import ThreadPoolExecutor
+
+        started = threading.Event()
+        release = threading.Event()
+        original = wrapper.reasoner.reql
+
+        def slow_reql(query, timeout_ms=None):
+            started.set()
+            release.wait(5)
+            return original(query, timeout_ms)
+
+        wrapper.reasoner.reql = MagicMock(side_effect=slow_reql)
+        query = "SELECT ?x WHERE { ?x type method }"
+
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            first = pool.submit(wrapper.reql, query, 0)
+            started.wait(5)
+            second = pool.submit(wrapper.reql, query, 0)
+            time.sleep(0.05)
+            release.set()
+            assert second.result() is first.result()
+
+        assert wrapper.reasoner.reql.call_count == 1
+
+    def test_reql_waiter_reruns_failed_query(self, wrapper):
+        """Test that a caller awaiting a failed in-flight query runs it itself."""
+        import threading
+        from concurrent.futures import ThreadPoolExecutor
+
+        started = threading.Event()
+        release = threading.Event()
+        original = wrapper.reasoner.reql
+
+        def failing_once(query, timeout_ms=None):
+            if not started.is_set():
+                started.set()
+                release.wait(5)
+                raise RuntimeError("query failed")
+            return original(query, timeout_ms)
+
+        wrapper.reasoner.reql = MagicMock(side_effect=failing_once)
+        query = "SELECT ?x WHERE { ?x type method }"
+
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            first = pool.submit(wrapper.reql, query)
+            started.wait(5)
+            second = pool.submit(wrapper.reql, query)
+            time.sleep(0.05)
+            release.set()
+            with pytest.raises(RuntimeError):
+                first.result()
+            second.result()
+
+        assert wrapper.reasoner.reql.call_count == 2
+
+    def test_reql_serializes_reasoner_calls(self, wrapper):
+        """Test that different queries from several threads never overlap."""
+        import threading
+        from concurrent.futures import ThreadPoolExecutor
+
+        lock = threading.Lock()
+        active = []
+        peak = []
+        original = wrapper.reasoner.reql
+
+        def tracking_reql(query, timeout_ms=None):
+            with lock:
+                active.append(query)
+                peak.append(len(active))
+            time.sleep(0.01)
+            with lock:
+                active.remove(query)
+            return original(query, timeout_ms)
+
+        wrapper.reasoner.reql = tracking_reql
+        queries = [f"SELECT ?x WHERE {{ ?x has-line-count {n} }}" for n in range(8)]
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(wrapper.reql, queries))
+
+        assert len(peak) == 8
+        assert max(peak) == 1
+
 
 class TestLoadPythonCode:
     """Test loading Python code into RETER."""
@@ -0,0 +1,287 @@
+"""
+Tests for the CADSL tools bridge
+
+Runs detectors through the batch helpers against a ReterWrapper whose
+native module is mocked.
+"""
+
+import threading
+import time
+from unittest.mock import patch
+
+import pyarrow as pa
+import pytest
+
+
+class MockReter:
+    """Mock for the native Reter class that records overlapping queries."""
+
+    def __init__(self, variant=None):
+        self.variant = variant
+        self.queries = []
+        self.peak = 0
+        self._active = 0
+        self._lock = threading.Lock()
+
+    def reql(self, query, timeout_ms=None):
+        """Return an empty table after a short delay."""
+        with self._lock:
+            self._active += 1
+            self.peak = max(self.peak, self._active)
+            self.queries.append(query)
+        time.sleep(0.01)
+        with self._lock:
+            self._active -= 1
+        return pa.table({})
+
+
+@pytest.fixture
+def wrapper():
+    """Create a ReterWrapper with mocked native module."""
+    with patch('reter_code.reter_wrapper.Reter', MockReter):
+        with patch('reter_code.reter_wrapper.safe_cpp_call', lambda f, *args: f(*args)):
+            from reter_code.reter_wrapper import ReterWrapper
+            yield ReterWrapper(load_ontology=False)
+
+
+class TestRunMany:
+    """Test running several tools as one concurrent batch."""
+
+    def test_run_many_serializes_reter_calls(self, wrapper):
+        """Test that concurrent detectors never overlap in the reasoner."""
+        from reter_code.cadsl.tools_bridge import run_many
+        from reter_code.dsl.core import Context
+
+        names = ["god_class_fast", "long_methods", "long_parameter_list", "data_class"]
+        results = run_many(names, Context(reter=wrapper, params={}))
+
+        assert sorted(results) == sorted(names)
+        assert all(result["success"] for result in results.values())
+        assert len(wrapper.reasoner.queries) == len(names)
+        assert wrapper.reasoner.peak == 1
+
+    def test_run_many_layers_call_params(self, wrapper):
+        """Test that (name, params) calls override the base params."""
+        from reter_code.cadsl.tools_bridge import run_many
+        from reter_code.dsl.core import Context
+
+        run_many([("god_class_fast", {"max_methods": 7})], Context(reter=wrapper, params={}))
+
+        assert "> 7" in wrapper.reasoner.queries[0]
+
+    def test_run_many_unknown_tool(self, wrapper):
+        """Test that an unknown tool fails without failing the batch."""
+        from reter_code.cadsl.tools_bridge import run_many
+        from reter_code.dsl.core import Context
+
+        results = run_many(["long_methods", "no_such_tool"], Context(reter=wrapper, params={}))
+
+        assert results["long_methods"]["success"]
+        assert not results["no_such_tool"]["success"]
+
+
+GOOD_DETECTOR = '''
+detector good_detector(category="test", severity="low") {
+    """A detector that loads."""
+    reql { SELECT ?c ?name WHERE { ?c type class . ?c has-name ?name } }
+    | select { name }
+    | emit { findings }
+}
+'''
+
+QUERY_TOOL = '''
+query list_names() {
+    """Not a detector."""
+    reql { SELECT ?c ?name WHERE { ?c type class . ?c has-name ?name } }
+    | select { name }
+    | emit { names }
+}
+'''
+
+BAD_REGEX_DETECTOR = '''
+detector bad_regex(category="test", severity="low") {
+    """Parses, but its filter regex does not compile."""
+    reql { SELECT ?c ?name WHERE { ?c type class . ?c has-name ?name } }
+    | filter { name matches "(" }
+    | emit { findings }
+}
+'''
+
+
+@pytest.fixture
+def tool_module(tmp_path):
+    """A tool module with one good detector, a query and two broken files."""
+    from reter_code.cadsl.tools_bridge import CADSLToolModule
+
+    (tmp_path / "good_detector.cadsl").write_text(GOOD_DETECTOR)
+    (tmp_path / "list_names.cadsl").write_text(QUERY_TOOL)
+    (tmp_path / "bad_regex.cadsl").write_text(BAD_REGEX_DETECTOR)
+    (tmp_path / "bad_syntax.cadsl").write_text("detector bad_syntax( {")
+    return CADSLToolModule("test", tmp_path)
+
+
+class TestRunDetectors:
+    """Test listing and running a module's detectors."""
+
+    def test_list_detectors_skips_broken_files(self, tool_module):
+        """Test that files that fail to parse or build are left out."""
+        assert tool_module.list_detectors() == ["good_detector"]
+
+    def test_run_detectors_uses_module_tools(self, tool_module, wrapper):
+        """Test that detectors are resolved in the module they were listed from."""
+        from reter_code.cadsl.tools_bridge import run_detectors
+        from reter_code.dsl.core import Context
+
+        results = run_detectors(tool_module, Context(reter=wrapper, params={}))
+
+        assert list(results) == ["good_detector"]
+        assert results["good_detector"]["success"]
+        assert len(wrapper.reasoner.queries) == 1
+
+
+class TestResultCache:
+    """Test memoizing tool results per params and network version."""
+
+    def test_repeat_call_hits_result_cache(self, tool_module, wrapper):
+        """Test that a repeat call skips the pipeline and returns a fresh copy."""
+        from reter_code.dsl.core import Context
+
+        ctx = Context(reter=wrapper, params={})
+        first = tool_module.good_detector(ctx)
+        first["findings"].append({"name": "mutated"})
+        # Bypass the REQL cache so only the result cache can answer
+        wrapper._query_cache.clear()
+        second = tool_module.good_detector(ctx)
+
+        assert len(wrapper.reasoner.queries) == 1
+        assert second["findings"] == []
+
+    def test_version_bump_invalidates(self, tool_module, wrapper):
+        """Test that marking the network dirty re-runs the tool."""
+        from reter_code.dsl.core import Context
+
+        ctx = Context(reter=wrapper, params={})
+        tool_module.good_detector(ctx)
+        wrapper._dirty = True
+        tool_module.good_detector(ctx)
+
+        assert len(wrapper.reasoner.queries) == 2
+
+    def test_params_are_part_of_the_key(self, tool_module, wrapper):
+        """Test that different params do not share a cached result."""
+        from reter_code.dsl.core import Context
+
+        tool_module.good_detector(Context(reter=wrapper, params={"limit": 1}))
+        wrapper._query_cache.clear()
+        tool_module.good_detector(Context(reter=wrapper, params={"limit": 2}))
+
+        assert len(wrapper.reasoner.queries) == 2
+
+
+class TestSpecCache:
+    """Test the process-wide cache of parsed CADSL files."""
+
+    def test_unchanged_file_is_parsed_once(self, tmp_path):
+        """Test that repeat loads reuse the specs until the file changes."""
+        from reter_code.cadsl.tools_bridge import load_cadsl_specs
+
+        path = tmp_path / "good_detector.cadsl"
+        path.write_text(GOOD_DETECTOR)
+        specs, factories = load_cadsl_specs(path)
+
+        assert load_cadsl_specs(path) == (specs, factories)
+
+        path.write_text(GOOD_DETECTOR + "\n")
+        reloaded, _ = load_cadsl_specs(path)
+
+        assert reloaded is not specs
+        assert reloaded[0].name == "good_detector"
+
+    def test_modules_share_specs(self, tmp_path, wrapper):
+        """Test that two tool modules over one directory share a parse."""
+        from reter_code.cadsl import tools_bridge
+        from reter_code.dsl.core import Context
+
+        (tmp_path / "good_detector.cadsl").write_text(GOOD_DETECTOR)
+        first = tools_bridge.CADSLToolModule("first", tmp_path)
+        second = tools_bridge.CADSLToolModule("second", tmp_path)
+        ctx = Context(reter=wrapper, params={})
+
+        with patch.object(tools_bridge, "parse_cadsl_file",
+                          wraps=tools_bridge.parse_cadsl_file) as parse:
+            assert first.good_detector(ctx)["success"]
+            assert second.good_detector(ctx)["success"]
+
+        assert parse.call_count == 1
+
+    def test_clear_spec_cache_by_directory(self, tmp_path):
+        """Test that clearing one directory keeps other files cached."""
+        from reter_code.cadsl.tools_bridge import (
+            _spec_cache, clear_spec_cache, load_cadsl_specs,
+        )
+
+        (tmp_path / "a").mkdir()
+        (tmp_path / "b").mkdir()
+        kept = tmp_path / "a" / "good_detector.cadsl"
+        dropped = tmp_path / "b" / "good_detector.cadsl"
+        for path in (kept, dropped):
+            path.write_text(GOOD_DETECTOR)
+            load_cadsl_specs(path)
+
+        clear_spec_cache(tmp_path / "b")
+
+        assert kept in _spec_cache
+        assert dropped not in _spec_cache
+
+
+class TestPackedRows:
+    """Test storing cached row lists as tuples."""
+
+    def test_flat_rows_round_trip(self):
+        """Test that flat rows are packed and unpacked into fresh dicts."""
+        from reter_code.cadsl.tools_bridge import (
+            _PackedRows, _pack_result, _unpack_result,
+        )
+
+        rows = [{"name": "a", "line": 1, "ok": True, "score": None},
+                {"name": "b", "line": 2, "ok": False, "score": 0.5}]
+        result = {"success": True, "findings": rows, "count": 2}
+        packed = _pack_result(result)
+
+        assert isinstance(packed["findings"], _PackedRows)
+        assert packed["findings"].rows == [("a", 1, True, None), ("b", 2, False, 0.5)]
+
+        unpacked = _unpack_result(packed)
+        assert unpacked == result
+        unpacked["findings"][0]["name"] = "mutated"
+        assert _unpack_result(packed)["findings"][0]["name"] == "a"
+
+    @pytest.mark.parametrize("rows", [
+        [{"name": "a", "methods": ["m"]}],
+        [{"name": "a", "line": 1}, {"line": 2, "name": "b"}],
+        [{"name": "a"}, {"name": "b", "line": 2}],
+        [],
+    ])
+    def test_other_values_are_deep_copied(self, rows):
+        """Test that nested, reordered, ragged or empty rows are not packed."""
+        from reter_code.cadsl.tools_bridge import _pack_result, _unpack_result
+
+        packed = _pack_result({"findings": rows})
+
+        assert packed["findings"] == rows
+        assert packed["findings"] is not rows
+        assert _unpack_result(packed) == {"findings": rows}
+
+
+class TestSharedQueries:
+    """Test detectors that rely on sharing one cached REQL result."""
+
+    def test_auth_and_api_surface_reviews_share_query_text(self):
+        """Test auth_review and api_surface_review issue the same query."""
+        from reter_code.cadsl.tools_bridge import load_cadsl_specs, rag
+
+        auth, _ = load_cadsl_specs(rag.tools_path / "auth_review.cadsl")
+        api, _ = load_cadsl_specs(rag.tools_path / "api_surface_review.cadsl")
+
+        assert auth[0].source_type == api[0].source_type == "reql"
+        assert auth[0].source_content == api[0].source_content